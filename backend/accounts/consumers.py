@@ -67,6 +67,21 @@ class NotificationConsumer(AsyncWebsocketConsumer):
             'notification': event['notification']
         }))
     
+    async def notification_batch(self, event):
+        """Handle a batch of notifications from group, sent to the client one by one"""
+        for notification in event['notifications']:
+            await self.send(text_data=json.dumps({
+                'type': 'notification',
+                'notification': notification
+            }))
+    
+    async def pipeline_progress(self, event):
+        """Handle resume upload pipeline stage changes from group"""
+        await self.send(text_data=json.dumps({
+            'type': 'pipeline_progress',
+            'pipeline': event['pipeline']
+        }))
+    
     @database_sync_to_async
     def get_user_from_token(self, token_key):
         """Get user from auth token"""
@@ -0,0 +1,17 @@
+# Generated by Django 4.2.7 on 2026-10-19 06:51
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='notification',
+            index=models.Index(fields=['user', 'created_at', 'id'], name='accounts_no_user_id_1dd6a6_idx'),
+        ),
+    ]
@@ -36,10 +36,21 @@ class Notification(models.Model):
 
     class Meta:
         ordering = ['-created_at']
+        # Keyset pagination of a user's notifications
+        indexes = [models.Index(fields=['user', 'created_at', 'id'])]
 
     def __str__(self):
         return f"{self.title} - {self.user.username}"
 
+def notification_payload(instance: 'Notification') -> dict:
+    return {
+        'id': instance.id,
+        'title': instance.title,
+        'message': instance.message,
+        'is_read': instance.is_read,
+        'created_at': instance.created_at.isoformat(),
+    }
+
 @receiver(post_save, sender=Notification)
 def push_notification_ws(sender, instance: 'Notification', created, **kwargs):
     """Push new notifications to the user's WebSocket group."""
@@ -52,15 +63,27 @@ def push_notification_ws(sender, instance: 'Notification', created, **kwargs):
         group = f"notifications_{instance.user_id}"
         payload = {
             'type': 'notification_message',
-            'notification': {
-                'id': instance.id,
-                'title': instance.title,
-                'message': instance.message,
-                'is_read': instance.is_read,
-                'created_at': instance.created_at.isoformat(),
-            }
+            'notification': notification_payload(instance)
         }
         async_to_sync(channel_layer.group_send)(group, payload)
     except Exception:
         # Fail silently; notifications are still available via REST polling
         pass
+
+def push_notifications_ws(user_id: int, notifications: list['Notification']):
+    """Push notifications written with bulk_create (no post_save) to the user's
+    WebSocket group as one channel-layer message.
+    """
+    if not notifications:
+        return
+    try:
+        channel_layer = get_channel_layer()
+        if not channel_layer:
+            return
+        async_to_sync(channel_layer.group_send)(f"notifications_{user_id}", {
+            'type': 'notification_batch',
+            'notifications': [notification_payload(n) for n in notifications],
+        })
+    except Exception:
+        # Fail silently; notifications are still available via REST polling
+        pass
@@ -4,6 +4,7 @@ from rest_framework.response import Response
 from rest_framework.authtoken.models import Token
 from django.contrib.auth.models import User
 from django.contrib.auth import authenticate
+from jobportal.pagination import KeysetPagination
 from .models import UserProfile, Notification
 from .serializers import UserSerializer, UserProfileSerializer, NotificationSerializer, RegisterSerializer
 
@@ -90,6 +91,7 @@ class NotificationViewSet(viewsets.ModelViewSet):
     queryset = Notification.objects.all()
     serializer_class = NotificationSerializer
     permission_classes = [permissions.IsAuthenticated]
+    pagination_class = KeysetPagination
     
     def get_queryset(self):
         return Notification.objects.filter(user=self.request.user)
@@ -100,8 +102,9 @@ class NotificationViewSet(viewsets.ModelViewSet):
     @action(detail=False, methods=['get'])
     def unread(self, request):
         unread = Notification.objects.filter(user=request.user, is_read=False)
-        serializer = self.get_serializer(unread, many=True)
-        return Response(serializer.data)
+        page = self.paginate_queryset(unread)
+        serializer = self.get_serializer(page, many=True)
+        return self.get_paginated_response(serializer.data)
     
     @action(detail=False, methods=['post'])
     def mark_all_read(self, request):
@@ -0,0 +1,147 @@
+"""Keyset pagination for list endpoints.
+
+Pages are read with WHERE (created_at, id) < (last row of the previous page) ORDER BY
+created_at DESC, id DESC LIMIT n, so any page costs what the first one does however
+large the table grows, and rows inserted while a client pages through do not shift or
+repeat items. Responses are {next, previous, results}; next/previous are full URLs
+carrying an opaque `cursor`. Page size is settings.API_PAGE_SIZE, overridable per request with `page_size` up to MAX_PAGE_SIZE.
+
+Relevance-ranked results (full-text search) cannot be keyed by created_at; they use
+SearchPagination (limit/offset over the ranked matches) with the same response shape
+plus a count.
+"""
+import base64
+import binascii
+import json
+from collections import OrderedDict
+from datetime import datetime
+
+from django.conf import settings
+from django.db.models import Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination, LimitOffsetPagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+
+MAX_PAGE_SIZE = 200
+
+
+def _page_size_setting() -> int:
+    return int(getattr(settings, 'API_PAGE_SIZE', 50) or 50)
+
+
+class KeysetPagination(BasePagination):
+    """Newest first by (`field`, `tie`), both descending; `tie` must be unique."""
+    field = 'created_at'
+    tie = 'id'
+    cursor_query_param = 'cursor'
+    page_size_query_param = 'page_size'
+    invalid_cursor_message = 'Invalid cursor'
+
+    def get_page_size(self, request) -> int:
+        try:
+            size = int(request.query_params[self.page_size_query_param])
+        except (KeyError, ValueError):
+            return _page_size_setting()
+        return min(size, MAX_PAGE_SIZE) if size > 0 else _page_size_setting()
+
+    def encode_cursor(self, direction: str, row) -> str:
+        value = getattr(row, self.field)
+        payload = json.dumps([direction, value.isoformat(), getattr(row, self.tie)])
+        return base64.urlsafe_b64encode(payload.encode('utf-8')).decode('ascii')
+
+    def decode_cursor(self, request):
+        """(backwards, value, tie) from the request's cursor, or None on the first page."""
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None
+        try:
+            direction, value, tie = json.loads(base64.urlsafe_b64decode(encoded.encode('ascii')))
+            if direction not in ('n', 'p'):
+                raise ValueError(direction)
+            return direction == 'p', datetime.fromisoformat(value), int(tie)
+        except (binascii.Error, TypeError, ValueError, UnicodeError):
+            raise NotFound(self.invalid_cursor_message)
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        page_size = self.get_page_size(request)
+        cursor = self.decode_cursor(request)
+        backwards = cursor is not None and cursor[0]
+        if cursor is not None:
+            _, value, tie = cursor
+            # (field <= v) AND NOT (field = v AND tie >= t) rather than the equivalent OR: the
+            # range on `field` stays an index bound (SQLite scans the whole index for the OR)
+            bound, past = ('gte', 'lte') if backwards else ('lte', 'gte')
+            queryset = queryset.filter(**{f'{self.field}__{bound}': value}).exclude(
+                Q(**{self.field: value, f'{self.tie}__{past}': tie}))
+        order = (self.field, self.tie) if backwards else (f'-{self.field}', f'-{self.tie}')
+        rows = list(queryset.order_by(*order)[:page_size + 1])
+        more = len(rows) > page_size
+        rows = rows[:page_size]
+        if backwards:
+            rows.reverse()
+        # Coming back from a later page means there is one after this; leaving the first means one before
+        self.has_next = cursor is not None if backwards else more
+        self.has_previous = more if backwards else cursor is not None
+        self.page = rows
+        return rows
+
+    def get_next_link(self):
+        if not self.has_next or not self.page:
+            return None
+        url = self.request.build_absolute_uri()
+        return replace_query_param(url, self.cursor_query_param, self.encode_cursor('n', self.page[-1]))
+
+    def get_previous_link(self):
+        if not self.has_previous or not self.page:
+            return None
+        url = self.request.build_absolute_uri()
+        return replace_query_param(url, self.cursor_query_param, self.encode_cursor('p', self.page[0]))
+
+    def get_paginated_response(self, data):
+        return Response(OrderedDict([
+            ('next', self.get_next_link()),
+            ('previous', self.get_previous_link()),
+            ('results', data),
+        ]))
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            'type': 'object',
+            'properties': {
+                'next': {'type': 'string', 'nullable': True, 'format': 'uri'},
+                'previous': {'type': 'string', 'nullable': True, 'format': 'uri'},
+                'results': schema,
+            },
+        }
+
+
+class AppliedKeysetPagination(KeysetPagination):
+    """Job applications, newest first by applied_date."""
+    field = 'applied_date'
+
+
+class SearchPagination(LimitOffsetPagination):
+    """Ranked search results: limit/offset over the matches, best first."""
+    max_limit = MAX_PAGE_SIZE
+
+    @property
+    def default_limit(self):
+        return _page_size_setting()
+
+    def get_paginated_response(self, data):
+        return Response(OrderedDict([
+            ('count', self.count),
+            ('next', self.get_next_link()),
+            ('previous', self.get_previous_link()),
+            ('results', data),
+        ]))
+
+
+def paginate(request, queryset, serializer_class, paginator=None, **serializer_kwargs):
+    """Paginated response of a queryset for function views (KeysetPagination by default)."""
+    paginator = paginator or KeysetPagination()
+    page = paginator.paginate_queryset(queryset, request)
+    return paginator.get_paginated_response(serializer_class(page, many=True, **serializer_kwargs).data)
+
@@ -134,8 +134,16 @@ REST_FRAMEWORK = {
     'DEFAULT_PERMISSION_CLASSES': [
         'rest_framework.permissions.IsAuthenticated',
     ],
+    # orjson when installed (same output as JSONRenderer); the browsable API stays available
+    'DEFAULT_RENDERER_CLASSES': [
+        'jobportal.renderers.ORJSONRenderer',
+        'rest_framework.renderers.BrowsableAPIRenderer',
+    ],
 }
 
+# Items per page of the keyset-paginated lists (jobportal/pagination.py); ?page_size= overrides
+API_PAGE_SIZE = int(os.getenv('API_PAGE_SIZE', '50'))
+
 # Channels settings (use Redis in containers when REDIS_URL is provided)
 REDIS_URL = os.getenv('REDIS_URL')
 if REDIS_URL:
@@ -153,3 +161,101 @@ else:
             'BACKEND': 'channels.layers.InMemoryChannelLayer',
         },
     }
+
+# Job ingestion
+# Worker processes for HTML parsing of scraped pages (0 = parse on the fetch threads)
+JOB_PARSE_PROCESSES = int(os.getenv('JOB_PARSE_PROCESSES', '0'))
+# Seconds a fetch thread waits for one page from the parse pool before skipping it
+JOB_PARSE_TIMEOUT = int(os.getenv('JOB_PARSE_TIMEOUT', '30'))
+
+# Background detail-page enrichment for listing-only portal results
+JOB_ENRICHMENT = {
+    'WORKERS': int(os.getenv('JOB_ENRICH_WORKERS', '4')),
+    'PER_HOST': int(os.getenv('JOB_ENRICH_PER_HOST', '2')),
+}
+
+# Worker threads running resume upload pipelines (parse, portal search, scoring, auto-apply)
+RESUME_PIPELINE_WORKERS = int(os.getenv('RESUME_PIPELINE_WORKERS', '2'))
+
+# Resume file text extraction: worker processes (0 = parse on the pipeline thread), seconds
+# to wait for one file, and caps on the pages/characters read from it
+RESUME_PARSING = {
+    'PROCESSES': int(os.getenv('RESUME_PARSE_PROCESSES', '2')),
+    'TIMEOUT': int(os.getenv('RESUME_PARSE_TIMEOUT', '60')),
+    'MAX_PAGES': int(os.getenv('RESUME_PARSE_MAX_PAGES', '30')),
+    'MAX_CHARS': int(os.getenv('RESUME_PARSE_MAX_CHARS', '200000')),
+}
+
+# Default minimum match score (0-100) for the match endpoint, auto-apply after a resume upload
+# and reverse matching. Scores are cosine similarities weighted with the job index's corpus IDF
+# (jobs/vector_index.py). Terms a resume has that no job uses (names, employers, schools)
+# carry the highest IDF, so typical resume/job pairs score about 0.7x what the former
+# per-pair TF-IDF gave; 40 here admits roughly what 60 did on that scale.
+JOB_MATCH_THRESHOLD = float(os.getenv('JOB_MATCH_THRESHOLD', '40'))
+
+# Reverse matching: after an ingest the new jobs are scored against every active resume and
+# each user's TOP_N new matches scoring >= THRESHOLD (default JOB_MATCH_THRESHOLD) are stored
+# (jobs.JobMatch) and notified. Resumes are multiplied CHUNK_SIZE at a time (memory ~
+# CHUNK_SIZE x new jobs scores) on THREADS threads; terms in at least COMMON_DF of the new jobs
+# are bounded (Cauchy-Schwarz) instead of multiplied, which keeps results exact. The worker
+# waits DELAY seconds so ingests arriving together are matched in one pass.
+JOB_REVERSE_MATCHING = {
+    'ENABLED': os.getenv('JOB_REVERSE_MATCH', 'True').lower() == 'true',
+    'THRESHOLD': float(os.getenv('JOB_REVERSE_MATCH_THRESHOLD', JOB_MATCH_THRESHOLD)),
+    'TOP_N': int(os.getenv('JOB_REVERSE_MATCH_TOP_N', '5')),
+    'CHUNK_SIZE': int(os.getenv('JOB_REVERSE_MATCH_CHUNK_SIZE', '2000')),
+    'THREADS': int(os.getenv('JOB_REVERSE_MATCH_THREADS', '2')),
+    'COMMON_DF': float(os.getenv('JOB_REVERSE_MATCH_COMMON_DF', '0.02')),
+    'DELAY': float(os.getenv('JOB_REVERSE_MATCH_DELAY', '5')),
+}
+
+# Saved live searches percolated against newly ingested jobs (jobs/saved_searches.py), on the
+# reverse-matching queue. TOP_N jobs are listed per search in each notification.
+JOB_SAVED_SEARCHES = {
+    'ENABLED': os.getenv('JOB_SAVED_SEARCHES', 'True').lower() == 'true',
+    'MAX_PER_USER': int(os.getenv('JOB_SAVED_SEARCHES_MAX_PER_USER', '20')),
+    'TOP_N': int(os.getenv('JOB_SAVED_SEARCHES_TOP_N', '5')),
+}
+
+# Skill/role vocabulary used for keyword extraction and the role filter (empty = bundled jobs/skill_taxonomy.json)
+SKILL_TAXONOMY_PATH = os.getenv('SKILL_TAXONOMY_PATH', '')
+
+# Extra NLTK data directory (punkt, stopwords) searched before NLTK's defaults. Nothing is
+# downloaded at runtime; fill it with `python manage.py download_nltk_data`.
+NLTK_DATA_DIR = os.getenv('NLTK_DATA_DIR', str(BASE_DIR / 'var' / 'nltk_data'))
+
+# Persistent TF-IDF index used for resume matching; workers re-check the corpus version every
+# RELOAD_SECONDS and, after the first load, build the newer snapshot on a background thread
+# while requests keep the current one. CANDIDATES jobs are retrieved by BM25 over the resume's
+# QUERY_TERMS most salient terms before full scoring (0 = score every job). SNAPSHOT_DIR holds
+# the exported memory-mapped snapshot shared by all worker processes (empty = each process
+# builds its own); the first worker to see a newer corpus version re-exports it in the
+# background and swaps it in through the directory's CURRENT pointer.
+JOB_VECTOR_INDEX = {
+    'RELOAD_SECONDS': int(os.getenv('JOB_VECTOR_INDEX_RELOAD_SECONDS', '30')),
+    'CANDIDATES': int(os.getenv('JOB_MATCH_CANDIDATES', '300')),
+    'QUERY_TERMS': int(os.getenv('JOB_MATCH_QUERY_TERMS', '32')),
+    'SNAPSHOT_DIR': os.getenv('JOB_INDEX_SNAPSHOT_DIR', str(BASE_DIR / 'var' / 'job_index')),
+    # Candidate selection before full scoring: 'bm25', 'ann' (random-projection LSH) or 'exact'.
+    # ANN recall rises with ANN_TABLES/ANN_PROBES and falls (with latency) as ANN_BITS grows.
+    # The LSH tables are kept per worker and synced incrementally with the snapshot.
+    'MODE': os.getenv('JOB_MATCH_MODE', 'bm25'),
+    'ANN_BITS': int(os.getenv('JOB_MATCH_ANN_BITS', '8')),
+    'ANN_TABLES': int(os.getenv('JOB_MATCH_ANN_TABLES', '16')),
+    'ANN_PROBES': int(os.getenv('JOB_MATCH_ANN_PROBES', '2')),
+    # Worker processes for the exact pass over mapped snapshots of at least PARALLEL_MIN_JOBS
+    # jobs (0 = score in the request thread). Each web worker process gets its own pool.
+    'SCORE_PROCESSES': int(os.getenv('JOB_MATCH_PROCESSES', '0')),
+    'PARALLEL_MIN_JOBS': int(os.getenv('JOB_MATCH_PARALLEL_MIN_JOBS', '50000')),
+    # Rankings are cached per resume (jobs.MatchResult) and merged forward when at most
+    # MATCH_CACHE_INCREMENTAL_MAX jobs changed; fully recomputed after MATCH_CACHE_MAX_AGE seconds.
+    'MATCH_CACHE': os.getenv('JOB_MATCH_CACHE', 'True').lower() == 'true',
+    'MATCH_CACHE_INCREMENTAL_MAX': int(os.getenv('JOB_MATCH_CACHE_INCREMENTAL_MAX', '2000')),
+    'MATCH_CACHE_MAX_AGE': int(os.getenv('JOB_MATCH_CACHE_MAX_AGE', '86400')),
+    # A resume's JobPreference narrows the jobs in SQL first; candidate sets of at most
+    # PREFILTER_MAX jobs are scored directly, larger ones go through MODE as usual.
+    'PREFILTER_MAX': int(os.getenv('JOB_MATCH_PREFILTER_MAX', '20000')),
+    # Seconds a match request waits for external portal/ATS catalog records before answering
+    # with what has arrived (stored jobs are never dropped)
+    'EXTERNAL_TIMEOUT': float(os.getenv('JOB_MATCH_EXTERNAL_TIMEOUT', '8')),
+}
@@ -1,5 +1,5 @@
 from django.contrib import admin
-from .models import Company, Job, JobApplication
+from .models import Company, Job, JobApplication, JobMatch, MatchResult, SavedSearch, SavedSearchMatch
 
 
 @admin.register(Company)
@@ -12,16 +12,16 @@ class CompanyAdmin(admin.ModelAdmin):
 
 @admin.register(Job)
 class JobAdmin(admin.ModelAdmin):
-    list_display = ('title', 'company', 'location', 'job_type', 'status', 'created_at')
+    list_display = ('title', 'company', 'location', 'job_type', 'status', 'enrichment_status', 'created_at')
     search_fields = ('title', 'company__name', 'location', 'description')
-    list_filter = ('status', 'job_type', 'created_at', 'company')
-    readonly_fields = ('created_at', 'updated_at')
+    list_filter = ('status', 'job_type', 'enrichment_status', 'created_at', 'company')
+    readonly_fields = ('created_at', 'updated_at', 'enriched_at')
     fieldsets = (
         ('Basic Information', {
             'fields': ('title', 'company', 'location', 'job_type', 'status')
         }),
         ('Job Details', {
-            'fields': ('description', 'requirements', 'keywords')
+            'fields': ('description', 'requirements', 'keywords', 'enrichment_status', 'enriched_at')
         }),
         ('Salary Information', {
             'fields': ('salary_min', 'salary_max')
@@ -54,3 +54,35 @@ class JobApplicationAdmin(admin.ModelAdmin):
             'classes': ('collapse',)
         }),
     )
+
+
+@admin.register(MatchResult)
+class MatchResultAdmin(admin.ModelAdmin):
+    list_display = ('resume', 'scope', 'mode', 'threshold', 'depth', 'corpus_version', 'updated_at')
+    search_fields = ('resume__title', 'resume__user__username', 'scope')
+    list_filter = ('mode', 'updated_at')
+    readonly_fields = ('synced_at', 'updated_at')
+
+
+@admin.register(JobMatch)
+class JobMatchAdmin(admin.ModelAdmin):
+    list_display = ('user', 'job', 'resume', 'match_score', 'created_at')
+    search_fields = ('user__username', 'job__title', 'job__company__name')
+    list_filter = ('created_at',)
+    readonly_fields = ('created_at',)
+
+
+@admin.register(SavedSearch)
+class SavedSearchAdmin(admin.ModelAdmin):
+    list_display = ('user', 'query', 'location', 'is_active', 'created_at')
+    search_fields = ('user__username', 'query', 'location')
+    list_filter = ('is_active', 'created_at')
+    readonly_fields = ('terms', 'location_key', 'created_at', 'updated_at')
+
+
+@admin.register(SavedSearchMatch)
+class SavedSearchMatchAdmin(admin.ModelAdmin):
+    list_display = ('search', 'job', 'created_at')
+    search_fields = ('search__query', 'search__user__username', 'job__title')
+    list_filter = ('created_at',)
+    readonly_fields = ('created_at',)
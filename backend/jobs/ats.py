@@ -6,6 +6,8 @@ from urllib.parse import urlparse
 import requests
 from bs4 import BeautifulSoup
 
+from .records import JobRecord
+
 logger = logging.getLogger(__name__)
 
 USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122 Safari/537.36'
@@ -50,19 +52,19 @@ def scrape_greenhouse(career_url: str):
             location = (j.get('location') or {}).get('name')
             url = j.get('absolute_url') or j.get('id')
             desc = j.get('content') or ''
-            out.append({
-                'title': title,
-                'company_name': company.replace('-', ' ').title(),
-                'location': location or '',
-                'job_type': 'full_time',
-                'description': desc,
-                'requirements': '',
-                'salary_min': None,
-                'salary_max': None,
-                'application_url': url if isinstance(url, str) else '',
-                'keywords': [],
-                'source': 'greenhouse'
-            })
+            out.append(JobRecord(
+                title=title,
+                company_name=company.replace('-', ' ').title(),
+                location=location or '',
+                job_type='full_time',
+                description=desc,
+                requirements='',
+                salary_min=None,
+                salary_max=None,
+                application_url=url if isinstance(url, str) else '',
+                keywords=[],
+                source='greenhouse'
+            ))
         return out
     except Exception as e:
         logger.error(f"Greenhouse scrape error: {e}")
@@ -87,19 +89,19 @@ def scrape_lever(career_url: str):
         data = resp.json()
         out = []
         for j in data:
-            out.append({
-                'title': j.get('text'),
-                'company_name': company.replace('-', ' ').title(),
-                'location': (j.get('categories') or {}).get('location') or '',
-                'job_type': 'full_time',
-                'description': (j.get('lists') or [{}])[0].get('content') if j.get('lists') else '',
-                'requirements': '',
-                'salary_min': None,
-                'salary_max': None,
-                'application_url': j.get('hostedUrl') or j.get('applyUrl') or '',
-                'keywords': [],
-                'source': 'lever'
-            })
+            out.append(JobRecord(
+                title=j.get('text'),
+                company_name=company.replace('-', ' ').title(),
+                location=(j.get('categories') or {}).get('location') or '',
+                job_type='full_time',
+                description=(j.get('lists') or [{}])[0].get('content') if j.get('lists') else '',
+                requirements='',
+                salary_min=None,
+                salary_max=None,
+                application_url=j.get('hostedUrl') or j.get('applyUrl') or '',
+                keywords=[],
+                source='lever'
+            ))
         return out
     except Exception as e:
         logger.error(f"Lever scrape error: {e}")
@@ -122,19 +124,19 @@ def scrape_smartrecruiters(career_url: str):
             loc = ((item.get('location') or {}).get('city') or '')
             url = (item.get('ref') or {}).get('jobAd') or ''
             desc = (item.get('jobAd') or {}).get('sections', {}).get('jobDescription', {}).get('text', '')
-            out.append({
-                'title': title,
-                'company_name': company.replace('-', ' ').title(),
-                'location': loc,
-                'job_type': 'full_time',
-                'description': desc,
-                'requirements': '',
-                'salary_min': None,
-                'salary_max': None,
-                'application_url': url,
-                'keywords': [],
-                'source': 'smartrecruiters'
-            })
+            out.append(JobRecord(
+                title=title,
+                company_name=company.replace('-', ' ').title(),
+                location=loc,
+                job_type='full_time',
+                description=desc,
+                requirements='',
+                salary_min=None,
+                salary_max=None,
+                application_url=url,
+                keywords=[],
+                source='smartrecruiters'
+            ))
         return out
     except Exception as e:
         logger.error(f"SmartRecruiters scrape error: {e}")
@@ -151,46 +153,58 @@ def scrape_company_career(career_url: str):
         return scrape_smartrecruiters(career_url)
     # Fallback: try to find obvious links
     try:
-        html = requests.get(career_url, headers=HEADERS, timeout=15).text
-        soup = BeautifulSoup(html, 'html.parser')
-        # Try to find job cards quickly
-        links = soup.select('a[href*="job"], a[href*="careers"], a[href*="opening"], a[href*="opportunity"]')
-        out = []
-        for a in links[:20]:
-            href = a.get('href')
-            if not href:
-                continue
-            if not href.startswith('http'):
-                parsed = urlparse(career_url)
-                href = f"{parsed.scheme}://{parsed.netloc}{href if href.startswith('/') else '/' + href}"
-            out.append({
-                'title': a.get_text(strip=True) or 'Job',
-                'company_name': urlparse(career_url).netloc.split('.')[0].title(),
-                'location': '',
-                'job_type': 'full_time',
-                'description': '',
-                'requirements': '',
-                'salary_min': None,
-                'salary_max': None,
-                'application_url': href,
-                'keywords': [],
-                'source': 'company'
-            })
-        return out
+        html = requests.get(career_url, headers=HEADERS, timeout=15).content
+        from .parsing import parse_html
+        return parse_html('company', html, base_url=career_url)
     except Exception:
         return []
 
 
-def scrape_companies_from_catalog(catalog: list[dict], max_per_company: int = 10):
-    all_jobs = []
-    for entry in catalog:
-        try:
-            jobs = scrape_company_career(entry.get('career_url', ''))
-            if jobs:
-                all_jobs.extend(jobs[:max_per_company])
-        except Exception:
+def parse_career_page(html, career_url: str):
+    """Pull likely job links out of a generic company careers page."""
+    soup = BeautifulSoup(html, 'html.parser')
+    # Try to find job cards quickly
+    links = soup.select('a[href*="job"], a[href*="careers"], a[href*="opening"], a[href*="opportunity"]')
+    out = []
+    for a in links[:20]:
+        href = a.get('href')
+        if not href:
             continue
-    return all_jobs
+        if not href.startswith('http'):
+            parsed = urlparse(career_url)
+            href = f"{parsed.scheme}://{parsed.netloc}{href if href.startswith('/') else '/' + href}"
+        out.append(JobRecord(
+            title=a.get_text(strip=True) or 'Job',
+            company_name=urlparse(career_url).netloc.split('.')[0].title(),
+            location='',
+            job_type='full_time',
+            description='',
+            requirements='',
+            salary_min=None,
+            salary_max=None,
+            application_url=href,
+            keywords=[],
+            source='company'
+        ))
+    return out
+
+
+# Concurrent careers-page fetches while streaming a catalog
+CATALOG_WORKERS = 16
+
+
+def iter_companies_from_catalog(catalog: list[dict], max_per_company: int = 10, workers: int = CATALOG_WORKERS,
+                                timeout: float | None = None):
+    """Stream JobRecords from catalog companies as their careers pages come back."""
+    from .pipeline import fan_out
+    return fan_out(
+        lambda entry: (scrape_company_career(entry.get('career_url', '')) or [])[:max_per_company],
+        catalog, workers=workers, timeout=timeout, name='catalog',
+    )
+
+
+def scrape_companies_from_catalog(catalog: list[dict], max_per_company: int = 10):
+    return list(iter_companies_from_catalog(catalog, max_per_company=max_per_company))
 
 
 def load_company_catalog(paths: list[str]) -> list[dict]:
@@ -0,0 +1,216 @@
+"""Batched auto-apply: store scraped results, score them against a resume and apply.
+
+Every step works on the whole batch at once. Companies and jobs are resolved with one
+lookup each and written with bulk_create/bulk_update (the Job save signals are replayed
+in bulk: normalized text, enrichment status, prefilter columns, `preferences.sync_job_skills`
+and `vector_index.index_jobs`). All candidates
+are scored in one `score_jobs` pass, existing applications are fetched with one query,
+and the new applications and notifications are created in one transaction and pushed
+to the user's WebSocket as a single message. Applying to 100 jobs takes a handful of
+queries instead of six per job.
+"""
+import logging
+
+from django.db import transaction
+from django.utils import timezone
+
+from resumes.matching import PREPROCESS_VERSION, normalize_job
+
+from .models import Company, Job, JobApplication
+from .preferences import fill_location, sync_job_skills
+from .records import JobRecord
+
+logger = logging.getLogger(__name__)
+
+PORTAL_WEBSITES = {
+    'indeed': 'https://www.indeed.com',
+    'naukri': 'https://www.naukri.com',
+    'linkedin': 'https://www.linkedin.com',
+}
+
+
+def _resolve_companies(records: list[JobRecord]) -> dict[str, Company]:
+    """Company per name, creating the missing ones (website from the first result's portal)."""
+    websites: dict[str, str] = {}
+    for record in records:
+        websites.setdefault(record.company_name or 'Unknown', PORTAL_WEBSITES.get(record.source, ''))
+    companies: dict[str, Company] = {}
+    # The oldest row wins when a name is duplicated
+    for company in Company.objects.filter(name__in=list(websites)).order_by('id'):
+        companies.setdefault(company.name, company)
+    missing = [Company(name=name, website=website) for name, website in websites.items() if name not in companies]
+    if missing:
+        Company.objects.bulk_create(missing)
+        if any(c.pk is None for c in missing):
+            # Backends that do not return ids from bulk inserts
+            for company in Company.objects.filter(name__in=[c.name for c in missing]).order_by('id'):
+                companies.setdefault(company.name, company)
+        else:
+            companies.update((c.name, c) for c in missing)
+    return companies
+
+
+def upsert_jobs(items) -> tuple[list[Job], int]:
+    """Job.update_or_create() for a batch of scraped results, keyed on (title, company,
+    application_url). Returns the stored jobs in input order and the number of results
+    that could not be stored.
+    """
+    records, errors = [], 0
+    for item in items:
+        try:
+            record = JobRecord.coerce(item)
+        except Exception as e:
+            logger.error(f"Auto-apply error: {str(e)}")
+            errors += 1
+            continue
+        if not record.title or not record.application_url:
+            errors += 1
+            continue
+        records.append(record)
+    if not records:
+        return [], errors
+
+    try:
+        with transaction.atomic():
+            jobs, indexed, pending = _upsert_records(records)
+    except Exception as e:
+        # A bad row fails the whole bulk statement; store one result at a time instead
+        logger.error(f"Bulk job upsert failed ({e}); saving results individually")
+        return _upsert_individually(records, errors)
+
+    from .enrichment import enqueue_jobs
+    from .vector_index import index_jobs
+    index_jobs(indexed)
+    sync_job_skills(indexed)
+    if pending:
+        enqueue_jobs(pending)
+    return jobs, errors
+
+
+def _upsert_records(records: list[JobRecord]) -> tuple[list[Job], list[Job], list[int]]:
+    companies = _resolve_companies(records)
+    existing: dict[tuple, Job] = {}
+    for job in Job.objects.select_related('company').filter(
+            company__in=list(companies.values()),
+            application_url__in={r.application_url for r in records}).order_by('id'):
+        existing.setdefault((job.title, job.company_id, job.application_url), job)
+
+    keys, new, updated, indexed = [], {}, {}, {}
+    now = timezone.now()
+    for record in records:
+        company = companies[record.company_name or 'Unknown']
+        key = (record.title, company.pk, record.application_url)
+        keys.append(key)
+        defaults = record.orm_defaults()
+        job = existing.get(key) or new.get(key)
+        if job is None:
+            job = record.to_job(company)
+            new[key] = job
+            stale = True
+        else:
+            before = (job.description, job.requirements, job.status)
+            for field, value in defaults.items():
+                setattr(job, field, value)
+            job.updated_at = now
+            if job.pk is not None:
+                updated[key] = job
+            if (job.description, job.requirements, job.status) != before:
+                indexed[key] = job
+            stale = before[:2] != (job.description, job.requirements) or job.preprocess_version != PREPROCESS_VERSION
+        # What the pre_save receivers do on Job.save()
+        if job.description and job.enrichment_status == 'pending':
+            job.enrichment_status = 'enriched'
+        if stale:
+            normalize_job(job)
+        fill_location(job)
+
+    Job.objects.bulk_create(list(new.values()))
+    if any(job.pk is None for job in new.values()):
+        # Backends that do not return ids from bulk inserts
+        created = {(j.title, j.company_id, j.application_url): j for j in Job.objects.filter(
+            company__in=list(companies.values()), application_url__in={k[2] for k in new}).order_by('id')}
+        for key, job in new.items():
+            job.pk = created[key].pk
+    if updated:
+        Job.objects.bulk_update(list(updated.values()), [
+            'location', 'job_type', 'description', 'requirements', 'salary_min', 'salary_max', 'keywords',
+            'source', 'status', 'normalized_text', 'preprocess_version', 'enrichment_status', 'location_key',
+            'is_remote', 'updated_at',
+        ])
+
+    jobs = [existing.get(key) or new[key] for key in keys]
+    indexed.update(new)
+    pending = list(dict.fromkeys(job.pk for job in jobs if job.enrichment_status == 'pending'))
+    return jobs, list(indexed.values()), pending
+
+
+def _upsert_individually(records: list[JobRecord], errors: int) -> tuple[list[Job], int]:
+    from .enrichment import enqueue_jobs
+    jobs = []
+    for record in records:
+        try:
+            company_name = record.company_name or 'Unknown'
+            company, _ = Company.objects.get_or_create(
+                name=company_name, defaults={'website': PORTAL_WEBSITES.get(record.source, '')})
+            job, _ = Job.objects.update_or_create(
+                title=record.title,
+                company=company,
+                application_url=record.application_url,
+                defaults=record.orm_defaults()
+            )
+            if job.enrichment_status == 'pending':
+                enqueue_jobs([job.id])
+            jobs.append(job)
+        except Exception as e:
+            logger.error(f"Auto-apply error: {str(e)}")
+            errors += 1
+    return jobs, errors
+
+
+def score_candidates(resume, jobs: list[Job], threshold: float | None = None) -> list[tuple[float, Job]]:
+    """(match_score, job) for the distinct jobs scoring at least `threshold`
+    (default settings.JOB_MATCH_THRESHOLD), in one pass."""
+    from .vector_index import match_threshold, score_jobs
+    if threshold is None:
+        threshold = match_threshold()
+    jobs = list({job.pk: job for job in jobs}.values())
+    return [(score, job) for score, job in score_jobs(resume.parsed_content or '', jobs,
+                                                      processed_resume=resume.normalized_text)
+            if score >= threshold]
+
+
+def apply_to_jobs(user, resume, matches: list[tuple[float, Job]]) -> list[JobApplication]:
+    """Create 'applied' applications (and notifications) for the matches the user has not
+    applied to with this resume yet, in one transaction. Returns the new applications.
+    """
+    from accounts.models import Notification, push_notifications_ws
+
+    if not matches:
+        return []
+    applied = set(JobApplication.objects.filter(
+        user=user, resume=resume, job_id__in=[job.pk for _, job in matches]).values_list('job_id', flat=True))
+    applications, notifications = [], []
+    for match_score, job in matches:
+        if job.pk in applied:
+            continue
+        applied.add(job.pk)
+        applications.append(JobApplication(
+            user=user,
+            job=job,
+            resume=resume,
+            cover_letter='',
+            status='applied',
+            match_score=match_score
+        ))
+        notifications.append(Notification(
+            user=user,
+            title=f"Applied: {job.title}"[:100],
+            message=f"Automatically applied to {job.title} at {job.company.name}.",
+        ))
+    if not applications:
+        return []
+    with transaction.atomic():
+        JobApplication.objects.bulk_create(applications)
+        Notification.objects.bulk_create(notifications)
+        transaction.on_commit(lambda: push_notifications_ws(user.pk, notifications))
+    return applications
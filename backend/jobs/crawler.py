@@ -0,0 +1,156 @@
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlparse
+
+from django.conf import settings
+
+from .records import JobRecord
+from .scraper import PORTAL_SCRAPERS, get_portal_scraper
+
+logger = logging.getLogger(__name__)
+
+# Defaults for deep-crawl mode; override via settings.JOB_CRAWL
+DEFAULT_MAX_PAGES = 10
+DEFAULT_MAX_RESULTS = 200
+DEFAULT_PER_HOST = 3
+DEFAULT_TIMEOUT = 10
+
+
+def _crawl_setting(name: str, default):
+    return (getattr(settings, 'JOB_CRAWL', None) or {}).get(name, default)
+
+
+class HostLimiter:
+    """Caps the number of in-flight requests per host across all crawl threads."""
+
+    def __init__(self, per_host: int):
+        self.per_host = max(1, int(per_host))
+        self._lock = threading.Lock()
+        self._sems: dict[str, threading.BoundedSemaphore] = {}
+
+    def slot(self, url: str) -> threading.BoundedSemaphore:
+        host = urlparse(url).netloc.lower()
+        with self._lock:
+            sem = self._sems.get(host)
+            if sem is None:
+                sem = self._sems[host] = threading.BoundedSemaphore(self.per_host)
+            return sem
+
+
+def _fetch_page(portal, scraper, limiter: HostLimiter, keywords, location, country, page, timeout):
+    req = scraper.page_request(keywords=keywords, location=location, country=country, page=page)
+    if req is None:
+        return []
+    with limiter.slot(req[0]):
+        try:
+            return scraper.fetch_page(keywords=keywords, location=location, country=country, page=page, timeout=timeout, portal=portal)
+        except Exception as e:
+            logger.error(f"Deep crawl page {page} failed for {type(scraper).__name__}: {e}")
+            return []
+
+
+def crawl_portal(portal: str, keywords: str = '', location: str | None = None, country: str | None = None,
+                 max_pages: int | None = None, max_results: int | None = None,
+                 executor: ThreadPoolExecutor | None = None, limiter: HostLimiter | None = None,
+                 timeout: int | None = None) -> dict:
+    """Crawl listing pages of a single portal.
+
+    Pages are requested in windows of `limiter.per_host` concurrent fetches and consumed
+    in page order. The crawl stops at the first empty page, the first page that only
+    repeats already-seen URLs (portals often serve the last page again past the end),
+    `max_pages`, or once `max_results` unique jobs were collected.
+
+    Returns {'portal', 'jobs', 'pages', 'elapsed', 'stop_reason'}.
+    """
+    max_pages = max_pages or _crawl_setting('MAX_PAGES', DEFAULT_MAX_PAGES)
+    max_results = max_results or _crawl_setting('MAX_RESULTS', DEFAULT_MAX_RESULTS)
+    timeout = timeout or _crawl_setting('TIMEOUT', DEFAULT_TIMEOUT)
+    limiter = limiter or HostLimiter(_crawl_setting('PER_HOST', DEFAULT_PER_HOST))
+    scraper = get_portal_scraper(portal)
+    if not scraper.paginated:
+        max_pages = 1
+    # Naukri needs a location segment in its search URL
+    if portal == 'naukri':
+        location = location or 'india'
+
+    own_executor = executor is None
+    if own_executor:
+        executor = ThreadPoolExecutor(max_workers=limiter.per_host)
+
+    jobs: list[JobRecord] = []
+    seen: set[str] = set()
+    pages = 0
+    stop_reason = 'max_pages'
+    started = time.perf_counter()
+    try:
+        page = 0
+        while page < max_pages:
+            window = range(page, min(page + limiter.per_host, max_pages))
+            futs = [executor.submit(_fetch_page, portal, scraper, limiter, keywords, location, country, p, timeout) for p in window]
+            stop = False
+            for fut in futs:
+                if stop:
+                    fut.cancel()
+                    continue
+                items = fut.result()
+                pages += 1
+                fresh = []
+                for it in items:
+                    url = it.get('application_url')
+                    if not url or url in seen:
+                        continue
+                    seen.add(url)
+                    it['source'] = portal
+                    fresh.append(it)
+                if not items:
+                    stop, stop_reason = True, 'empty_page'
+                elif not fresh:
+                    stop, stop_reason = True, 'duplicate_page'
+                jobs.extend(fresh)
+                if len(jobs) >= max_results:
+                    stop, stop_reason = True, 'max_results'
+            if stop:
+                break
+            page += len(window)
+    finally:
+        if own_executor:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    return {
+        'portal': portal,
+        'jobs': jobs[:max_results],
+        'pages': pages,
+        'elapsed': time.perf_counter() - started,
+        'stop_reason': stop_reason,
+    }
+
+
+def deep_crawl(keywords: str = '', location: str | None = None, country: str | None = 'India',
+               portals: list[str] | None = None, max_pages: int | None = None,
+               max_results: int | None = None, per_host: int | None = None) -> list[dict]:
+    """Deep-crawl several portals concurrently, one crawl_portal() result per portal.
+
+    All portals share one thread pool and one HostLimiter, so the number of concurrent
+    requests against any host never exceeds `per_host` even when portals share a domain.
+    """
+    portals = portals or list(PORTAL_SCRAPERS)
+    limiter = HostLimiter(per_host or _crawl_setting('PER_HOST', DEFAULT_PER_HOST))
+    results: list[dict] = []
+    # Page fetches run on `pages_pool`; per-portal coordinators on `portal_pool` so a
+    # coordinator waiting on its pages never starves the page fetches of workers.
+    with ThreadPoolExecutor(max_workers=limiter.per_host * len(portals)) as pages_pool, \
+            ThreadPoolExecutor(max_workers=len(portals)) as portal_pool:
+        futs = [
+            portal_pool.submit(crawl_portal, p, keywords, location, country, max_pages, max_results,
+                               pages_pool, limiter)
+            for p in portals
+        ]
+        for p, fut in zip(portals, futs):
+            try:
+                results.append(fut.result())
+            except Exception as e:
+                logger.error(f"Deep crawl failed for {p}: {e}")
+                results.append({'portal': p, 'jobs': [], 'pages': 0, 'elapsed': 0.0, 'stop_reason': 'error'})
+    return results
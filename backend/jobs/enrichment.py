@@ -0,0 +1,256 @@
+import logging
+import queue
+import re
+import threading
+import time
+
+import requests
+from bs4 import BeautifulSoup
+from django.conf import settings
+from django.db import close_old_connections
+from django.utils import timezone
+
+from .crawler import HostLimiter
+from .models import Job
+from .records import JobRecord
+from .scraper import JobScraper
+
+logger = logging.getLogger(__name__)
+
+USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122 Safari/537.36'
+DETAIL_TIMEOUT = 10
+
+# Description containers on each portal's detail page, tried in order
+DETAIL_SELECTORS = {
+    'linkedin': ['div.show-more-less-html__markup', 'div.description__text'],
+    'indeed': ['#jobDescriptionText', 'div.jobsearch-jobDescriptionText'],
+    'naukri': ['section[class*="job-desc"]', 'div.job-desc', 'div.dang-inner-html'],
+    'weworkremotely': ['div.listing-container', 'div#job-listing-show-container'],
+    'remoteok': ['div.description', 'div.markdown'],
+    'remotive': ['div.job-description', 'section.job-description', 'div.left'],
+    'monster': ['div#JobDescription', 'div.job-description'],
+    'dice': ['div#jobDescription', 'div[data-testid="jobDescriptionHtml"]'],
+    'glassdoor': ['div.jobDescriptionContent', 'div#JobDescriptionContainer'],
+}
+GENERIC_SELECTORS = ['[itemprop="description"]', 'div.job-description', 'article', 'main']
+REQUIREMENTS_HEADING = re.compile(r'requirements|qualifications|what you.ll need|skills', re.I)
+
+# Details fetched for postings that are not (yet) stored as Job rows, keyed by URL
+_DETAIL_CACHE: dict[str, tuple[float, str, str]] = {}
+_DETAIL_CACHE_LOCK = threading.Lock()
+_DETAIL_CACHE_TTL_SECONDS = 6 * 3600
+
+
+def _enrich_setting(name: str, default):
+    return (getattr(settings, 'JOB_ENRICHMENT', None) or {}).get(name, default)
+
+
+def parse_detail_page(html, source: str = '') -> tuple[str, str]:
+    """Extract (description, requirements) text from a job detail page."""
+    soup = BeautifulSoup(html, 'html.parser')
+    container = None
+    for sel in DETAIL_SELECTORS.get(source, []) + GENERIC_SELECTORS:
+        container = soup.select_one(sel)
+        if container and container.get_text(strip=True):
+            break
+        container = None
+
+    description = container.get_text(' ', strip=True) if container else ''
+    if not description:
+        meta = soup.find('meta', attrs={'name': 'description'}) or soup.find('meta', attrs={'property': 'og:description'})
+        description = (meta.get('content') or '').strip() if meta else ''
+
+    requirements = ''
+    heading = (container or soup).find(['h2', 'h3', 'h4', 'strong', 'b'], string=REQUIREMENTS_HEADING)
+    if heading and heading.find_next('ul'):
+        requirements = heading.find_next('ul').get_text(' ', strip=True)
+    return description, requirements
+
+
+def fetch_job_details(url: str, source: str = '', limiter: HostLimiter | None = None) -> tuple[str, str] | None:
+    """Fetch a detail page under the per-host limit. Returns None when the page is unavailable."""
+    limiter = limiter or _LIMITER
+    with limiter.slot(url):
+        resp = requests.get(url, headers={'User-Agent': USER_AGENT}, timeout=DETAIL_TIMEOUT)
+    if resp.status_code != 200:
+        logger.error(f"Failed to fetch job details {url}: {resp.status_code}")
+        return None
+    return parse_detail_page(resp.content, source)
+
+
+def _store_details(url: str, description: str, requirements: str):
+    with _DETAIL_CACHE_LOCK:
+        _DETAIL_CACHE[url] = (time.time(), description, requirements)
+
+
+def cached_details(url: str) -> tuple[str, str] | None:
+    now = time.time()
+    with _DETAIL_CACHE_LOCK:
+        entry = _DETAIL_CACHE.get(url)
+        if not entry:
+            return None
+        ts, description, requirements = entry
+        if now - ts > _DETAIL_CACHE_TTL_SECONDS:
+            _DETAIL_CACHE.pop(url, None)
+            return None
+        return description, requirements
+
+
+def enrich_job(job: Job, limiter: HostLimiter | None = None) -> bool:
+    """Fetch and persist description/requirements/keywords for a stored job."""
+    try:
+        details = fetch_job_details(job.application_url, job.source, limiter)
+    except Exception as e:
+        logger.error(f"Enrichment error for job {job.id}: {e}")
+        details = None
+    if not details or not details[0]:
+        job.enrichment_status = 'failed'
+        job.save(update_fields=['enrichment_status', 'updated_at'])
+        return False
+    description, requirements = details
+    job.description = description
+    job.requirements = requirements or job.requirements
+    job.keywords = JobScraper(None).extract_keywords(f"{job.title} {description} {requirements}")
+    job.enrichment_status = 'enriched'
+    job.enriched_at = timezone.now()
+    job.save(update_fields=['description', 'requirements', 'keywords', 'normalized_text', 'preprocess_version',
+                           'enrichment_status', 'enriched_at', 'updated_at'])
+    _store_details(job.application_url, description, requirements)
+    from .reverse_matching import enqueue_new_jobs
+    enqueue_new_jobs([job.id])
+    return True
+
+
+def _enrich_url(url: str, source: str):
+    details = fetch_job_details(url, source)
+    if not details or not details[0]:
+        return
+    description, requirements = details
+    _store_details(url, description, requirements)
+    # The posting may have been stored since it was queued
+    enriched = []
+    for job in Job.objects.filter(application_url=url, description=''):
+        job.description = description
+        job.requirements = requirements or job.requirements
+        job.keywords = JobScraper(None).extract_keywords(f"{job.title} {description} {requirements}")
+        job.enrichment_status = 'enriched'
+        job.enriched_at = timezone.now()
+        job.save(update_fields=['description', 'requirements', 'keywords', 'normalized_text', 'preprocess_version',
+                               'enrichment_status', 'enriched_at', 'updated_at'])
+        enriched.append(job.id)
+    if enriched:
+        from .reverse_matching import enqueue_new_jobs
+        enqueue_new_jobs(enriched)
+
+
+class EnrichmentQueue:
+    """Background detail-page fetcher with a fixed number of worker threads.
+
+    Items are ('job', job_id) for stored jobs or ('url', url, source) for postings that
+    were only returned by a live search. Duplicate items already queued are dropped.
+    """
+
+    def __init__(self, workers: int, maxsize: int = 5000):
+        self.workers = max(1, int(workers))
+        self._queue: queue.Queue = queue.Queue(maxsize=maxsize)
+        self._pending: set[tuple] = set()
+        self._lock = threading.Lock()
+        self._threads: list[threading.Thread] = []
+
+    def _ensure_started(self):
+        with self._lock:
+            if self._threads:
+                return
+            for i in range(self.workers):
+                t = threading.Thread(target=self._run, name=f'job-enrichment-{i}', daemon=True)
+                t.start()
+                self._threads.append(t)
+
+    def put(self, item: tuple) -> bool:
+        key = item[:2]
+        with self._lock:
+            if key in self._pending:
+                return False
+            self._pending.add(key)
+        try:
+            self._queue.put_nowait(item)
+        except queue.Full:
+            with self._lock:
+                self._pending.discard(key)
+            logger.warning("Enrichment queue full; dropping item")
+            return False
+        self._ensure_started()
+        return True
+
+    def _run(self):
+        while True:
+            item = self._queue.get()
+            try:
+                close_old_connections()
+                if item[0] == 'job':
+                    job = Job.objects.filter(id=item[1], enrichment_status='pending').first()
+                    if job:
+                        enrich_job(job)
+                else:
+                    _enrich_url(item[1], item[2])
+            except Exception as e:
+                logger.error(f"Enrichment worker error: {e}")
+            finally:
+                with self._lock:
+                    self._pending.discard(item[:2])
+                close_old_connections()
+                self._queue.task_done()
+
+    def join(self):
+        self._queue.join()
+
+
+_LIMITER = HostLimiter(_enrich_setting('PER_HOST', 2))
+_QUEUE = EnrichmentQueue(_enrich_setting('WORKERS', 4))
+
+
+def enqueue_jobs(job_ids) -> int:
+    """Queue stored jobs for background enrichment. Returns how many were queued."""
+    return sum(1 for job_id in job_ids if _QUEUE.put(('job', job_id)))
+
+
+def enrich_results(items: list[JobRecord]) -> list[JobRecord]:
+    """Fill empty descriptions of live-search results from already-fetched details and
+    queue the rest for background enrichment, without blocking the caller.
+    """
+    for it in items:
+        if it.get('description') or not it.get('application_url'):
+            continue
+        details = cached_details(it['application_url'])
+        if details:
+            it['description'], requirements = details
+            it['requirements'] = it.get('requirements') or requirements
+        else:
+            _QUEUE.put(('url', it['application_url'], it.get('source') or ''))
+    return items
+
+
+def enrich_pending(limit: int | None = None, workers: int | None = None, include_failed: bool = False) -> dict:
+    """Synchronously enrich stored jobs that still lack a description."""
+    statuses = ['pending', 'failed'] if include_failed else ['pending']
+    qs = Job.objects.filter(status='active', enrichment_status__in=statuses).only(
+        # Everything enrich_job and the save signals read; a deferred field costs a query per job
+        'id', 'title', 'application_url', 'source', 'requirements', 'enrichment_status', 'status',
+        'preprocess_version'
+    ).order_by('-created_at')
+    if limit:
+        qs = qs[:limit]
+    jobs = list(qs)
+    counts = {'enriched': 0, 'failed': 0}
+
+    def work(job):
+        try:
+            return enrich_job(job)
+        finally:
+            close_old_connections()
+
+    from concurrent.futures import ThreadPoolExecutor
+    with ThreadPoolExecutor(max_workers=workers or _QUEUE.workers) as ex:
+        for ok in ex.map(work, jobs):
+            counts['enriched' if ok else 'failed'] += 1
+    return counts
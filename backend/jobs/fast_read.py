@@ -0,0 +1,109 @@
+"""Read-only fast path for the hot list endpoints: response rows built from values_list().
+
+A ModelSerializer builds a model instance per row and then walks a tree of Field objects
+for it, which costs more CPU than the query itself on list endpoints. `ValuesReader`
+builds the same JSON-ready dicts straight from values_list() rows. Its columns are
+derived from a serializer's Meta.fields, so the field contract (names, order and value
+formats) is the serializer's:
+
+  model fields        read as stored; foreign keys give the related id, as PrimaryKeyRelatedField does
+  DateTimeField       ISO 8601 in the current timezone, 'Z' for UTC (DRF's DateTimeField)
+  CharField(source=)  the related column, e.g. source='company.name' reads company__name
+
+Serializers with other declared fields or file/decimal/date model fields are rejected
+when the reader is built. `python manage.py bench_serializers` checks that the rows are
+identical to the serializer's output and compares throughput.
+"""
+from operator import attrgetter
+
+from django.conf import settings
+from django.db import models
+from django.utils import timezone
+from rest_framework import ISO_8601, serializers
+from rest_framework.settings import api_settings
+
+from jobportal.pagination import KeysetPagination
+
+from .serializers import JobApplicationSerializer, JobSerializer
+
+# Model fields whose serializer field formats the value; not supported by the fast path
+_FORMATTED_FIELDS = (models.FileField, models.DecimalField, models.DurationField, models.UUIDField)
+
+
+class ValuesReader:
+    """Response rows of a serializer's fields, read with one values_list() query."""
+
+    def __init__(self, serializer_class):
+        meta = serializer_class.Meta
+        declared = serializer_class._declared_fields
+        self.serializer_class = serializer_class
+        self.names = tuple(meta.fields)
+        lookups, datetimes = [], []
+        for i, name in enumerate(self.names):
+            if name in declared:
+                field = declared[name]
+                if type(field) is not serializers.CharField:
+                    raise ValueError(f"{serializer_class.__name__}.{name}: only CharField(source=...) is supported")
+                lookups.append((field.source or name).replace('.', '__'))
+                continue
+            field = meta.model._meta.get_field(name)
+            if isinstance(field, models.DateTimeField):
+                datetimes.append(i)
+            elif isinstance(field, models.DateField) or isinstance(field, _FORMATTED_FIELDS):
+                raise ValueError(f"{serializer_class.__name__}.{name}: {type(field).__name__} is not supported")
+            lookups.append(field.name)
+        self.lookups = tuple(lookups)
+        self.datetimes = tuple(datetimes)
+        self._get = attrgetter(*self.lookups)
+
+    def values(self, queryset):
+        """The queryset as named rows (attributes are the lookups), for pagination."""
+        return queryset.values_list(*self.lookups, named=True)
+
+    def rows(self, values) -> list[dict]:
+        """Response rows of named rows from `values`."""
+        get, names, datetimes = self._get, self.names, self.datetimes
+        to_text = _datetime_representation()
+        rows = []
+        for row in values:
+            row = get(row)
+            if datetimes:
+                row = list(row)
+                for i in datetimes:
+                    row[i] = to_text(row[i])
+            rows.append(dict(zip(names, row)))
+        return rows
+
+    def read(self, queryset) -> list[dict]:
+        return self.rows(self.values(queryset))
+
+    def by_id(self, queryset) -> dict:
+        return {row['id']: row for row in self.read(queryset)}
+
+    def paginate(self, request, queryset, paginator=None):
+        """Like jobportal.pagination.paginate, with rows from this reader."""
+        paginator = paginator or KeysetPagination()
+        page = paginator.paginate_queryset(self.values(queryset), request)
+        return paginator.get_paginated_response(self.rows(page))
+
+
+def _datetime_representation():
+    """DateTimeField.to_representation for this request, with its setting lookups done once."""
+    field = serializers.DateTimeField()
+    output_format = api_settings.DATETIME_FORMAT
+    zone = timezone.get_current_timezone() if settings.USE_TZ else None
+    if zone is None or output_format is None or output_format.lower() != ISO_8601:
+        return field.to_representation
+
+    def to_text(value):
+        if not value:
+            return None
+        if value.tzinfo is None:
+            return field.to_representation(value)
+        text = value.astimezone(zone).isoformat()
+        return text[:-6] + 'Z' if text.endswith('+00:00') else text
+    return to_text
+
+
+JOB_READER = ValuesReader(JobSerializer)
+APPLICATION_READER = ValuesReader(JobApplicationSerializer)
@@ -0,0 +1,225 @@
+"""Full-text job search: an FTS5 index on SQLite, a weighted tsvector + GIN index on PostgreSQL.
+
+Both indexes cover a job's title, company name and description and are kept in sync by
+database triggers, so ORM saves, bulk_create/bulk_update, queryset updates and deletes
+all maintain them without application code:
+
+  SQLite      jobs_job_fts, an external-content FTS5 table over the jobs_job_search view
+              (porter stemming); triggers on jobs_job insert/update/delete and on company
+              renames issue the FTS5 'delete'/insert commands.
+  PostgreSQL  a jobs_job.search_vector column (title A, company B, description D) filled
+              by a BEFORE INSERT/UPDATE trigger, re-filled for a company's jobs when it is
+              renamed, and a GIN index on it.
+
+Neither is part of the Job model; `search_jobs` adds the match and a relevance rank
+(bm25 / ts_rank_cd) to a queryset. Other databases, or SQLite builds without FTS5,
+fall back to icontains filters. Queries are split into words; every word must appear
+and the last one also matches as a prefix, so results fill in as the user types.
+"""
+import logging
+import re
+
+from django.db import DEFAULT_DB_ALIAS, connections
+from django.db.models import Q
+
+logger = logging.getLogger(__name__)
+
+# Words of a search; anything else (quotes, operators) is dropped
+_WORDS = re.compile(r'\w+', re.UNICODE)
+# Longer queries are cut; each word narrows the match anyway
+MAX_QUERY_WORDS = 12
+
+SQLITE_INSTALL = [
+    """CREATE VIEW IF NOT EXISTS jobs_job_search AS
+       SELECT j.id AS id, j.title AS title, c.name AS company, j.description AS description
+       FROM jobs_job j LEFT JOIN jobs_company c ON c.id = j.company_id""",
+    """CREATE VIRTUAL TABLE IF NOT EXISTS jobs_job_fts USING fts5(
+       title, company, description,
+       content='jobs_job_search', content_rowid='id', tokenize='porter unicode61 remove_diacritics 2')""",
+    """CREATE TRIGGER IF NOT EXISTS jobs_job_fts_insert AFTER INSERT ON jobs_job BEGIN
+       INSERT INTO jobs_job_fts(rowid, title, company, description)
+       VALUES (new.id, new.title, (SELECT name FROM jobs_company WHERE id = new.company_id), new.description);
+       END""",
+    """CREATE TRIGGER IF NOT EXISTS jobs_job_fts_delete AFTER DELETE ON jobs_job BEGIN
+       INSERT INTO jobs_job_fts(jobs_job_fts, rowid, title, company, description)
+       VALUES ('delete', old.id, old.title, (SELECT name FROM jobs_company WHERE id = old.company_id),
+               old.description);
+       END""",
+    # Django saves write every column; only real text changes touch the index
+    """CREATE TRIGGER IF NOT EXISTS jobs_job_fts_update AFTER UPDATE OF title, description, company_id ON jobs_job
+       WHEN old.title IS NOT new.title OR old.description IS NOT new.description
+            OR old.company_id IS NOT new.company_id BEGIN
+       INSERT INTO jobs_job_fts(jobs_job_fts, rowid, title, company, description)
+       VALUES ('delete', old.id, old.title, (SELECT name FROM jobs_company WHERE id = old.company_id),
+               old.description);
+       INSERT INTO jobs_job_fts(rowid, title, company, description)
+       VALUES (new.id, new.title, (SELECT name FROM jobs_company WHERE id = new.company_id), new.description);
+       END""",
+    """CREATE TRIGGER IF NOT EXISTS jobs_company_fts_update AFTER UPDATE OF name ON jobs_company
+       WHEN old.name IS NOT new.name BEGIN
+       INSERT INTO jobs_job_fts(jobs_job_fts, rowid, title, company, description)
+       SELECT 'delete', id, title, old.name, description FROM jobs_job WHERE company_id = old.id;
+       INSERT INTO jobs_job_fts(rowid, title, company, description)
+       SELECT id, title, new.name, description FROM jobs_job WHERE company_id = new.id;
+       END""",
+    "INSERT INTO jobs_job_fts(jobs_job_fts) VALUES ('rebuild')",
+]
+
+SQLITE_UNINSTALL = [
+    'DROP TRIGGER IF EXISTS jobs_company_fts_update',
+    'DROP TRIGGER IF EXISTS jobs_job_fts_update',
+    'DROP TRIGGER IF EXISTS jobs_job_fts_delete',
+    'DROP TRIGGER IF EXISTS jobs_job_fts_insert',
+    'DROP TABLE IF EXISTS jobs_job_fts',
+    'DROP VIEW IF EXISTS jobs_job_search',
+]
+
+POSTGRES_INSTALL = [
+    'ALTER TABLE jobs_job ADD COLUMN IF NOT EXISTS search_vector tsvector',
+    """CREATE OR REPLACE FUNCTION jobs_job_search_vector() RETURNS trigger AS $$
+       BEGIN
+         NEW.search_vector :=
+           setweight(to_tsvector('english', coalesce(NEW.title, '')), 'A') ||
+           setweight(to_tsvector('english', coalesce(
+             (SELECT name FROM jobs_company WHERE id = NEW.company_id), '')), 'B') ||
+           setweight(to_tsvector('english', coalesce(NEW.description, '')), 'D');
+         RETURN NEW;
+       END $$ LANGUAGE plpgsql""",
+    'DROP TRIGGER IF EXISTS jobs_job_search_vector ON jobs_job',
+    """CREATE TRIGGER jobs_job_search_vector BEFORE INSERT OR UPDATE OF title, description, company_id
+       ON jobs_job FOR EACH ROW EXECUTE FUNCTION jobs_job_search_vector()""",
+    # Rewriting title fires the job trigger, which reads the new company name
+    """CREATE OR REPLACE FUNCTION jobs_company_search_vector() RETURNS trigger AS $$
+       BEGIN
+         UPDATE jobs_job SET title = title WHERE company_id = NEW.id;
+         RETURN NULL;
+       END $$ LANGUAGE plpgsql""",
+    'DROP TRIGGER IF EXISTS jobs_company_search_vector ON jobs_company',
+    """CREATE TRIGGER jobs_company_search_vector AFTER UPDATE OF name ON jobs_company
+       FOR EACH ROW WHEN (OLD.name IS DISTINCT FROM NEW.name) EXECUTE FUNCTION jobs_company_search_vector()""",
+    'UPDATE jobs_job SET title = title',
+    'CREATE INDEX IF NOT EXISTS jobs_job_search_vector_gin ON jobs_job USING GIN (search_vector)',
+]
+
+POSTGRES_UNINSTALL = [
+    'DROP TRIGGER IF EXISTS jobs_company_search_vector ON jobs_company',
+    'DROP FUNCTION IF EXISTS jobs_company_search_vector()',
+    'DROP TRIGGER IF EXISTS jobs_job_search_vector ON jobs_job',
+    'DROP FUNCTION IF EXISTS jobs_job_search_vector()',
+    'DROP INDEX IF EXISTS jobs_job_search_vector_gin',
+    'ALTER TABLE jobs_job DROP COLUMN IF EXISTS search_vector',
+]
+
+# Column weights of bm25(): title, company, description
+SQLITE_WEIGHTS = (10.0, 5.0, 1.0)
+
+_AVAILABLE: dict[str, str | None] = {}
+
+
+def install(connection):
+    """Create the search index and its triggers for this connection's database, and fill
+    it. SQLite builds without FTS5 are left without one.
+    """
+    if connection.vendor == 'sqlite':
+        statements = SQLITE_INSTALL
+    elif connection.vendor == 'postgresql':
+        statements = POSTGRES_INSTALL
+    else:
+        return
+    with connection.cursor() as cursor:
+        for i, sql in enumerate(statements):
+            try:
+                cursor.execute(sql)
+            except Exception as e:
+                if connection.vendor == 'sqlite' and i == 1:
+                    logger.warning(f"SQLite has no FTS5; job search stays on icontains: {e}")
+                    cursor.execute(SQLITE_UNINSTALL[-1])
+                    break
+                raise
+    _AVAILABLE.pop(connection.alias, None)
+
+
+def uninstall(connection):
+    statements = {'sqlite': SQLITE_UNINSTALL, 'postgresql': POSTGRES_UNINSTALL}.get(connection.vendor, [])
+    with connection.cursor() as cursor:
+        for sql in statements:
+            cursor.execute(sql)
+    _AVAILABLE.pop(connection.alias, None)
+
+
+def rebuild(using: str = DEFAULT_DB_ALIAS):
+    """Recompute the whole index from the job rows (after restoring a dump without triggers,
+    or to compact it).
+    """
+    connection = connections[using]
+    with connection.cursor() as cursor:
+        if backend(using) == 'sqlite':
+            cursor.execute("INSERT INTO jobs_job_fts(jobs_job_fts) VALUES ('rebuild')")
+            cursor.execute("INSERT INTO jobs_job_fts(jobs_job_fts) VALUES ('optimize')")
+        elif backend(using) == 'postgresql':
+            cursor.execute('UPDATE jobs_job SET title = title')
+
+
+def backend(using: str = DEFAULT_DB_ALIAS) -> str | None:
+    """'sqlite' or 'postgresql' when the database has the search index, else None."""
+    if using not in _AVAILABLE:
+        connection = connections[using]
+        found = None
+        with connection.cursor() as cursor:
+            if connection.vendor == 'sqlite':
+                cursor.execute("SELECT 1 FROM sqlite_master WHERE name = 'jobs_job_fts'")
+                found = 'sqlite' if cursor.fetchone() else None
+            elif connection.vendor == 'postgresql':
+                cursor.execute("SELECT 1 FROM information_schema.columns "
+                               "WHERE table_name = 'jobs_job' AND column_name = 'search_vector'")
+                found = 'postgresql' if cursor.fetchone() else None
+        _AVAILABLE[using] = found
+    return _AVAILABLE[using]
+
+
+def search_words(text: str) -> list[str]:
+    return _WORDS.findall((text or '').lower())[:MAX_QUERY_WORDS]
+
+
+def fts5_query(words: list[str]) -> str:
+    """FTS5 MATCH expression: every word, the last one also as a prefix."""
+    return ' '.join(f'"{w}"' for w in words[:-1]) + f' "{words[-1]}"*'
+
+
+def tsquery(words: list[str]) -> str:
+    """to_tsquery() input: every word, the last one also as a prefix."""
+    return ' & '.join([f"'{w}'" for w in words[:-1]] + [f"'{words[-1]}':*"])
+
+
+def search_jobs(queryset, text: str):
+    """Jobs of `queryset` matching a search, best first, with a `search_rank` column
+    (higher is better). Without a search index every word must appear (icontains) in the
+    title, description or company name, and the queryset's order is kept.
+    """
+    words = search_words(text)
+    if not words:
+        return queryset
+    using = queryset.db
+    found = backend(using)
+    if found == 'sqlite':
+        weights = ', '.join(str(w) for w in SQLITE_WEIGHTS)
+        return queryset.extra(
+            tables=['jobs_job_fts'],
+            where=['jobs_job_fts.rowid = jobs_job.id', 'jobs_job_fts MATCH %s'],
+            params=[fts5_query(words)],
+            select={'search_rank': f'-bm25(jobs_job_fts, {weights})'},
+            order_by=['-search_rank', '-id'],
+        )
+    if found == 'postgresql':
+        query = tsquery(words)
+        return queryset.extra(
+            where=["jobs_job.search_vector @@ to_tsquery('english', %s)"],
+            params=[query],
+            select={'search_rank': "ts_rank_cd(jobs_job.search_vector, to_tsquery('english', %s))"},
+            select_params=[query],
+            order_by=['-search_rank', '-id'],
+        )
+    for word in words:
+        queryset = queryset.filter(
+            Q(title__icontains=word) | Q(description__icontains=word) | Q(company__name__icontains=word))
+    return queryset
@@ -0,0 +1,92 @@
+import random
+import time
+
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+
+from accounts.models import Notification
+from jobs.auto_apply import PORTAL_WEBSITES, apply_to_jobs, score_candidates, upsert_jobs
+from jobs.models import Company, Job, JobApplication
+from jobs.records import JobRecord
+from jobs.scraper import job_defaults
+from jobs.vector_index import score_jobs
+from resumes.models import Resume
+
+_WORDS = ('python django rest api postgresql docker kubernetes aws react redis celery microservices '
+          'testing ci cd linux git agile backend frontend data pipelines spark kafka').split()
+
+
+def _legacy(user, resume, items, threshold):
+    """The per-result loop auto-apply used before the batched engine, kept as the baseline."""
+    stored = []
+    for item in items:
+        company, _ = Company.objects.get_or_create(
+            name=item.get('company_name') or 'Unknown', defaults={'website': PORTAL_WEBSITES.get(item.get('source'), '')})
+        job, _ = Job.objects.update_or_create(
+            title=item['title'], company=company, application_url=item['application_url'], defaults=job_defaults(item))
+        stored.append(job)
+    applied = 0
+    for match_score, job in score_jobs(resume.parsed_content or '', stored, processed_resume=resume.normalized_text):
+        if match_score < threshold:
+            continue
+        if JobApplication.objects.filter(user=user, job=job, resume=resume).exists():
+            continue
+        JobApplication.objects.create(user=user, job=job, resume=resume, cover_letter='', status='applied',
+                                      match_score=match_score)
+        Notification.objects.create(user=user, title=f"Applied: {job.title}",
+                                    message=f"Automatically applied to {job.title} at {job.company.name}.")
+        applied += 1
+    return applied
+
+
+def _batched(user, resume, items, threshold):
+    stored, _ = upsert_jobs(items)
+    return len(apply_to_jobs(user, resume, score_candidates(resume, stored, threshold)))
+
+
+class Command(BaseCommand):
+    help = ('Benchmark auto-apply for one resume over N search results: the old per-result loop versus '
+            'the batched engine (jobs.auto_apply). Reports queries and wall time; every run is rolled back.')
+
+    def add_arguments(self, parser):
+        parser.add_argument('--results', default='10,100,500', help='Comma-separated search result counts')
+        parser.add_argument('--companies', type=int, default=20, help='Distinct companies among the results')
+        parser.add_argument('--existing', type=float, default=0.3,
+                            help='Fraction of results already stored as jobs (re-scraped postings)')
+        parser.add_argument('--threshold', type=float, default=0.0, help='Match score needed to apply')
+        parser.add_argument('--seed', type=int, default=7)
+
+    def handle(self, *args, **opts):
+        self.stdout.write(f"{'results':>8} {'engine':<8} {'queries':>8} {'ms':>9} {'applied':>8}")
+        for n in [int(x) for x in opts['results'].split(',') if x.strip()]:
+            for name, engine in (('legacy', _legacy), ('batched', _batched)):
+                rnd = random.Random(opts['seed'])
+                with transaction.atomic():
+                    user, resume, items = self._fixture(rnd, n, opts)
+                    queries = []
+                    with connection.execute_wrapper(lambda execute, sql, *a: queries.append(sql) or execute(sql, *a)):
+                        started = time.perf_counter()
+                        applied = engine(user, resume, items, opts['threshold'])
+                        elapsed = time.perf_counter() - started
+                    transaction.set_rollback(True)
+                self.stdout.write(f'{n:>8} {name:<8} {len(queries):>8} {elapsed * 1000:>9.1f} {applied:>8}')
+
+    @staticmethod
+    def _fixture(rnd: random.Random, n: int, opts):
+        user = User.objects.create_user(f'bench-auto-apply-{rnd.random()}')
+        content = ' '.join(rnd.choice(_WORDS) for _ in range(200))
+        resume = Resume.objects.create(user=user, title='bench', file='resumes/bench.txt', parsed_content=content)
+        items = [
+            JobRecord(
+                title=f'Engineer {i}', company_name=f'Bench Company {i % opts["companies"]}', location='Pune',
+                description=' '.join(rnd.choice(_WORDS) for _ in range(120)), source=rnd.choice(list(PORTAL_WEBSITES)),
+                application_url=f'https://jobs.example.com/bench/{i}', keywords=rnd.sample(_WORDS, 5),
+            )
+            for i in range(n)
+        ]
+        for item in items[:int(n * opts['existing'])]:
+            company, _ = Company.objects.get_or_create(name=item.company_name, defaults={'website': ''})
+            Job.objects.create(title=item.title, company=company, application_url=item.application_url,
+                               **job_defaults(item))
+        return user, resume, items
@@ -0,0 +1,79 @@
+import random
+import time
+import tracemalloc
+
+from django.core.management.base import BaseCommand
+
+from jobs.records import JobRecord
+from jobs.scraper import JobScraper
+
+_TITLES = ['Software Engineer', 'Backend Developer', 'Data Analyst', 'Frontend Engineer', 'Sales Manager', 'DevOps Engineer']
+_SOURCES = ['indeed', 'naukri', 'linkedin', 'weworkremotely', 'remoteok', 'remotive', 'greenhouse', 'lever']
+_TYPES = ['full_time', 'remote', 'contract']
+
+
+def _raw_rows(n: int, seed: int = 7):
+    """Fresh (non-shared) strings per row, as a parser would produce them."""
+    rnd = random.Random(seed)
+    for i in range(n):
+        yield (
+            f'{rnd.choice(_TITLES)} {i % 500}',
+            f'Company {i % 2000}',
+            rnd.choice(['Bengaluru', 'Pune', 'Remote', 'Hyderabad']) + '',
+            ''.join(rnd.choice(_TYPES)),
+            '', '', None, None,
+            f'https://jobs.example.com/{i % (n // 2 or 1)}',
+            ['python', 'django'] if i % 3 else [],
+            ''.join(rnd.choice(_SOURCES)),
+        )
+
+
+def _as_dict(row):
+    return dict(zip(JobRecord.FIELDS, row))
+
+
+class Command(BaseCommand):
+    help = 'Benchmark memory per scraped job and scrape-pipeline throughput: dict vs JobRecord.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--records', type=int, default=100000, help='Records to build')
+
+    def handle(self, *args, **opts):
+        n = opts['records']
+        for label, build in (('dict', _as_dict), ('JobRecord', JobRecord.from_tuple)):
+            tracemalloc.start()
+            started = time.perf_counter()
+            items = [build(row) for row in _raw_rows(n)]
+            built = time.perf_counter() - started
+            current, _ = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            elapsed = self._pipeline(items)
+            self.stdout.write(
+                f'{label:<10} {current / n:8.0f} B/record   build {n / built:10.0f} records/s'
+                f'   pipeline {n / elapsed:10.0f} records/s'
+            )
+            del items
+
+    def _pipeline(self, items) -> float:
+        """filter -> dedupe -> score -> top-k, the same stages search and matching run,
+        using each representation's native field access.
+        """
+        started = time.perf_counter()
+        role_ok = JobScraper.is_cs_role
+        records = isinstance(items[0], JobRecord)
+        seen = set()
+        scored = []
+        for it in items:
+            if records:
+                title, url, keywords = it.title, it.application_url, it.keywords
+            else:
+                title, url, keywords = it['title'], it['application_url'], it['keywords']
+            if not role_ok(title):
+                continue
+            if not url or url in seen:
+                continue
+            seen.add(url)
+            scored.append((len(keywords), it))
+        scored.sort(key=lambda x: x[0], reverse=True)
+        scored[:50]
+        return time.perf_counter() - started
@@ -0,0 +1,101 @@
+import itertools
+import random
+import string
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.test import override_settings
+
+from jobs.vector_index import NUMPY_AVAILABLE, JobVectorIndex, build_ann
+
+
+def _vocabulary(size: int, rnd: random.Random) -> list[str]:
+    # Letters only: preprocess_text strips digits
+    words = set()
+    while len(words) < size:
+        words.add(''.join(rnd.choice(string.ascii_lowercase) for _ in range(rnd.randint(4, 9))))
+    return sorted(words)
+
+
+class _Corpus:
+    """Jobs drawn from topic clusters plus Zipf-distributed background words,
+    so resumes have a few strongly related jobs among many weak ones."""
+
+    def __init__(self, topics: int, vocab_size: int, seed: int):
+        self.rnd = random.Random(seed)
+        self.vocab = _vocabulary(vocab_size, self.rnd)
+        self.topics = [self.rnd.sample(self.vocab, 40) for _ in range(topics)]
+        self.cum_weights = list(itertools.accumulate(1.0 / (i + 1) for i in range(len(self.vocab))))
+
+    def document(self, length: int, topic_share: float = 0.4) -> list[str]:
+        topic = self.rnd.choice(self.topics)
+        n_topic = int(length * topic_share)
+        return (self.rnd.choices(topic, k=n_topic)
+                + self.rnd.choices(self.vocab, cum_weights=self.cum_weights, k=length - n_topic))
+
+    def jobs(self, n: int):
+        for job_id in range(n):
+            terms = {}
+            for t in self.document(self.rnd.randint(60, 250)):
+                terms[t] = terms.get(t, 0) + 1
+            yield job_id, terms
+
+
+class Command(BaseCommand):
+    help = ('Benchmark candidate selection (BM25 inverted index, random-projection LSH) against '
+            'exhaustive scoring: latency and recall@k by corpus size.')
+
+    def add_arguments(self, parser):
+        parser.add_argument('--sizes', default='1000,10000,50000', help='Comma-separated corpus sizes')
+        parser.add_argument('--queries', type=int, default=50, help='Resumes per corpus size')
+        parser.add_argument('--k', type=int, default=20, help='Results compared for recall@k')
+        parser.add_argument('--candidates', type=int, default=300, help='Jobs retrieved by BM25 before full scoring')
+        parser.add_argument('--bits', type=int, default=None, help='LSH bits per table (default: settings)')
+        parser.add_argument('--tables', type=int, default=None, help='LSH tables (default: settings)')
+        parser.add_argument('--probes', type=int, default=None, help='Extra LSH buckets probed per table (default: settings)')
+
+    def handle(self, *args, **opts):
+        if not NUMPY_AVAILABLE:
+            self.stderr.write('numpy/scipy are required for the job vector index')
+            return
+        k = opts['k']
+        index_settings = dict(getattr(settings, 'JOB_VECTOR_INDEX', {}))
+        if opts['probes'] is not None:
+            index_settings['ANN_PROBES'] = opts['probes']
+        self.stdout.write(
+            f"{'jobs':>8} {'build s':>8} {'exact ms':>9} {'bm25 ms':>8} {'recall':>7}"
+            f" {'lsh build s':>11} {'ann ms':>7} {'recall':>7}   (recall@{k} vs exact)"
+        )
+        for size in [int(x) for x in opts['sizes'].split(',') if x.strip()]:
+            corpus = _Corpus(topics=max(20, size // 100), vocab_size=20000, seed=size)
+            started = time.perf_counter()
+            index = JobVectorIndex.from_vectors(corpus.jobs(size))
+            build = time.perf_counter() - started
+            started = time.perf_counter()
+            ann = build_ann(index, opts['bits'], opts['tables'])
+            ann_build = time.perf_counter() - started
+            resumes = [' '.join(corpus.document(300)) for _ in range(opts['queries'])]
+
+            with override_settings(JOB_VECTOR_INDEX=index_settings):
+                exact, t_exact = self._run(index, resumes, k, mode='exact')
+                bm25, t_bm25 = self._run(index, resumes, k, mode='bm25', candidates=opts['candidates'])
+                approx, t_ann = self._run(index, resumes, k, mode='ann', ann=ann)
+            n = len(resumes)
+            self.stdout.write(
+                f'{size:>8} {build:>8.2f} {t_exact * 1000 / n:>9.2f} {t_bm25 * 1000 / n:>8.2f}'
+                f' {self._recall(bm25, exact):>7.3f} {ann_build:>11.2f} {t_ann * 1000 / n:>7.2f}'
+                f' {self._recall(approx, exact):>7.3f}'
+            )
+
+    @staticmethod
+    def _recall(found, exact) -> float:
+        return sum(
+            len({j for _, j in a} & {j for _, j in e}) / max(1, len(e)) for a, e in zip(found, exact)
+        ) / max(1, len(exact))
+
+    @staticmethod
+    def _run(index, resumes, k, **kwargs):
+        started = time.perf_counter()
+        results = [index.search(text, k=k, **kwargs) for text in resumes]
+        return results, time.perf_counter() - started
@@ -0,0 +1,114 @@
+import os
+import shutil
+import sqlite3
+import statistics
+import tempfile
+import time
+
+from django.core.management.base import BaseCommand
+
+from jobs.fulltext import SQLITE_INSTALL, SQLITE_WEIGHTS, fts5_query, search_words
+from jobs.management.commands.bench_job_retrieval import _Corpus
+
+_SCHEMA = [
+    'CREATE TABLE jobs_company (id INTEGER PRIMARY KEY, name TEXT NOT NULL)',
+    """CREATE TABLE jobs_job (id INTEGER PRIMARY KEY, title TEXT NOT NULL, company_id INTEGER NOT NULL,
+       description TEXT NOT NULL, status TEXT NOT NULL)""",
+]
+
+# The JobViewSet query before the index: any field containing the word, companies joined
+_LIKE_SQL = """SELECT jobs_job.id FROM jobs_job INNER JOIN jobs_company ON jobs_company.id = jobs_job.company_id
+WHERE jobs_job.status = 'active' AND {}"""
+_LIKE_WORD = ("(jobs_job.title LIKE ? ESCAPE '\\' OR jobs_job.description LIKE ? ESCAPE '\\' "
+              "OR jobs_company.name LIKE ? ESCAPE '\\')")
+_FTS_SQL = """SELECT jobs_job.id FROM jobs_job, jobs_job_fts
+WHERE jobs_job.status = 'active' AND jobs_job_fts.rowid = jobs_job.id AND jobs_job_fts MATCH ?
+ORDER BY -bm25(jobs_job_fts, {}) DESC, jobs_job.id DESC""".format(', '.join(map(str, SQLITE_WEIGHTS)))
+
+
+class Command(BaseCommand):
+    help = ('Benchmark job search on a scratch SQLite database: the FTS5 index (with its sync '
+            'triggers) against the icontains LIKE scan it replaces, by corpus size.')
+
+    def add_arguments(self, parser):
+        parser.add_argument('--sizes', default='100000,1000000', help='Comma-separated job counts')
+        parser.add_argument('--words', type=int, default=80, help='Description length in words')
+        parser.add_argument('--repeat', type=int, default=5, help='Runs per query (median reported)')
+        parser.add_argument('--limit', type=int, default=20, help='Also time the first page of this many results')
+        parser.add_argument('--dir', default=None, help='Directory for the scratch database (default: temp)')
+
+    def handle(self, *args, **opts):
+        corpus = _Corpus(topics=200, vocab_size=50000, seed=11)
+        by_frequency = corpus.vocab
+        queries = {
+            'common word': by_frequency[20],
+            'mid word': by_frequency[800],
+            'rare word': by_frequency[20000],
+            'two words': f'{by_frequency[50]} {by_frequency[1500]}',
+            'prefix': by_frequency[800][:4],
+        }
+        for n in [int(x) for x in opts['sizes'].split(',') if x.strip()]:
+            directory = tempfile.mkdtemp(dir=opts['dir'])
+            try:
+                self._run(os.path.join(directory, 'bench.sqlite3'), corpus, n, queries, opts)
+            finally:
+                shutil.rmtree(directory, ignore_errors=True)
+
+    def _run(self, path, corpus, n, queries, opts):
+        db = sqlite3.connect(path, isolation_level=None)
+        for sql in _SCHEMA + SQLITE_INSTALL:
+            db.execute(sql)
+        db.executemany('INSERT INTO jobs_company (id, name) VALUES (?, ?)',
+                       [(i, f'{corpus.vocab[i * 7 % 5000].title()} Labs') for i in range(1, 2001)])
+        inserted = 0.0
+        db.execute('BEGIN')
+        for start in range(0, n, 10000):
+            rows = [(i + 1, ' '.join(corpus.document(4, 0.5)), corpus.rnd.randint(1, 2000),
+                     ' '.join(corpus.document(opts['words'])), 'active' if i % 10 else 'closed')
+                    for i in range(start, min(n, start + 10000))]
+            # Text generation is not timed
+            started = time.perf_counter()
+            db.executemany('INSERT INTO jobs_job (id, title, company_id, description, status) '
+                           'VALUES (?, ?, ?, ?, ?)', rows)
+            inserted += time.perf_counter() - started
+        db.execute('COMMIT')
+        db.execute('ANALYZE')
+        size = os.path.getsize(path) / 1e6
+        fts_pages = db.execute("SELECT sum(pgsize) FROM dbstat WHERE name LIKE 'jobs_job_fts%'").fetchone()[0] \
+            if db.execute("SELECT 1 FROM pragma_module_list WHERE name = 'dbstat'").fetchone() else None
+        self.stdout.write(f"{n} jobs: inserted with FTS triggers in {inserted:.1f}s "
+                          f"({n / inserted:.0f} rows/s), database {size:.0f} MB"
+                          + (f", FTS index {fts_pages / 1e6:.0f} MB" if fts_pages else ''))
+
+        def timed(sql, params, limit=None):
+            runs, rows = [], []
+            for _ in range(opts['repeat']):
+                started = time.perf_counter()
+                cursor = db.execute(sql, params)
+                rows = cursor.fetchmany(limit) if limit else cursor.fetchall()
+                runs.append(time.perf_counter() - started)
+            return statistics.median(runs) * 1000.0, len(rows)
+
+        for label, text in queries.items():
+            words = search_words(text)
+            like_sql = _LIKE_SQL.format(' AND '.join([_LIKE_WORD] * len(words)))
+            like_params = [f'%{w}%' for w in words for _ in range(3)]
+            like_ms, like_rows = timed(like_sql, like_params)
+            like_page_ms, _ = timed(like_sql, like_params, opts['limit'])
+            fts_ms, fts_rows = timed(_FTS_SQL, [fts5_query(words)])
+            fts_page_ms, _ = timed(_FTS_SQL, [fts5_query(words)], opts['limit'])
+            self.stdout.write(
+                f"  {label:<12} {text!r:<24} LIKE {like_ms:8.1f}ms ({like_rows} rows, first {opts['limit']} "
+                f"{like_page_ms:.1f}ms) | FTS5 ranked {fts_ms:7.1f}ms ({fts_rows} rows, first {opts['limit']} "
+                f"{fts_page_ms:.1f}ms) | {like_ms / max(fts_ms, 1e-3):.0f}x")
+
+        started = time.perf_counter()
+        db.execute('BEGIN')
+        db.executemany('UPDATE jobs_job SET description = ? WHERE id = ?',
+                       [(' '.join(corpus.document(opts['words'])), i) for i in range(1, 1001)])
+        db.execute('DELETE FROM jobs_job WHERE id BETWEEN 1001 AND 2000')
+        db.execute('COMMIT')
+        synced = time.perf_counter() - started
+        db.execute("INSERT INTO jobs_job_fts(jobs_job_fts, rank) VALUES ('integrity-check', 1)")
+        self.stdout.write(f"  1000 updates + 1000 deletes kept in sync in {synced * 1000:.0f}ms; integrity check passed")
+        db.close()
@@ -0,0 +1,56 @@
+import os
+import tempfile
+import time
+from pathlib import Path
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.test import override_settings
+
+from jobs.scoring_pool import shutdown_scoring_pool
+from jobs.vector_index import NUMPY_AVAILABLE, JobVectorIndex
+
+from .bench_job_retrieval import _Corpus
+
+
+class Command(BaseCommand):
+    help = ('Benchmark exact match scoring of a memory-mapped snapshot in the request thread '
+            'versus sharded across the scoring process pool.')
+
+    def add_arguments(self, parser):
+        parser.add_argument('--jobs', type=int, default=200000, help='Synthetic jobs in the snapshot')
+        parser.add_argument('--processes', default=f'1,2,4,{os.cpu_count() or 1}',
+                            help='Comma-separated pool sizes (1 = in the request thread)')
+        parser.add_argument('--queries', type=int, default=30, help='Resumes scored per pool size')
+        parser.add_argument('--k', type=int, default=200, help='Matches kept per resume')
+
+    def handle(self, *args, **opts):
+        if not NUMPY_AVAILABLE:
+            self.stderr.write('numpy/scipy are required for the job vector index')
+            return
+        corpus = _Corpus(topics=max(20, opts['jobs'] // 100), vocab_size=20000, seed=opts['jobs'])
+        resumes = [' '.join(corpus.document(300)) for _ in range(opts['queries'])]
+        with tempfile.TemporaryDirectory() as tmp:
+            started = time.perf_counter()
+            index = JobVectorIndex.open(JobVectorIndex.from_vectors(corpus.jobs(opts['jobs'])).export(Path(tmp)))
+            self.stdout.write(f"{opts['jobs']} jobs indexed and exported in {time.perf_counter() - started:.1f}s "
+                              f"({os.cpu_count()} cores)")
+            baseline = None
+            for processes in sorted({int(x) for x in opts['processes'].split(',') if x.strip()}):
+                index_settings = dict(getattr(settings, 'JOB_VECTOR_INDEX', {}),
+                                      MODE='exact', PARALLEL_MIN_JOBS=0,
+                                      SCORE_PROCESSES=processes if processes > 1 else 0)
+                with override_settings(JOB_VECTOR_INDEX=index_settings):
+                    index.search(resumes[0], k=opts['k'])  # start and warm the pool
+                    started = time.perf_counter()
+                    results = [index.search(text, k=opts['k']) for text in resumes]
+                    elapsed = time.perf_counter() - started
+                shutdown_scoring_pool()
+                if baseline is None:
+                    baseline, reference = elapsed, results
+                same = all([j for _, j in a] == [j for _, j in b] for a, b in zip(results, reference))
+                self.stdout.write(
+                    f'{processes:>3} processes  {elapsed * 1000 / len(resumes):8.2f} ms/resume  '
+                    f'{len(resumes) / elapsed:8.1f} resumes/s  x{baseline / elapsed:.2f}'
+                    f'{"" if same else "  RESULTS DIFFER"}'
+                )
@@ -0,0 +1,90 @@
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from pathlib import Path
+
+from django.core.management.base import BaseCommand, CommandError
+
+from jobs.parsing import _init_worker, _parse_worker, parse_page_inline
+from jobs.scraper import PORTAL_SCRAPERS, get_portal_scraper
+
+# Minimal listing cards matching each portal's selectors, used when no recorded pages are given
+_CARD_TEMPLATES = {
+    'indeed': '<div class="job_seen_beacon"><h2 class="jobTitle">Software Engineer {i}</h2>'
+              '<a class="jcs-JobTitle" data-jk="jk{i}" href="/rc/{i}">x</a><span class="companyName">Acme {i}</span>'
+              '<div class="companyLocation">Bengaluru</div><p>{filler}</p></div>',
+    'linkedin': '<div class="job-search-card"><h3 class="base-search-card__title">Backend Developer {i}</h3>'
+                '<a class="base-card__full-link" href="https://www.linkedin.com/jobs/view/{i}">x</a>'
+                '<h4 class="base-search-card__subtitle">Acme {i}</h4><span class="job-search-card__location">Pune</span>'
+                '<p>{filler}</p></div>',
+    'remoteok': '<tr class="job" data-href="/remote-jobs/{i}"><td class="company_and_position"><h2>Frontend Engineer {i}</h2>'
+                '<h3>Acme {i}</h3></td><td>{filler}</td></tr>',
+}
+
+
+def _synthetic_page(portal: str, cards: int) -> bytes:
+    filler = ' '.join(['python django react kubernetes'] * 20)
+    body = ''.join(_CARD_TEMPLATES[portal].format(i=i, filler=filler) for i in range(cards))
+    if portal == 'remoteok':
+        body = f'<table id="jobsboard">{body}</table>'
+    return f'<html><head><title>{portal}</title></head><body>{body}</body></html>'.encode('utf-8')
+
+
+class Command(BaseCommand):
+    help = 'Benchmark listing-page parse throughput: thread-only vs process-pool parsing.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--pages-dir', help='Directory of recorded pages named <portal>*.html')
+        parser.add_argument('--record', help='Fetch page 0 of every portal and save it into this directory, then exit')
+        parser.add_argument('--keywords', default='software engineer', help='Keywords used with --record')
+        parser.add_argument('--workers', type=int, default=4, help='Threads / processes to use')
+        parser.add_argument('--repeat', type=int, default=20, help='Times each page is parsed')
+        parser.add_argument('--cards', type=int, default=60, help='Cards per synthetic page')
+
+    def handle(self, *args, **opts):
+        if opts['record']:
+            return self._record(Path(opts['record']), opts['keywords'])
+
+        pages: list[tuple[str, bytes]] = []
+        if opts['pages_dir']:
+            base = Path(opts['pages_dir'])
+            if not base.is_dir():
+                raise CommandError(f'Not a directory: {base}')
+            for f in sorted(base.glob('*.html')):
+                portal = next((p for p in PORTAL_SCRAPERS if f.name.startswith(p)), None)
+                if portal:
+                    pages.append((portal, f.read_bytes()))
+            if not pages:
+                raise CommandError(f'No <portal>*.html pages found in {base}')
+        else:
+            pages = [(p, _synthetic_page(p, opts['cards'])) for p in _CARD_TEMPLATES]
+
+        work = pages * opts['repeat']
+        total_bytes = sum(len(h) for _, h in work)
+        self.stdout.write(f'{len(work)} pages, {total_bytes / 1e6:.1f} MB, {opts["workers"]} workers')
+
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=opts['workers']) as ex:
+            jobs = sum(len(r) for r in ex.map(lambda w: parse_page_inline(w[0], w[1]), work))
+        self._report('threads', len(work), jobs, time.perf_counter() - started)
+
+        with ProcessPoolExecutor(max_workers=opts['workers'], initializer=_init_worker) as ex:
+            # Warm the pool so worker start-up is not billed to parsing
+            list(ex.map(_parse_worker, [work[0][0]] * opts['workers'], [work[0][1]] * opts['workers'], [''] * opts['workers']))
+            started = time.perf_counter()
+            jobs = sum(len(r) for r in ex.map(_parse_worker, [w[0] for w in work], [w[1] for w in work], [''] * len(work)))
+            self._report('processes', len(work), jobs, time.perf_counter() - started)
+
+    def _report(self, label, pages, jobs, elapsed):
+        self.stdout.write(f'{label:<10} {elapsed:8.2f}s  {pages / elapsed:8.1f} pages/s  {jobs / elapsed:9.1f} jobs/s')
+
+    def _record(self, out: Path, keywords: str):
+        out.mkdir(parents=True, exist_ok=True)
+        for portal in PORTAL_SCRAPERS:
+            try:
+                html = get_portal_scraper(portal).fetch_raw(keywords=keywords, location='india' if portal == 'naukri' else None, country='India')
+            except Exception as e:
+                self.stderr.write(f'{portal}: {e}')
+                continue
+            if html:
+                (out / f'{portal}.html').write_bytes(html)
+                self.stdout.write(f'{portal}: {len(html)} bytes')
@@ -0,0 +1,65 @@
+import time
+import tracemalloc
+
+from django.core.management.base import BaseCommand
+
+from jobs.management.commands.bench_job_retrieval import _Corpus
+from jobs.reverse_matching import JobBlock, ResumeTerms, best_per_user, job_matrix, score_resumes
+from jobs.vector_index import NUMPY_AVAILABLE, JobVectorIndex, match_threshold
+
+
+class Command(BaseCommand):
+    help = ('Benchmark reverse matching on a synthetic corpus: a crawl of new jobs scored against '
+            'every resume with the chunked sparse product. Reports time and peak memory per chunk size.')
+
+    def add_arguments(self, parser):
+        parser.add_argument('--resumes', type=int, default=100000, help='Active resumes')
+        parser.add_argument('--users', type=int, default=None, help='Distinct users owning them (default: resumes)')
+        parser.add_argument('--jobs', type=int, default=5000, help='Newly ingested jobs')
+        parser.add_argument('--corpus', type=int, default=20000, help='Jobs already in the index snapshot')
+        parser.add_argument('--chunks', default='1000,2000,5000', help='Comma-separated resume chunk sizes')
+        parser.add_argument('--threads', default='1', help='Comma-separated thread counts')
+        parser.add_argument('--threshold', type=float, default=None,
+                            help='Match score needed (default: settings.JOB_MATCH_THRESHOLD)')
+        parser.add_argument('--top-n', type=int, default=5, help='Matches kept per user')
+        parser.add_argument('--common-df', type=float, default=0.02,
+                            help='Share of the new jobs a term must appear in to be bounded (1 = multiply every term)')
+
+    def handle(self, *args, **opts):
+        if not NUMPY_AVAILABLE:
+            self.stderr.write('numpy/scipy are required for reverse matching')
+            return
+        threshold = match_threshold() if opts['threshold'] is None else opts['threshold']
+        corpus = _Corpus(topics=max(20, opts['corpus'] // 100), vocab_size=20000, seed=opts['corpus'])
+        started = time.perf_counter()
+        index = JobVectorIndex.from_vectors(corpus.jobs(opts['corpus']))
+        new_jobs = [(opts['corpus'] + job_id, terms) for job_id, terms in corpus.jobs(opts['jobs'])]
+        self.stdout.write(f"index of {opts['corpus']} jobs built in {time.perf_counter() - started:.1f}s")
+
+        started = time.perf_counter()
+        resumes = ResumeTerms()
+        users = opts['users'] or opts['resumes']
+        for resume_id in range(opts['resumes']):
+            resumes.add(resume_id, resume_id % users, ' '.join(corpus.document(300)))
+        self.stdout.write(f"{opts['resumes']} resumes tokenized in {time.perf_counter() - started:.1f}s "
+                          f"(once per process; later runs only read changed resumes)")
+
+        self.stdout.write(f"{'chunk':>7} {'threads':>7} {'jobs s':>7} {'score s':>8} {'rank s':>7} {'total s':>8}"
+                          f" {'peak MB':>8} {'pairs':>9} {'matches':>8}")
+        for size in [int(x) for x in opts['chunks'].split(',') if x.strip()]:
+            for threads in [int(x) for x in opts['threads'].split(',') if x.strip()]:
+                tracemalloc.start()
+                started = time.perf_counter()
+                ids, vocabulary, jobs = job_matrix(new_jobs, index)
+                block = JobBlock(jobs, opts['common_df'])
+                built = time.perf_counter()
+                user_ids, columns, resume_ids, scores, _ = score_resumes(
+                    resumes, vocabulary, resumes.idf(index, {}), block, threshold, opts['top_n'], size, threads)
+                scored = time.perf_counter()
+                best = best_per_user(user_ids, ids[columns], resume_ids, scores, opts['top_n'])
+                done = time.perf_counter()
+                peak = tracemalloc.get_traced_memory()[1] / 2 ** 20
+                tracemalloc.stop()
+                self.stdout.write(f'{size:>7} {threads:>7} {built - started:>7.2f} {scored - built:>8.2f}'
+                                  f' {done - scored:>7.2f} {done - started:>8.2f} {peak:>8.0f}'
+                                  f' {len(user_ids):>9} {len(best[0]):>8}')
@@ -0,0 +1,59 @@
+import time
+from collections import Counter
+
+from django.core.management.base import BaseCommand
+
+from jobs.management.commands.bench_job_retrieval import _Corpus
+from jobs.saved_searches import SavedSearchIndex
+
+
+class Command(BaseCommand):
+    help = ('Benchmark saved-search percolation on a synthetic corpus: new jobs matched through the '
+            'anchor-term index against checking every saved search. Reports throughput and searches '
+            'checked per job.')
+
+    def add_arguments(self, parser):
+        parser.add_argument('--searches', default='1000,10000,100000', help='Comma-separated saved search counts')
+        parser.add_argument('--jobs', type=int, default=2000, help='Newly ingested jobs')
+        parser.add_argument('--max-terms', type=int, default=3, help='Most terms per saved search')
+
+    def handle(self, *args, **opts):
+        corpus = _Corpus(topics=50, vocab_size=20000, seed=7)
+        jobs = [frozenset(terms) for _, terms in corpus.jobs(opts['jobs'])]
+        df = Counter(term for terms in jobs for term in terms)
+
+        def rarity(term):
+            return -df.get(term, 0), len(term)
+
+        for n in [int(x) for x in opts['searches'].split(',') if x.strip()]:
+            # Queries mix a topic word with background words, like "django developer"
+            searches = {}
+            for search_id in range(n):
+                size = corpus.rnd.randint(1, opts['max_terms'])
+                terms = corpus.rnd.sample(corpus.rnd.choice(corpus.topics), 1) + corpus.document(size - 1, 0.0)
+                searches[search_id] = frozenset(terms)
+
+            started = time.perf_counter()
+            index = SavedSearchIndex()
+            for search_id, terms in searches.items():
+                index.add(search_id, 0, terms, rarity=rarity)
+            built = time.perf_counter() - started
+
+            started = time.perf_counter()
+            percolated, checked = [], 0
+            for terms in jobs:
+                matched, candidates = index.match(terms)
+                percolated.append(sorted(matched))
+                checked += candidates
+            percolate_seconds = time.perf_counter() - started
+
+            started = time.perf_counter()
+            scanned = [[search_id for search_id, query in searches.items() if query <= terms] for terms in jobs]
+            scan_seconds = time.perf_counter() - started
+
+            matches = sum(len(m) for m in percolated)
+            self.stdout.write(
+                f"{n} searches: index built in {built:.2f}s; percolator {len(jobs) / percolate_seconds:.0f} jobs/s "
+                f"({checked / len(jobs):.0f} searches checked per job) vs scan {len(jobs) / scan_seconds:.0f} jobs/s "
+                f"({n} per job), {percolate_seconds and scan_seconds / percolate_seconds:.1f}x; "
+                f"{matches} matches, identical: {percolated == scanned}")
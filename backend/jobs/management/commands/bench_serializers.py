@@ -0,0 +1,96 @@
+import random
+import statistics
+import time
+
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from rest_framework.renderers import JSONRenderer
+
+from jobportal.renderers import ORJSON_AVAILABLE, ORJSONRenderer
+from jobs.fast_read import APPLICATION_READER, JOB_READER
+from jobs.models import Company, Job, JobApplication
+from jobs.serializers import JobApplicationSerializer, JobSerializer
+from resumes.models import Resume
+
+_WORDS = ('python django rest api postgresql docker kubernetes aws react redis celery microservices '
+          'testing ci cd linux git agile backend frontend data pipelines spark kafka café naïve').split()
+
+
+class Command(BaseCommand):
+    help = ('Benchmark the list endpoints\' response building in rows per second: ModelSerializer '
+            '(many=True, and one instance per row as find_matching_jobs did) against the values_list '
+            'reader in jobs.fast_read, and JSONRenderer against ORJSONRenderer. Checks the outputs are '
+            'identical; every run is rolled back.')
+
+    def add_arguments(self, parser):
+        parser.add_argument('--rows', default='50,1000,10000', help='Comma-separated row counts')
+        parser.add_argument('--repeat', type=int, default=5, help='Runs per measurement (median reported)')
+        parser.add_argument('--seed', type=int, default=7)
+
+    def handle(self, *args, **opts):
+        sizes = [int(x) for x in opts['rows'].split(',') if x.strip()]
+        if not ORJSON_AVAILABLE:
+            self.stdout.write(self.style.WARNING('orjson is not installed; ORJSONRenderer is JSONRenderer'))
+        with transaction.atomic():
+            user = self._fixture(random.Random(opts['seed']), max(sizes))
+            jobs = Job.objects.filter(company__name__startswith='Bench Serializers').order_by('-id')
+            applications = JobApplication.objects.filter(user=user).order_by('-id')
+            self.stdout.write(f"{'table':<13} {'rows':>6} {'serializer':>11} {'per row':>9} {'values':>9} "
+                              f"{'speedup':>8} {'json':>9} {'orjson':>9} {'speedup':>8}  identical")
+            for n in sizes:
+                self._compare(
+                    'jobs', n, opts['repeat'],
+                    lambda n=n: JobSerializer(list(jobs.select_related('company')[:n]), many=True).data,
+                    lambda n=n: [JobSerializer(job).data for job in jobs.select_related('company')[:n]],
+                    lambda n=n: JOB_READER.read(jobs[:n]))
+                self._compare(
+                    'applications', n, opts['repeat'],
+                    lambda n=n: JobApplicationSerializer(
+                        list(applications.select_related('job__company', 'resume')[:n]), many=True).data,
+                    lambda n=n: [JobApplicationSerializer(application).data
+                                 for application in applications.select_related('job__company', 'resume')[:n]],
+                    lambda n=n: APPLICATION_READER.read(applications[:n]))
+            transaction.set_rollback(True)
+
+    def _compare(self, table, n, repeat, serializer, per_row, values):
+        def rate(build):
+            runs = []
+            for _ in range(repeat):
+                started = time.perf_counter()
+                result = build()
+                runs.append(time.perf_counter() - started)
+            return n / statistics.median(runs), result
+
+        serializer_rate, expected = rate(serializer)
+        per_row_rate, _ = rate(per_row)
+        values_rate, rows = rate(values)
+        json_rate, rendered = rate(lambda: JSONRenderer().render(expected))
+        orjson_rate, fast_rendered = rate(lambda: ORJSONRenderer().render(rows))
+        identical = [dict(row) for row in expected] == rows and rendered == fast_rendered
+        self.stdout.write(
+            f'{table:<13} {n:>6} {serializer_rate:>11.0f} {per_row_rate:>9.0f} {values_rate:>9.0f} '
+            f'{values_rate / serializer_rate:>7.1f}x {json_rate:>9.0f} {orjson_rate:>9.0f} '
+            f'{orjson_rate / json_rate:>7.1f}x  {identical}')
+
+    @staticmethod
+    def _fixture(rnd: random.Random, n: int):
+        user = User.objects.create_user(f'bench-serializers-{rnd.random()}')
+        resume = Resume.objects.create(user=user, title='bench', file='resumes/bench.txt')
+        companies = Company.objects.bulk_create([
+            Company(name=f'Bench Serializers {i}', website=f'https://bench{i}.example.com') for i in range(50)])
+        jobs = Job.objects.bulk_create([
+            Job(title=f'Engineer {i}', company=companies[i % len(companies)], location='Pune',
+                job_type='full_time', description=' '.join(rnd.choice(_WORDS) for _ in range(120)),
+                requirements=' '.join(rnd.choice(_WORDS) for _ in range(30)),
+                salary_min=rnd.choice([None, 50000]), salary_max=rnd.choice([None, 90000]),
+                application_url=f'https://jobs.example.com/bench/{i}', source='bench',
+                keywords=rnd.sample(_WORDS, 5))
+            for i in range(n)
+        ])
+        JobApplication.objects.bulk_create([
+            JobApplication(user=user, job=job, resume=resume, match_score=round(rnd.random() * 100, 2),
+                           cover_letter=rnd.choice([None, 'Hello   team']), notes=None)
+            for job in jobs
+        ])
+        return user
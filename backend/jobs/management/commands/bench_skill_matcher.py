@@ -0,0 +1,87 @@
+import random
+import re
+import time
+
+from django.core.management.base import BaseCommand
+
+from jobs.skills import extract_skills, is_role, skill_matcher
+
+# The per-skill loops the compiled matcher replaced, kept here as the baseline
+_LEGACY_SKILLS = [
+    'python', 'java', 'javascript', 'react', 'angular', 'vue', 'node', 'django',
+    'flask', 'spring', 'sql', 'nosql', 'mongodb', 'postgresql', 'mysql', 'oracle',
+    'aws', 'azure', 'gcp', 'docker', 'kubernetes', 'ci/cd', 'git', 'agile', 'scrum',
+    'machine learning', 'data science', 'ai', 'devops', 'frontend', 'backend',
+    'fullstack', 'mobile', 'android', 'ios', 'swift', 'kotlin', 'react native',
+    'flutter', 'ui/ux', 'html', 'css', 'sass', 'less', 'bootstrap', 'tailwind',
+    'typescript', 'c#', 'c++', 'php', 'ruby', 'rails', 'go', 'rust', 'scala'
+]
+_LEGACY_ROLES = [
+    'software engineer', 'software developer', 'developer', 'engineer', 'sde',
+    'full stack', 'fullstack', 'backend', 'front end', 'frontend', 'web developer',
+    'android', 'ios', 'mobile developer', 'devops', 'site reliability', 'sre',
+    'data engineer', 'ml engineer', 'ai engineer', 'cloud engineer'
+]
+_LEGACY_PATTERNS = [re.compile(r'\b' + re.escape(s) + r'\b') for s in _LEGACY_SKILLS]
+
+_WORDS = (
+    'we are hiring a team player to build scalable services with python django postgres '
+    'and react, deploy on aws using docker and k8s, own ci/cd pipelines, write c# and c++ '
+    'tooling, mentor engineers, collaborate with product and design, golang is a plus '
+    'strong communication ownership customers growth mission benefits remote hybrid'
+).split()
+_TITLES = ['Senior Software Engineer', 'Backend Developer', 'Sales Manager', 'Data Engineer',
+           'Account Executive', 'iOS Developer', 'HR Business Partner', 'SRE']
+
+
+def _legacy_keywords(text):
+    clean = re.sub(r'<.*?>', ' ', text)
+    clean = re.sub(r'[^\w\s]', ' ', clean)
+    clean = re.sub(r'\s+', ' ', clean).strip().lower()
+    return [s for s in _LEGACY_SKILLS if s in clean]
+
+
+def _legacy_resume_skills(text):
+    text = text.lower()
+    return [s for s, pat in zip(_LEGACY_SKILLS, _LEGACY_PATTERNS) if pat.search(text)]
+
+
+def _legacy_is_role(title):
+    t = (title or '').lower()
+    return any(tok in t for tok in _LEGACY_ROLES)
+
+
+class Command(BaseCommand):
+    help = 'Benchmark the compiled skill/role matcher against the per-term loops it replaced.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--docs', type=int, default=2000, help='Descriptions to scan')
+        parser.add_argument('--words', type=int, default=1500, help='Words per description')
+
+    def handle(self, *args, **opts):
+        rnd = random.Random(11)
+        docs = [' '.join(rnd.choice(_WORDS) for _ in range(opts['words'])) for _ in range(opts['docs'])]
+        titles = [rnd.choice(_TITLES) for _ in range(opts['docs'] * 20)]
+        skill_matcher()  # compile outside the timed section
+
+        rows = [
+            ('job keywords (scraper)', _legacy_keywords, lambda d: extract_skills(d, strip_html=True), docs),
+            ('resume skills', _legacy_resume_skills, extract_skills, docs),
+            ('role filter', _legacy_is_role, is_role, titles),
+        ]
+        total_mb = sum(len(d) for d in docs) / 1e6
+        self.stdout.write(f"{opts['docs']} docs, {total_mb:.1f} MB of text")
+        for label, legacy, compiled, inputs in rows:
+            t_old = self._time(legacy, inputs)
+            t_new = self._time(compiled, inputs)
+            self.stdout.write(
+                f'{label:<24} legacy {len(inputs) / t_old:10.0f}/s   compiled {len(inputs) / t_new:10.0f}/s'
+                f'   x{t_old / t_new:.1f}'
+            )
+
+    @staticmethod
+    def _time(fn, inputs) -> float:
+        started = time.perf_counter()
+        for x in inputs:
+            fn(x)
+        return time.perf_counter() - started
@@ -0,0 +1,86 @@
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+# Runs in a fresh interpreter per sample, so every phase is measured cold
+_PROBE = r'''
+import json, os, sys, time
+t0 = time.perf_counter()
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'jobportal.settings')
+import django
+django.setup()
+t_setup = time.perf_counter()
+from jobportal.asgi import application
+t_asgi = time.perf_counter()
+
+from asgiref.sync import async_to_sync
+from asgiref.testing import ApplicationCommunicator
+
+async def get(path):
+    scope = {'type': 'http', 'asgi': {'version': '3.0'}, 'http_version': '1.1', 'method': 'GET',
+             'scheme': 'http', 'path': path, 'raw_path': path.encode(), 'query_string': b'',
+             'headers': [(b'host', b'localhost')], 'server': ('localhost', 80), 'client': ('127.0.0.1', 0)}
+    comm = ApplicationCommunicator(application, scope)
+    await comm.send_input({'type': 'http.request', 'body': b'', 'more_body': False})
+    start = await comm.receive_output(60)
+    while True:
+        msg = await comm.receive_output(60)
+        if not msg.get('more_body'):
+            break
+    return start['status']
+
+t_req = time.perf_counter()
+status = async_to_sync(get)(sys.argv[1])
+t_first = time.perf_counter()
+async_to_sync(get)(sys.argv[1])
+t_second = time.perf_counter()
+
+from resumes.matching import calculate_match_score
+calculate_match_score('python django developer', 'senior python engineer', 'django rest')
+t_match = time.perf_counter()
+print(json.dumps({
+    'django.setup()': t_setup - t0,
+    'ASGI app import': t_asgi - t_setup,
+    'first request': t_first - t_req,
+    'second request': t_second - t_first,
+    'first match score': t_match - t_second,
+    'status': status,
+}))
+'''
+
+
+class Command(BaseCommand):
+    help = ('Cold-start benchmark: `manage.py check` wall time, Django setup and ASGI app import time, '
+            'and first-request / first-match latency, each in a fresh interpreter.')
+
+    def add_arguments(self, parser):
+        parser.add_argument('--runs', type=int, default=5, help='Fresh processes per measurement')
+        parser.add_argument('--path', default='/api/jobs/0/', help='GET path for the first request')
+
+    def handle(self, *args, **opts):
+        env = dict(os.environ, DJANGO_SETTINGS_MODULE=os.environ.get('DJANGO_SETTINGS_MODULE', 'jobportal.settings'))
+        cwd = str(settings.BASE_DIR)
+        manage = []
+        for _ in range(opts['runs']):
+            started = time.perf_counter()
+            subprocess.run([sys.executable, 'manage.py', 'check'], cwd=cwd, env=env, check=True,
+                           stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+            manage.append(time.perf_counter() - started)
+
+        samples = []
+        for _ in range(opts['runs']):
+            out = subprocess.run([sys.executable, '-c', _PROBE, opts['path']], cwd=cwd, env=env, check=True,
+                                 capture_output=True, text=True).stdout
+            samples.append(json.loads(out.strip().splitlines()[-1]))
+
+        self.stdout.write(f"median of {opts['runs']} cold runs (first request: GET {opts['path']} "
+                          f"-> {samples[0]['status']})")
+        self.stdout.write(f"{'manage.py check (wall)':<24} {statistics.median(manage) * 1000:8.0f} ms")
+        for phase in [k for k in samples[0] if k != 'status']:
+            self.stdout.write(f'{phase:<24} {statistics.median(s[phase] for s in samples) * 1000:8.0f} ms')
@@ -0,0 +1,47 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from jobs.crawler import deep_crawl
+from jobs.scraper import PORTAL_SCRAPERS, save_scraped_jobs
+
+
+class Command(BaseCommand):
+    help = 'Deep-crawl portal listing pages concurrently and report throughput (jobs/second) per portal.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--keywords', '-k', default='software engineer', help='Search keywords')
+        parser.add_argument('--location', '-l', default='', help='Location text')
+        parser.add_argument('--country', default='India', help='Country hint')
+        parser.add_argument('--portals', default='', help=f'Comma-separated portals (default: all of {", ".join(PORTAL_SCRAPERS)})')
+        parser.add_argument('--max-pages', type=int, default=None, help='Max listing pages per portal')
+        parser.add_argument('--max-results', type=int, default=None, help='Stop a portal after this many unique jobs')
+        parser.add_argument('--per-host', type=int, default=None, help='Max concurrent requests per host')
+        parser.add_argument('--save', action='store_true', help='Upsert crawled jobs into the database')
+
+    def handle(self, *args, **opts):
+        portals = [p.strip() for p in opts['portals'].split(',') if p.strip()] or None
+        unknown = [p for p in portals or [] if p not in PORTAL_SCRAPERS]
+        if unknown:
+            raise CommandError(f'Unknown portal(s): {", ".join(unknown)}')
+
+        results = deep_crawl(
+            keywords=opts['keywords'],
+            location=opts['location'] or None,
+            country=opts['country'],
+            portals=portals,
+            max_pages=opts['max_pages'],
+            max_results=opts['max_results'],
+            per_host=opts['per_host'],
+        )
+
+        self.stdout.write(f'{"portal":<16}{"jobs":>7}{"pages":>7}{"seconds":>10}{"jobs/s":>9}  stop')
+        total_jobs = 0
+        for r in results:
+            n = len(r['jobs'])
+            total_jobs += n
+            rate = n / r['elapsed'] if r['elapsed'] else 0.0
+            self.stdout.write(f'{r["portal"]:<16}{n:>7}{r["pages"]:>7}{r["elapsed"]:>10.2f}{rate:>9.1f}  {r["stop_reason"]}')
+        self.stdout.write(self.style.SUCCESS(f'Crawled {total_jobs} unique jobs'))
+
+        if opts['save']:
+            saved = save_scraped_jobs([it for r in results for it in r['jobs']])
+            self.stdout.write(self.style.SUCCESS(f'Saved {saved} jobs'))
@@ -0,0 +1,26 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+# Resources preprocess_text needs; punkt_tab is what word_tokenize loads on NLTK >= 3.8.2
+RESOURCES = ('punkt', 'punkt_tab', 'stopwords')
+
+
+class Command(BaseCommand):
+    help = ('Download the NLTK tokenizer and stopword data into NLTK_DATA_DIR. Run once at deploy/build '
+            'time; the app itself never downloads and falls back to a regex tokenizer without them.')
+
+    def add_arguments(self, parser):
+        parser.add_argument('--dir', default=None, help='Target directory (default: settings.NLTK_DATA_DIR)')
+
+    def handle(self, *args, **opts):
+        try:
+            import nltk
+        except ImportError:
+            raise CommandError('nltk is not installed')
+        target = opts['dir'] or settings.NLTK_DATA_DIR
+        if not target:
+            raise CommandError('Set NLTK_DATA_DIR or pass --dir')
+        for resource in RESOURCES:
+            ok = nltk.download(resource, download_dir=target, quiet=True, raise_on_error=False)
+            self.stdout.write(f"{resource}: {'ok' if ok else 'failed'}")
+        self.stdout.write(self.style.SUCCESS(f'NLTK data in {target}'))
@@ -0,0 +1,16 @@
+from django.core.management.base import BaseCommand
+
+from jobs.enrichment import enrich_pending
+
+
+class Command(BaseCommand):
+    help = 'Fetch detail pages for stored jobs that have no description yet and persist description/requirements.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--limit', type=int, default=None, help='Max jobs to enrich (newest first)')
+        parser.add_argument('--workers', type=int, default=None, help='Concurrent detail-page fetches')
+        parser.add_argument('--retry-failed', action='store_true', help='Also retry jobs whose enrichment failed before')
+
+    def handle(self, *args, **opts):
+        counts = enrich_pending(limit=opts['limit'], workers=opts['workers'], include_failed=opts['retry_failed'])
+        self.stdout.write(self.style.SUCCESS(f"Enriched {counts['enriched']} jobs, {counts['failed']} failed"))
@@ -0,0 +1,30 @@
+import time
+from pathlib import Path
+
+from django.core.management.base import BaseCommand, CommandError
+
+from jobs.vector_index import NUMPY_AVAILABLE, JobVectorIndex, export_snapshot, snapshot_dir
+
+
+class Command(BaseCommand):
+    help = ('Export the job match index as a memory-mapped snapshot and atomically make it current; '
+            'workers map it on their next version check.')
+
+    def add_arguments(self, parser):
+        parser.add_argument('--dir', default=None, help="Snapshot directory (default: JOB_VECTOR_INDEX['SNAPSHOT_DIR'])")
+
+    def handle(self, *args, **opts):
+        if not NUMPY_AVAILABLE:
+            raise CommandError('numpy/scipy are required for the job vector index')
+        directory = Path(opts['dir']) if opts['dir'] else snapshot_dir()
+        if directory is None:
+            raise CommandError("Set JOB_INDEX_SNAPSHOT_DIR or pass --dir")
+        started = time.perf_counter()
+        path = export_snapshot(directory)
+        elapsed = time.perf_counter() - started
+        index = JobVectorIndex.open(path)
+        size = sum(f.stat().st_size for f in path.iterdir())
+        self.stdout.write(self.style.SUCCESS(
+            f'Exported v{index.version}: {index.documents} jobs, {len(index.vocabulary)} terms, '
+            f'{size / 1e6:.1f} MB to {path} in {elapsed:.1f}s'
+        ))
@@ -0,0 +1,32 @@
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from jobs.models import Job
+from jobs.reverse_matching import match_new_jobs
+
+
+class Command(BaseCommand):
+    help = ('Match recently stored jobs against every active resume (reverse matching): store each '
+            "user's best new matches as JobMatch rows and notify them.")
+
+    def add_arguments(self, parser):
+        parser.add_argument('--since-minutes', type=int, default=60, help='Match jobs saved in the last N minutes')
+        parser.add_argument('--jobs', default='', help='Comma-separated job ids (overrides --since-minutes)')
+        parser.add_argument('--threshold', type=float, default=None, help='Match score needed (default: settings)')
+        parser.add_argument('--top-n', type=int, default=None, help='New matches kept per user (default: settings)')
+        parser.add_argument('--chunk-size', type=int, default=None, help='Resumes per product chunk (default: settings)')
+        parser.add_argument('--dry-run', action='store_true', help='Score and report without storing or notifying')
+
+    def handle(self, *args, **opts):
+        if opts['jobs']:
+            job_ids = [int(x) for x in opts['jobs'].split(',') if x.strip()]
+        else:
+            since = timezone.now() - timedelta(minutes=opts['since_minutes'])
+            job_ids = list(Job.objects.filter(status='active', updated_at__gte=since).values_list('id', flat=True))
+        stats = match_new_jobs(job_ids, threshold=opts['threshold'], top_n=opts['top_n'],
+                               chunk_size=opts['chunk_size'], store=not opts['dry_run'])
+        self.stdout.write(self.style.SUCCESS(
+            f"Matched {stats['jobs']} jobs against {stats['resumes']} resumes in {stats['seconds']:.2f}s: "
+            f"{stats['matches']} new matches, {stats['users']} users notified"))
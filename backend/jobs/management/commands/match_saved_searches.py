@@ -0,0 +1,28 @@
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from jobs.models import Job
+from jobs.saved_searches import percolate_jobs
+
+
+class Command(BaseCommand):
+    help = ('Match recently stored jobs against the saved searches: store new matches as '
+            'SavedSearchMatch rows and notify their owners.')
+
+    def add_arguments(self, parser):
+        parser.add_argument('--since-minutes', type=int, default=60, help='Match jobs saved in the last N minutes')
+        parser.add_argument('--jobs', default='', help='Comma-separated job ids (overrides --since-minutes)')
+        parser.add_argument('--dry-run', action='store_true', help='Match and report without storing or notifying')
+
+    def handle(self, *args, **opts):
+        if opts['jobs']:
+            job_ids = [int(x) for x in opts['jobs'].split(',') if x.strip()]
+        else:
+            since = timezone.now() - timedelta(minutes=opts['since_minutes'])
+            job_ids = list(Job.objects.filter(status='active', updated_at__gte=since).values_list('id', flat=True))
+        stats = percolate_jobs(job_ids, store=not opts['dry_run'])
+        self.stdout.write(self.style.SUCCESS(
+            f"Matched {stats['jobs']} jobs against {stats['searches']} saved searches in {stats['seconds']:.2f}s "
+            f"({stats['checked']} checked): {stats['matches']} new matches, {stats['users']} users notified"))
@@ -0,0 +1,44 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from jobs import fulltext
+from jobs.models import Job
+from jobs.preferences import refresh_job_filters
+from resumes.matching import PREPROCESS_VERSION, normalize_job, normalize_resume, refresh_normalized
+from resumes.models import Resume
+
+
+class Command(BaseCommand):
+    help = ('Refresh the cached normalized text and skills of jobs and resumes preprocessed by an '
+            'older PREPROCESS_VERSION (or not at all, e.g. rows written with bulk_create).')
+
+    def add_arguments(self, parser):
+        parser.add_argument('--all', action='store_true',
+                            help='Recompute every row (e.g. after editing the skill taxonomy)')
+        parser.add_argument('--filters', action='store_true',
+                            help="Also recompute jobs' location keys and skills used by preference prefilters "
+                                 '(implied by --all)')
+        parser.add_argument('--search', action='store_true',
+                            help='Also rebuild the full-text job search index (implied by --all)')
+        parser.add_argument('--batch-size', type=int, default=500)
+
+    def handle(self, *args, **opts):
+        targets = [
+            ('jobs', Job, normalize_job, ['normalized_text', 'preprocess_version']),
+            ('resumes', Resume, normalize_resume, ['normalized_text', 'parsed_skills', 'preprocess_version']),
+        ]
+        for label, model, normalize, fields in targets:
+            started = time.perf_counter()
+            updated = refresh_normalized(model, normalize, fields, batch_size=opts['batch_size'], all_rows=opts['all'])
+            self.stdout.write(f'{label}: {updated} rows normalized (v{PREPROCESS_VERSION}) '
+                              f'in {time.perf_counter() - started:.1f}s')
+        if opts['all'] or opts['filters']:
+            started = time.perf_counter()
+            updated = refresh_job_filters(batch_size=opts['batch_size'])
+            self.stdout.write(f'jobs: {updated} location keys and skill sets refreshed '
+                              f'in {time.perf_counter() - started:.1f}s')
+        if (opts['all'] or opts['search']) and fulltext.backend():
+            started = time.perf_counter()
+            fulltext.rebuild()
+            self.stdout.write(f'jobs: {fulltext.backend()} search index rebuilt in {time.perf_counter() - started:.1f}s')
@@ -0,0 +1,22 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from jobs.vector_index import NUMPY_AVAILABLE, export_snapshot, get_index, rebuild_index, snapshot_dir
+
+
+class Command(BaseCommand):
+    help = ('Recompute all job vectors and document frequencies of the match index '
+            '(needed after bulk writes that bypass Job save signals, e.g. queryset.update()).')
+
+    def handle(self, *args, **opts):
+        started = time.perf_counter()
+        documents = rebuild_index()
+        self.stdout.write(f'Indexed {documents} active jobs in {time.perf_counter() - started:.1f}s')
+        if NUMPY_AVAILABLE and snapshot_dir() is not None:
+            self.stdout.write(f'Exported shared snapshot {export_snapshot().name}')
+        index = get_index()
+        if index is not None:
+            self.stdout.write(self.style.SUCCESS(
+                f'Snapshot v{index.version}: {index.documents} jobs, {len(index.vocabulary)} terms'
+            ))
@@ -0,0 +1,119 @@
+"""Match-result cache: a resume's ranking against the job index, reused across requests.
+
+Rankings are stored in MatchResult, one row per (resume, scope, mode, threshold, depth),
+and are valid for one resume text (`resume_digest` of Resume.normalized_text) at one
+corpus version. When the resume is unchanged but the corpus has moved on, the entry is
+merged forward instead of recomputed: jobs saved since the entry's snapshot was built
+are rescored against the current snapshot, jobs that left the index are dropped, and
+everything else keeps its cached score. The same happens at an unchanged corpus version
+when jobs were saved since the snapshot was built: title, location, salary and skill
+edits do not move the version but do change which jobs `where` admits. Unchanged jobs
+are not rescored under the new
+IDF weights; that drift is bounded by a full recompute after MATCH_CACHE_MAX_AGE seconds
+or when more than MATCH_CACHE_INCREMENTAL_MAX jobs changed.
+
+Entries keep twice the requested number of matches, so dropped jobs rarely leave a gap
+that only a full search can fill.
+"""
+import hashlib
+import logging
+from datetime import datetime, timezone as dt_timezone
+
+from django.db import IntegrityError
+from django.utils import timezone
+
+from .models import Job, MatchResult
+from .vector_index import JobVectorIndex, index_setting
+
+logger = logging.getLogger(__name__)
+
+
+def resume_digest(processed_resume: str) -> str:
+    return hashlib.sha1((processed_resume or '').encode('utf-8')).hexdigest()
+
+
+def queryset_scope(queryset) -> str:
+    """Cache scope for the jobs a queryset admits (its SQL, parameters included)."""
+    return 'qs:' + hashlib.sha1(str(queryset.query).encode('utf-8')).hexdigest()[:32]
+
+
+def _merge(entry: MatchResult, index: JobVectorIndex, processed_resume: str, threshold: float, k: int | None,
+           where, stats: dict) -> tuple[list[tuple[float, int]], bool] | None:
+    """The entry's ranking brought up to `index`, or None when a full search is needed."""
+    max_age = index_setting('MATCH_CACHE_MAX_AGE', 86400)
+    if max_age and (timezone.now() - entry.synced_at).total_seconds() > max_age:
+        return None
+    limit = index_setting('MATCH_CACHE_INCREMENTAL_MAX', 2000)
+    changed = set(Job.objects.filter(updated_at__gte=entry.synced_at).values_list('id', flat=True)[:limit + 1])
+    if len(changed) > limit:
+        return None
+
+    kept = [(score, job_id) for job_id, score in entry.results if job_id not in changed]
+    if kept:
+        # Deleted or deactivated jobs are no longer in the snapshot
+        present = set(index.job_ids[index.rows_for(sorted(job_id for _, job_id in kept))].tolist())
+        kept = [hit for hit in kept if hit[1] in present]
+    fresh = index.score_ids(processed_resume, changed) if changed else []
+    stats['scored'] = len(fresh)
+    fresh = [hit for hit in fresh if hit[0] >= threshold]
+    if fresh and where is not None:
+        allowed = where([job_id for _, job_id in fresh])
+        fresh = [hit for hit in fresh if hit[1] in allowed]
+    merged = sorted(kept + fresh, key=lambda hit: (-hit[0], hit[1]))
+    # Jobs below the cached depth may now belong in the top k
+    if entry.truncated and k is not None and len(merged) < k:
+        return None
+    depth = entry.depth or None
+    return merged[:depth], entry.truncated or (depth is not None and len(merged) > depth)
+
+
+def _store(resume, key: dict, digest: str, index: JobVectorIndex, ranked, truncated: bool):
+    try:
+        MatchResult.objects.update_or_create(**key, resume=resume, defaults={
+            'resume_digest': digest,
+            'corpus_version': index.version,
+            'synced_at': datetime.fromtimestamp(index.built_at, tz=dt_timezone.utc),
+            'truncated': truncated,
+            'results': [[job_id, score] for score, job_id in ranked],
+        })
+    except IntegrityError:
+        # A concurrent request stored the same entry first
+        pass
+    except Exception as e:
+        logger.error(f"Failed to cache matches for resume {resume.pk}: {e}")
+
+
+def cached_search(index: JobVectorIndex, resume, processed_resume: str, scope: str, k: int | None = None,
+                  threshold: float | None = None, where=None, mode: str | None = None, job_ids=None,
+                  stats: dict | None = None):
+    """index.search() for a stored resume through the match cache.
+    Returns ([(match_score, job_id)], outcome) with outcome 'hit', 'incremental', 'miss'
+    or 'off' (caching disabled). `scope` names the job set `where` (and `job_ids`, when
+    given) admits. `stats['scored']` is set to the number of jobs scored.
+    """
+    mode = mode or index_setting('MODE', 'bm25')
+    stats = stats if stats is not None else {}
+    stats['scored'] = 0
+    if not index_setting('MATCH_CACHE', True) or getattr(resume, 'pk', None) is None:
+        return index.search(resume.parsed_content, k=k, threshold=threshold, where=where, mode=mode,
+                            processed_resume=processed_resume, job_ids=job_ids, stats=stats), 'off'
+    threshold = float(threshold or 0.0)
+    key = {'scope': scope, 'mode': mode, 'threshold': threshold, 'depth': 2 * k if k else 0}
+    digest = resume_digest(processed_resume)
+
+    entry = MatchResult.objects.filter(resume=resume, **key).first()
+    if entry is not None and entry.resume_digest == digest:
+        # Saves that leave the indexed terms alone (title, prefilter columns) keep the version
+        if entry.corpus_version == index.version and \
+                not Job.objects.filter(updated_at__gte=entry.synced_at).exists():
+            return [(score, job_id) for job_id, score in entry.results[:k]], 'hit'
+        merged = _merge(entry, index, processed_resume, threshold, k, where, stats)
+        if merged is not None:
+            ranked, truncated = merged
+            _store(resume, key, digest, index, ranked, truncated)
+            return ranked[:k], 'incremental'
+
+    ranked = index.search(resume.parsed_content, k=key['depth'] or None, threshold=threshold, where=where, mode=mode,
+                          processed_resume=processed_resume, job_ids=job_ids, stats=stats)
+    _store(resume, key, digest, index, ranked, bool(key['depth']) and len(ranked) >= key['depth'])
+    return ranked[:k], 'miss'
@@ -0,0 +1,29 @@
+# Generated by Django 4.2.7 on 2026-10-19 05:21
+
+from django.db import migrations, models
+
+
+def mark_described_jobs_enriched(apps, schema_editor):
+    Job = apps.get_model('jobs', 'Job')
+    Job.objects.exclude(description='').update(enrichment_status='enriched')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jobs', '0002_job_source'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='job',
+            name='enriched_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='job',
+            name='enrichment_status',
+            field=models.CharField(choices=[('pending', 'Pending'), ('enriched', 'Enriched'), ('failed', 'Failed')], db_index=True, default='pending', max_length=10),
+        ),
+        migrations.RunPython(mark_described_jobs_enriched, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,51 @@
+# Generated by Django 4.2.7 on 2026-10-19 05:33
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+def build_job_vector_index(apps, schema_editor):
+    from jobs.vector_index import rebuild_index
+    rebuild_index(
+        job_model=apps.get_model('jobs', 'Job'),
+        vector_model=apps.get_model('jobs', 'JobVector'),
+        term_model=apps.get_model('jobs', 'TermStat'),
+        state_model=apps.get_model('jobs', 'CorpusState'),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jobs', '0003_job_enrichment_status'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CorpusState',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('version', models.PositiveBigIntegerField(default=0)),
+                ('documents', models.PositiveIntegerField(default=0)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+        ),
+        migrations.CreateModel(
+            name='JobVector',
+            fields=[
+                ('job', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='vector', serialize=False, to='jobs.job')),
+                ('terms', models.JSONField(default=dict)),
+                ('active', models.BooleanField(db_index=True, default=False)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+        ),
+        migrations.CreateModel(
+            name='TermStat',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('term', models.CharField(max_length=100, unique=True)),
+                ('df', models.PositiveIntegerField(default=0)),
+            ],
+        ),
+        migrations.RunPython(build_job_vector_index, migrations.RunPython.noop),
+    ]
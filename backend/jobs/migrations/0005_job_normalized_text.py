@@ -0,0 +1,29 @@
+# Generated by Django 4.2.7 on 2026-10-19 05:50
+
+from django.db import migrations, models
+
+
+def normalize_jobs(apps, schema_editor):
+    from resumes.matching import normalize_job, refresh_normalized
+    refresh_normalized(apps.get_model('jobs', 'Job'), normalize_job, ['normalized_text', 'preprocess_version'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jobs', '0004_job_vector_index'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='job',
+            name='normalized_text',
+            field=models.TextField(blank=True, default=''),
+        ),
+        migrations.AddField(
+            model_name='job',
+            name='preprocess_version',
+            field=models.PositiveSmallIntegerField(default=0),
+        ),
+        migrations.RunPython(normalize_jobs, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,35 @@
+# Generated by Django 4.2.7 on 2026-10-19 06:09
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('resumes', '0004_parsed_file'),
+        ('jobs', '0005_job_normalized_text'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='MatchResult',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('scope', models.CharField(max_length=64)),
+                ('mode', models.CharField(max_length=10)),
+                ('threshold', models.FloatField()),
+                ('depth', models.PositiveIntegerField(default=0)),
+                ('resume_digest', models.CharField(max_length=40)),
+                ('corpus_version', models.PositiveBigIntegerField()),
+                ('synced_at', models.DateTimeField()),
+                ('truncated', models.BooleanField(default=False)),
+                ('results', models.JSONField(default=list)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('resume', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='match_results', to='resumes.resume')),
+            ],
+            options={
+                'unique_together': {('resume', 'scope', 'mode', 'threshold', 'depth')},
+            },
+        ),
+    ]
@@ -0,0 +1,33 @@
+# Generated by Django 4.2.7 on 2026-10-19 06:14
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('resumes', '0004_parsed_file'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('jobs', '0006_match_result'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='JobMatch',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('match_score', models.FloatField()),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('job', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='matches', to='jobs.job')),
+                ('resume', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='job_matches', to='resumes.resume')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='job_matches', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'ordering': ['-created_at', '-match_score'],
+                'indexes': [models.Index(fields=['user', 'created_at'], name='jobs_jobmat_user_id_f76239_idx')],
+                'unique_together': {('user', 'job')},
+            },
+        ),
+    ]
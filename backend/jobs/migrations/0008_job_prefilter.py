@@ -0,0 +1,62 @@
+# Generated by Django 4.2.7 on 2026-10-19 06:23
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+def fill_job_filters(apps, schema_editor):
+    from jobs.preferences import refresh_job_filters
+    refresh_job_filters(apps.get_model('jobs', 'Job'), apps.get_model('jobs', 'JobSkill'))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jobs', '0007_job_match'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='JobSkill',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('skill', models.CharField(max_length=64)),
+            ],
+        ),
+        migrations.AddField(
+            model_name='job',
+            name='is_remote',
+            field=models.BooleanField(default=False),
+        ),
+        migrations.AddField(
+            model_name='job',
+            name='location_key',
+            field=models.CharField(blank=True, default='', max_length=100),
+        ),
+        migrations.AddIndex(
+            model_name='job',
+            index=models.Index(fields=['status', 'location_key'], name='jobs_job_status_98b5ae_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='job',
+            index=models.Index(fields=['status', 'is_remote'], name='jobs_job_status_8dab56_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='job',
+            index=models.Index(fields=['status', 'salary_max'], name='jobs_job_status_56a75e_idx'),
+        ),
+        migrations.AddField(
+            model_name='jobskill',
+            name='job',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='skills', to='jobs.job'),
+        ),
+        migrations.AddIndex(
+            model_name='jobskill',
+            index=models.Index(fields=['skill', 'job'], name='jobs_jobski_skill_23128b_idx'),
+        ),
+        migrations.AlterUniqueTogether(
+            name='jobskill',
+            unique_together={('job', 'skill')},
+        ),
+        migrations.RunPython(fill_job_filters, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 4.2.7 on 2026-10-19 06:51
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jobs', '0010_job_fulltext'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='job',
+            index=models.Index(fields=['status', 'created_at', 'id'], name='jobs_job_status_4fa895_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='jobapplication',
+            index=models.Index(fields=['user', 'applied_date', 'id'], name='jobs_jobapp_user_id_764e5c_idx'),
+        ),
+    ]
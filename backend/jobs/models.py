@@ -1,5 +1,7 @@
 from django.db import models
 from django.contrib.auth.models import User
+from django.db.models.signals import post_save, pre_delete, pre_save
+from django.dispatch import receiver
 from resumes.models import Resume
 
 class Company(models.Model):
@@ -31,6 +33,12 @@ class Job(models.Model):
         ('remote', 'Remote'),
     )
 
+    ENRICHMENT_CHOICES = (
+        ('pending', 'Pending'),
+        ('enriched', 'Enriched'),
+        ('failed', 'Failed'),
+    )
+
     title = models.CharField(max_length=100)
     company = models.ForeignKey(Company, on_delete=models.CASCADE, related_name='jobs')
     location = models.CharField(max_length=100)
@@ -43,12 +51,68 @@ class Job(models.Model):
     source = models.CharField(max_length=50, blank=True, default='')
     status = models.CharField(max_length=10, choices=STATUS_CHOICES, default='active')
     keywords = models.JSONField(default=list)
+    # preprocess_job_text(description, requirements), kept current on save for matching;
+    # ignored unless preprocess_version equals resumes.matching.PREPROCESS_VERSION
+    normalized_text = models.TextField(blank=True, default='')
+    preprocess_version = models.PositiveSmallIntegerField(default=0)
+    # Listing-only portals return no description; a background worker fetches the detail page
+    enrichment_status = models.CharField(max_length=10, choices=ENRICHMENT_CHOICES, default='pending', db_index=True)
+    enriched_at = models.DateTimeField(null=True, blank=True)
+    # Indexed prefilter columns derived from location/job_type on save (jobs/preferences.py)
+    location_key = models.CharField(max_length=100, blank=True, default='')
+    is_remote = models.BooleanField(default=False)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=['status', 'location_key']),
+            models.Index(fields=['status', 'is_remote']),
+            models.Index(fields=['status', 'salary_max']),
+            # Keyset pagination of the job listing (jobportal/pagination.py)
+            models.Index(fields=['status', 'created_at', 'id']),
+            # Jobs changed since a cached ranking was built (jobs/match_cache.py)
+            models.Index(fields=['updated_at']),
+        ]
+
     def __str__(self):
         return f"{self.title} at {self.company.name}"
 
+@receiver(pre_save, sender=Job)
+def mark_described_job_enriched(sender, instance: 'Job', **kwargs):
+    """Jobs saved with a description (ATS APIs, LinkedIn detail pages) need no enrichment."""
+    if instance.description and instance.enrichment_status == 'pending':
+        instance.enrichment_status = 'enriched'
+
+@receiver(pre_save, sender=Job)
+def set_job_location_key(sender, instance: 'Job', update_fields=None, raw=False, **kwargs):
+    """Keep the prefilter columns (location_key, is_remote) in step with location/job_type."""
+    if raw or (update_fields is not None and not {'location', 'job_type'} & set(update_fields)):
+        return
+    from .preferences import fill_location
+    fill_location(instance)
+    if update_fields is not None and not {'location_key', 'is_remote'} <= set(update_fields):
+        # save(update_fields=...) only writes the listed columns
+        sender.objects.filter(pk=instance.pk).update(location_key=instance.location_key, is_remote=instance.is_remote)
+
+# Columns normalize_job() fills
+_NORMALIZED_FIELDS = frozenset(('normalized_text', 'preprocess_version'))
+
+@receiver(pre_save, sender=Job)
+def normalize_job_text(sender, instance: 'Job', update_fields=None, raw=False, **kwargs):
+    """Cache the preprocessed description + requirements so matching never re-tokenizes."""
+    if raw or (update_fields is not None and not {'description', 'requirements'} & set(update_fields)):
+        return
+    from resumes.matching import PREPROCESS_VERSION, normalize_job
+    source = (instance.description, instance.requirements)
+    if instance.preprocess_version == PREPROCESS_VERSION and getattr(instance, '_normalized_from', None) == source:
+        return
+    normalize_job(instance)
+    if update_fields is not None and not _NORMALIZED_FIELDS <= set(update_fields):
+        # save(update_fields=...) only writes the listed columns
+        sender.objects.filter(pk=instance.pk).update(
+            normalized_text=instance.normalized_text, preprocess_version=instance.preprocess_version)
+
 class JobApplication(models.Model):
     STATUS_CHOICES = (
         ('applied', 'Applied'),
@@ -69,5 +133,166 @@ class JobApplication(models.Model):
     match_score = models.FloatField(default=0.0)
     notes = models.TextField(blank=True, null=True)
 
+    class Meta:
+        # Keyset pagination of a user's applications
+        indexes = [models.Index(fields=['user', 'applied_date', 'id'])]
+
+    def __str__(self):
+        return f"{self.user.username} - {self.job.title} ({self.status})"
+
+class TermStat(models.Model):
+    """Document frequency of a term across active jobs (the IDF statistics of the match index)."""
+    term = models.CharField(max_length=100, unique=True)
+    df = models.PositiveIntegerField(default=0)
+
+    def __str__(self):
+        return f"{self.term} ({self.df})"
+
+class JobVector(models.Model):
+    """Raw term counts of a job's preprocessed description + requirements.
+    IDF weighting is applied when the index snapshot is loaded, so stored vectors stay
+    valid as document frequencies change.
+    """
+    job = models.OneToOneField(Job, on_delete=models.CASCADE, primary_key=True, related_name='vector')
+    terms = models.JSONField(default=dict)
+    active = models.BooleanField(default=False, db_index=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"Vector for job {self.job_id}"
+
+class CorpusState(models.Model):
+    """Single row; `version` is bumped on every index change so workers know to reload."""
+    version = models.PositiveBigIntegerField(default=0)
+    documents = models.PositiveIntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"Corpus v{self.version} ({self.documents} jobs)"
+
+# Fields that change a job's vector or whether it counts in the corpus
+_INDEXED_FIELDS = frozenset(('description', 'requirements', 'status'))
+
+@receiver(post_save, sender=Job)
+def update_job_vector(sender, instance: 'Job', update_fields=None, raw=False, **kwargs):
+    if raw or (update_fields is not None and not _INDEXED_FIELDS & set(update_fields)):
+        return
+    from .vector_index import index_job
+    index_job(instance)
+
+# Fields job skills are extracted from
+_SKILL_FIELDS = frozenset(('title', 'description', 'requirements'))
+
+@receiver(post_save, sender=Job)
+def update_job_skills(sender, instance: 'Job', update_fields=None, raw=False, **kwargs):
+    if raw or (update_fields is not None and not _SKILL_FIELDS & set(update_fields)):
+        return
+    from .preferences import sync_job_skills
+    sync_job_skills([instance])
+
+@receiver(pre_delete, sender=Job)
+def remove_job_vector(sender, instance: 'Job', **kwargs):
+    from .vector_index import unindex_job
+    unindex_job(instance.pk)
+
+class JobSkill(models.Model):
+    """Canonical skill (skill taxonomy) mentioned by a job, for indexed skill prefilters."""
+    job = models.ForeignKey(Job, on_delete=models.CASCADE, related_name='skills')
+    skill = models.CharField(max_length=64)
+
+    class Meta:
+        unique_together = ('job', 'skill')
+        indexes = [models.Index(fields=['skill', 'job'])]
+
+    def __str__(self):
+        return f"{self.skill} ({self.job_id})"
+
+class MatchResult(models.Model):
+    """Cached ranking of one resume against the job index (see jobs/match_cache.py).
+    One row per (resume, scope, mode, threshold, depth); valid for the resume text with
+    digest `resume_digest` at corpus version `corpus_version`, and merged forward
+    incrementally when only some jobs changed since `synced_at`.
+    """
+    resume = models.ForeignKey(Resume, on_delete=models.CASCADE, related_name='match_results')
+    # Which jobs may match (e.g. a queryset fingerprint or 'roles'), and how candidates were selected
+    scope = models.CharField(max_length=64)
+    mode = models.CharField(max_length=10)
+    threshold = models.FloatField()
+    # Matches kept (0 = all above threshold)
+    depth = models.PositiveIntegerField(default=0)
+    resume_digest = models.CharField(max_length=40)
+    corpus_version = models.PositiveBigIntegerField()
+    # built_at of the snapshot the ranking reflects; jobs updated since then are rescored
+    synced_at = models.DateTimeField()
+    # More matches existed beyond `depth` when the ranking was computed
+    truncated = models.BooleanField(default=False)
+    # [[job_id, match_score], ...], best first
+    results = models.JSONField(default=list)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        unique_together = ('resume', 'scope', 'mode', 'threshold', 'depth')
+
+    def __str__(self):
+        return f"Matches for resume {self.resume_id} ({self.scope}, v{self.corpus_version})"
+
+class JobMatch(models.Model):
+    """A newly ingested job that scored well against one of the user's resumes (see
+    jobs/reverse_matching.py). One row per (user, job), so a job is announced once.
+    """
+    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='job_matches')
+    job = models.ForeignKey(Job, on_delete=models.CASCADE, related_name='matches')
+    resume = models.ForeignKey(Resume, on_delete=models.CASCADE, related_name='job_matches')
+    match_score = models.FloatField()
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        unique_together = ('user', 'job')
+        indexes = [models.Index(fields=['user', 'created_at'])]
+        ordering = ['-created_at', '-match_score']
+
+    def __str__(self):
+        return f"{self.user.username} - {self.job.title} ({self.match_score:.0f}%)"
+
+class SavedSearch(models.Model):
+    """A live-search query the user wants new jobs for (see jobs/saved_searches.py).
+    Newly ingested jobs containing every query term, in the search's location, are
+    announced once per (search, job) as SavedSearchMatch rows.
+    """
+    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='saved_searches')
+    query = models.CharField(max_length=255)
+    location = models.CharField(max_length=100, blank=True, default='')
+    # Preprocessed query terms and normalized location, derived from query/location on save
+    terms = models.JSONField(default=list)
+    location_key = models.CharField(max_length=100, blank=True, default='')
+    is_active = models.BooleanField(default=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        unique_together = ('user', 'query', 'location')
+        indexes = [models.Index(fields=['is_active', 'updated_at'])]
+        ordering = ['-created_at']
+
+    def __str__(self):
+        return f"{self.user.username}: {self.query}" + (f" in {self.location}" if self.location else '')
+
+@receiver(pre_save, sender=SavedSearch)
+def set_saved_search_terms(sender, instance: 'SavedSearch', raw=False, **kwargs):
+    if raw:
+        return
+    from .saved_searches import fill_search_terms
+    fill_search_terms(instance)
+
+class SavedSearchMatch(models.Model):
+    """A newly ingested job that matched a saved search; one row per (search, job)."""
+    search = models.ForeignKey(SavedSearch, on_delete=models.CASCADE, related_name='matches')
+    job = models.ForeignKey(Job, on_delete=models.CASCADE, related_name='saved_search_matches')
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        unique_together = ('search', 'job')
+        ordering = ['-created_at']
+
     def __str__(self):
-        return f"{self.user.username} - {self.job.title} ({self.status})"
\ No newline at end of file
+        return f"{self.search} - {self.job.title}"
@@ -0,0 +1,94 @@
+"""HTML parse stage for scraped listing pages.
+
+BeautifulSoup parsing is pure Python and holds the GIL, so parsing pages on the fetch
+threads serializes on one core. When settings.JOB_PARSE_PROCESSES > 0, raw HTML bytes
+are shipped to a process pool instead and compact JobRecord tuples come back.
+"""
+import atexit
+import logging
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from concurrent.futures.process import BrokenProcessPool
+
+from django.conf import settings
+
+from .records import JobRecord
+
+logger = logging.getLogger(__name__)
+
+_POOL: ProcessPoolExecutor | None = None
+_POOL_LOCK = threading.Lock()
+
+
+def _init_worker():
+    # Spawned workers (macOS/Windows) start without Django configured
+    import django
+    from django.apps import apps
+    if not apps.ready:
+        os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'jobportal.settings')
+        django.setup()
+
+
+def parse_page_inline(kind: str, html, base_url: str = '') -> list[JobRecord]:
+    """Parse a page in the current thread. `kind` is a portal name or 'company'."""
+    if kind == 'company':
+        from .ats import parse_career_page
+        return parse_career_page(html, base_url)
+    from .scraper import PORTAL_SCRAPERS
+    return PORTAL_SCRAPERS[kind][0](None).parse_listing(html)
+
+
+def _parse_worker(kind: str, html: bytes, base_url: str) -> list[tuple]:
+    return [rec.as_tuple() for rec in parse_page_inline(kind, html, base_url)]
+
+
+def get_parse_pool() -> ProcessPoolExecutor | None:
+    """Return the shared parse pool, or None when process parsing is disabled."""
+    global _POOL
+    workers = int(getattr(settings, 'JOB_PARSE_PROCESSES', 0) or 0)
+    if workers <= 0:
+        return None
+    with _POOL_LOCK:
+        if _POOL is None:
+            _POOL = ProcessPoolExecutor(max_workers=workers, initializer=_init_worker)
+        return _POOL
+
+
+def shutdown_parse_pool():
+    global _POOL
+    with _POOL_LOCK:
+        if _POOL is not None:
+            _POOL.shutdown(wait=False, cancel_futures=True)
+            _POOL = None
+
+
+atexit.register(shutdown_parse_pool)
+
+
+def parse_html(kind: str, html, base_url: str = '') -> list[JobRecord]:
+    """Parse a listing/careers page, in the process pool when enabled.
+
+    Blocks the calling (fetch) thread until the worker returns, which releases the GIL
+    for other fetch threads while the page is parsed on another core. A page that takes
+    longer than settings.JOB_PARSE_TIMEOUT seconds is skipped (no records).
+    """
+    pool = get_parse_pool()
+    if pool is None:
+        return parse_page_inline(kind, html, base_url)
+    if isinstance(html, str):
+        html = html.encode('utf-8')
+    future = pool.submit(_parse_worker, kind, html, base_url)
+    try:
+        rows = future.result(timeout=int(getattr(settings, 'JOB_PARSE_TIMEOUT', 30) or 30))
+    except FutureTimeoutError:
+        # Parsing it in this thread would block just as long; the worker finishes it on its own
+        future.cancel()
+        logger.error(f"Parsing {kind} page {base_url} timed out; skipped")
+        return []
+    except BrokenProcessPool:
+        logger.error("Parse pool broke; falling back to in-thread parsing")
+        shutdown_parse_pool()
+        return parse_page_inline(kind, html, base_url)
+    return [JobRecord.from_tuple(row) for row in rows]
@@ -0,0 +1,179 @@
+"""Streaming stages for the ingestion and search path.
+
+fetch -> parse -> normalize -> filter -> dedupe -> score -> top-k are composed as
+generators. Concurrent stages (`ConcurrentSource`, `buffered`) hand items over through
+bounded queues, so a slow consumer blocks producers (backpressure) and peak memory is
+bounded by the queue sizes rather than by the total number of scraped jobs.
+"""
+import heapq
+import itertools
+import logging
+import queue
+import threading
+import time
+from typing import Callable, Iterable, Iterator
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_QUEUE_SIZE = 256
+
+_DONE = object()
+
+
+def _put(q: queue.Queue, item, stop: threading.Event) -> bool:
+    """Blocking put that gives up once the consumer has gone away."""
+    while not stop.is_set():
+        try:
+            q.put(item, timeout=0.1)
+            return True
+        except queue.Full:
+            continue
+    return False
+
+
+class ConcurrentSource:
+    """Runs producer callables on threads and yields their items as they arrive.
+
+    Each producer returns an iterable (list or generator) of items. Producers start as
+    soon as the source is created, so callers can do other work (e.g. score DB rows)
+    while fetching is in flight. Items are handed over through a queue of `maxsize`;
+    when the consumer falls behind, producers block. Iteration ends when all producers
+    finish or `timeout` seconds elapse; closing the source stops the producers.
+    """
+
+    def __init__(self, producers: Iterable[Callable[[], Iterable]], maxsize: int = DEFAULT_QUEUE_SIZE,
+                 timeout: float | None = None, name: str = 'pipeline'):
+        self._producers = list(producers)
+        self._queue: queue.Queue = queue.Queue(maxsize=maxsize)
+        self._stop = threading.Event()
+        self._deadline = time.monotonic() + timeout if timeout else None
+        self._threads = [
+            threading.Thread(target=self._run, args=(fn,), name=f'{name}-{i}', daemon=True)
+            for i, fn in enumerate(self._producers)
+        ]
+        for t in self._threads:
+            t.start()
+
+    def _run(self, fn):
+        try:
+            for item in fn() or ():
+                if not _put(self._queue, item, self._stop):
+                    return
+        except Exception as e:
+            logger.error(f"Pipeline producer failed: {e}")
+        finally:
+            _put(self._queue, _DONE, self._stop)
+
+    def __iter__(self) -> Iterator:
+        remaining = len(self._threads)
+        try:
+            while remaining:
+                wait = None
+                if self._deadline is not None:
+                    wait = self._deadline - time.monotonic()
+                    if wait <= 0:
+                        logger.warning(f"Pipeline source timed out with {remaining} producer(s) running")
+                        return
+                try:
+                    item = self._queue.get(timeout=wait)
+                except queue.Empty:
+                    continue
+                if item is _DONE:
+                    remaining -= 1
+                    continue
+                yield item
+        finally:
+            self.close()
+
+    def close(self):
+        self._stop.set()
+
+
+def fan_out(fn: Callable[[object], Iterable], inputs: Iterable, workers: int = 8,
+            maxsize: int = DEFAULT_QUEUE_SIZE, timeout: float | None = None, name: str = 'fan-out') -> ConcurrentSource:
+    """Apply `fn` (returning an iterable of items) to each input on `workers` threads and
+    stream the combined items. Inputs are pulled lazily, so at most `workers` are in flight.
+    """
+    inputs = iter(inputs)
+    lock = threading.Lock()
+
+    def worker():
+        while True:
+            with lock:
+                arg = next(inputs, _DONE)
+            if arg is _DONE:
+                return
+            try:
+                out = fn(arg)
+            except Exception as e:
+                logger.error(f"{name} worker failed: {e}")
+                continue
+            yield from out or ()
+
+    return ConcurrentSource([worker] * max(1, workers), maxsize=maxsize, timeout=timeout, name=name)
+
+
+def buffered(items: Iterable, maxsize: int = DEFAULT_QUEUE_SIZE) -> Iterator:
+    """Run an upstream stage on its own thread, decoupled from the consumer by a bounded queue."""
+    return iter(ConcurrentSource([lambda: items], maxsize=maxsize, name='pipeline-stage'))
+
+
+def flatten(batches: Iterable[Iterable]) -> Iterator:
+    for batch in batches:
+        yield from batch or ()
+
+
+def batched(items: Iterable, size: int) -> Iterator[list]:
+    it = iter(items)
+    while batch := list(itertools.islice(it, size)):
+        yield batch
+
+
+def normalize(items: Iterable, source: str | None = None) -> Iterator:
+    """Drop records without a URL and fill in a missing source."""
+    for it in items:
+        if not it.get('application_url'):
+            continue
+        if source and not it.get('source'):
+            it['source'] = source
+        yield it
+
+
+def filter_roles(items: Iterable, role_ok: Callable[[str], bool]) -> Iterator:
+    for it in items:
+        if role_ok(it.get('title')):
+            yield it
+
+
+def dedupe(items: Iterable, key: str = 'application_url') -> Iterator:
+    seen = set()
+    for it in items:
+        k = it.get(key)
+        if not k or k in seen:
+            continue
+        seen.add(k)
+        yield it
+
+
+def score(items: Iterable, scorer: Callable[[object], float]) -> Iterator[tuple[float, object]]:
+    for it in items:
+        try:
+            s = scorer(it)
+        except Exception:
+            s = 0.0
+        yield s, it
+
+
+def top_k(scored: Iterable[tuple[float, object]], k: int, threshold: float | None = None) -> list[tuple[float, object]]:
+    """Keep the k best (score, item) pairs in a bounded heap; returns them best first."""
+    heap: list[tuple[float, int, object]] = []
+    counter = itertools.count()
+    for s, it in scored:
+        if threshold is not None and s < threshold:
+            continue
+        entry = (s, next(counter), it)
+        if len(heap) < k:
+            heapq.heappush(heap, entry)
+        elif s > heap[0][0]:
+            heapq.heapreplace(heap, entry)
+    return [(s, it) for s, _, it in sorted(heap, key=lambda e: (-e[0], e[1]))]
@@ -0,0 +1,150 @@
+"""Job preferences as indexed DB predicates, applied before any text scoring.
+
+A JobPreference narrows the jobs a resume is matched against:
+  remote_only  -> is_remote
+  locations    -> location_key IN (normalized locations), or remote
+  min_salary   -> salary_max (or salary_min) >= min_salary; jobs that state no pay are kept,
+                  since most listings do not
+  skills       -> the job mentions at least one of them (JobSkill rows)
+job_titles are left to scoring and the role filter. location_key/is_remote are filled by
+a Job pre_save receiver and JobSkill rows by a post_save receiver (and in bulk by
+jobs.auto_apply); `python manage.py normalize_texts --filters` recomputes them.
+"""
+import re
+
+from django.db.models import Q
+
+from .models import Job, JobSkill
+from .pipeline import batched
+from .skills import extract_skills
+
+# Spellings that name the same city
+LOCATION_ALIASES = {
+    'bengaluru': 'bangalore',
+    'gurugram': 'gurgaon',
+    'bombay': 'mumbai',
+    'new delhi': 'delhi',
+    'madras': 'chennai',
+    'calcutta': 'kolkata',
+    'trivandrum': 'thiruvananthapuram',
+}
+
+_REMOTE = re.compile(r'\b(remote|work from home|wfh|anywhere)\b', re.IGNORECASE)
+_PARENTHESES = re.compile(r'\([^)]*\)')
+_SEPARATORS = re.compile(r'[,;/|]')
+_NON_WORD = re.compile(r'[^\w\s]+')
+_SPACES = re.compile(r'\s+')
+
+MAX_SKILL_LENGTH = 64
+
+
+def normalize_location(text: str) -> str:
+    """City-level key of a location string: "Bengaluru, Karnataka, India" -> "bangalore"."""
+    text = _PARENTHESES.sub(' ', (text or '').lower())
+    for part in _SEPARATORS.split(text):
+        part = _SPACES.sub(' ', _NON_WORD.sub(' ', part)).strip()
+        if part:
+            return LOCATION_ALIASES.get(part, part)[:100]
+    return ''
+
+
+def is_remote_job(location: str, job_type: str = '') -> bool:
+    return job_type == 'remote' or bool(_REMOTE.search(location or ''))
+
+
+def fill_location(job):
+    """Set a Job's location_key and is_remote from its location and job_type."""
+    job.location_key = normalize_location(job.location)
+    job.is_remote = is_remote_job(job.location, job.job_type)
+
+
+def job_skills(title: str, description: str, requirements: str) -> set[str]:
+    text = f"{title or ''}\n{description or ''}\n{requirements or ''}"
+    return {s[:MAX_SKILL_LENGTH] for s in extract_skills(text, strip_html=True)}
+
+
+def sync_job_skills(jobs, skill_model=JobSkill):
+    """Replace the JobSkill rows of saved jobs with the skills their text mentions."""
+    jobs = [job for job in jobs if job.pk is not None]
+    for batch in batched(jobs, 500):
+        skill_model.objects.filter(job_id__in=[job.pk for job in batch]).delete()
+        skill_model.objects.bulk_create([
+            skill_model(job_id=job.pk, skill=skill)
+            for job in batch for skill in sorted(job_skills(job.title, job.description, job.requirements))
+        ], ignore_conflicts=True)
+
+
+def refresh_job_filters(job_model=Job, skill_model=JobSkill, batch_size: int = 500) -> int:
+    """Recompute location_key/is_remote and the JobSkill rows of every job (after a
+    skill taxonomy edit, or for rows written before they existed). Model classes are
+    parameters so migrations can pass historical models. Returns the number of jobs.
+    """
+    updated = 0
+    for batch in batched(job_model.objects.order_by('pk').iterator(chunk_size=batch_size), batch_size):
+        for job in batch:
+            fill_location(job)
+        job_model.objects.bulk_update(batch, ['location_key', 'is_remote'])
+        sync_job_skills(batch, skill_model)
+        updated += len(batch)
+    return updated
+
+
+class PreferenceFilter:
+    """The predicates of one JobPreference, as a Q for stored jobs and as a check for
+    live search results that are not stored.
+    """
+
+    def __init__(self, preference):
+        self.remote_only = bool(preference.remote_only)
+        self.locations = sorted({k for k in map(normalize_location, preference.locations or []) if k})
+        self.min_salary = preference.min_salary or None
+        wanted = [s for s in preference.skills or [] if isinstance(s, str) and s.strip()]
+        # Canonical names, so "golang" finds jobs stored with "go"
+        self.skills = sorted(set(extract_skills(', '.join(wanted))) or {s.strip().lower() for s in wanted})
+
+    @property
+    def applied(self) -> list[str]:
+        """Names of the predicates in effect, e.g. ['location', 'skills']."""
+        return [name for name, on in (
+            ('remote', self.remote_only),
+            ('location', self.locations and not self.remote_only),
+            ('salary', self.min_salary),
+            ('skills', self.skills),
+        ) if on]
+
+    def q(self) -> Q:
+        q = Q()
+        if self.remote_only:
+            q &= Q(is_remote=True)
+        elif self.locations:
+            q &= Q(location_key__in=self.locations) | Q(is_remote=True)
+        if self.min_salary:
+            q &= (Q(salary_max__gte=self.min_salary)
+                  | Q(salary_max__isnull=True, salary_min__gte=self.min_salary)
+                  | Q(salary_max__isnull=True, salary_min__isnull=True))
+        if self.skills:
+            q &= Q(id__in=JobSkill.objects.filter(skill__in=self.skills).values('job_id'))
+        return q
+
+    def accepts(self, record) -> bool:
+        """The same predicates for a scraped JobRecord."""
+        remote = is_remote_job(record.location, record.job_type)
+        if self.remote_only and not remote:
+            return False
+        if self.locations and not self.remote_only and not remote \
+                and normalize_location(record.location) not in self.locations:
+            return False
+        if self.min_salary:
+            top = record.salary_max if record.salary_max is not None else record.salary_min
+            if top is not None and top < self.min_salary:
+                return False
+        if self.skills and not job_skills(record.title, record.description, record.requirements) & set(self.skills):
+            return False
+        return True
+
+
+def preference_for(resume):
+    """The most recently updated JobPreference of the resume, else of its owner, or None."""
+    from resumes.models import JobPreference
+    return (JobPreference.objects.filter(resume=resume).order_by('-updated_at').first()
+            or JobPreference.objects.filter(user_id=resume.user_id).order_by('-updated_at').first())
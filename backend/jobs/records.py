@@ -0,0 +1,140 @@
+import sys
+
+
+class JobRecord:
+    """Compact scraped-job value passed through the scrape -> filter -> dedupe -> score pipeline.
+
+    Slotted (no per-instance __dict__), keywords stored as a tuple and the low-cardinality
+    enum fields (`job_type`, `source`) interned so thousands of records share one string
+    per value. Supports the read/write mapping protocol the pipeline used on plain dicts
+    (`rec['title']`, `rec.get('source')`, `rec['source'] = ...`), so callers that only
+    need a few fields work unchanged.
+    """
+
+    __slots__ = (
+        'title', 'company_name', 'location', 'job_type', 'description', 'requirements',
+        'salary_min', 'salary_max', 'application_url', 'keywords', 'source',
+    )
+    FIELDS = __slots__
+    _INTERNED = frozenset(('job_type', 'source'))
+
+    def __init__(self, title='', company_name='', location='', job_type='full_time', description='',
+                 requirements='', salary_min=None, salary_max=None, application_url='', keywords=(),
+                 source=''):
+        self.title = title or ''
+        self.company_name = company_name or ''
+        self.location = location or ''
+        self.job_type = sys.intern(job_type or 'full_time')
+        self.description = description or ''
+        self.requirements = requirements or ''
+        self.salary_min = salary_min
+        self.salary_max = salary_max
+        self.application_url = application_url or ''
+        self.keywords = tuple(keywords or ())
+        self.source = sys.intern(source or '')
+
+    # ---- construction ----
+
+    @classmethod
+    def from_tuple(cls, row: tuple) -> 'JobRecord':
+        return cls(*row)
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'JobRecord':
+        return cls(**{f: data.get(f) for f in cls.FIELDS if data.get(f) is not None})
+
+    @classmethod
+    def coerce(cls, item) -> 'JobRecord':
+        return item if isinstance(item, cls) else cls.from_dict(item)
+
+    # ---- mapping protocol ----
+
+    def __getitem__(self, key):
+        try:
+            return getattr(self, key)
+        except (AttributeError, TypeError):
+            raise KeyError(key) from None
+
+    def __setitem__(self, key, value):
+        if key not in self.FIELDS:
+            raise KeyError(key)
+        if key in self._INTERNED:
+            value = sys.intern(value or '')
+        elif key == 'keywords':
+            value = tuple(value or ())
+        setattr(self, key, value)
+
+    def __contains__(self, key):
+        return key in self.FIELDS
+
+    def get(self, key, default=None):
+        value = getattr(self, key, None) if key in self.FIELDS else None
+        return default if value is None else value
+
+    def keys(self):
+        return self.FIELDS
+
+    # ---- conversion ----
+
+    def as_tuple(self) -> tuple:
+        """Positional form in FIELDS order (used to ship records between processes)."""
+        return (self.title, self.company_name, self.location, self.job_type, self.description,
+                self.requirements, self.salary_min, self.salary_max, self.application_url,
+                self.keywords, self.source)
+
+    def to_api(self) -> dict:
+        """Response dictionary for the API layer. Scalar values are shared; keywords is a new
+        list, so a response never mutates a record held in the search cache."""
+        return {
+            'title': self.title,
+            'company_name': self.company_name,
+            'location': self.location,
+            'job_type': self.job_type,
+            'description': self.description,
+            'requirements': self.requirements,
+            'salary_min': self.salary_min,
+            'salary_max': self.salary_max,
+            'application_url': self.application_url,
+            'keywords': list(self.keywords),
+            'source': self.source,
+        }
+
+    def orm_defaults(self) -> dict:
+        """Job.update_or_create() defaults.
+        Empty description/requirements are left out so a listing-only re-scrape never wipes
+        text that background enrichment already fetched.
+        """
+        defaults = {
+            'location': self.location,
+            'job_type': self.job_type,
+            'salary_min': self.salary_min,
+            'salary_max': self.salary_max,
+            'keywords': list(self.keywords),
+            'source': self.source,
+            'status': 'active',
+        }
+        if self.description:
+            defaults['description'] = self.description
+        if self.requirements:
+            defaults['requirements'] = self.requirements
+        return defaults
+
+    def to_job(self, company):
+        """Unsaved Job instance for bulk_create()."""
+        from .models import Job
+        return Job(title=self.title, company=company, application_url=self.application_url, **self.orm_defaults())
+
+    def __getstate__(self):
+        return self.as_tuple()
+
+    def __setstate__(self, state):
+        # Re-runs __init__ so enum fields are interned in the receiving process
+        self.__init__(*state)
+
+    def __eq__(self, other):
+        return isinstance(other, JobRecord) and self.as_tuple() == other.as_tuple()
+
+    __hash__ = None
+
+    def __repr__(self):
+        return f"JobRecord(title={self.title!r}, company_name={self.company_name!r}, source={self.source!r})"
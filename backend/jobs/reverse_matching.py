@@ -0,0 +1,460 @@
+"""Reverse matching: score newly ingested jobs against every active resume at once.
+
+Ingest paths queue the ids of the jobs they stored (`enqueue_new_jobs`); one background
+thread drains the queue and matches everything queued as a single batch. Scores are the
+TF-IDF cosine `JobVectorIndex.search` computes, weighted with the current snapshot's IDF,
+but evaluated as one sparse matrix-matrix product R @ J.T: J holds the new jobs and R
+every active resume, restricted to the terms those jobs contain (resume norms still use
+all of their terms). R is built and multiplied CHUNK_SIZE resumes at a time, so memory is
+bounded by CHUNK_SIZE x len(jobs) scores however many resumes there are.
+
+Each user keeps the TOP_N best new jobs scoring at least THRESHOLD over all of their
+resumes, minus jobs they were already matched with or applied to. They are stored as
+JobMatch rows and announced with one notification per user, bulk-created and pushed with
+`push_notifications_ws`.
+
+Resume term counts are cached per process (`ResumeTerms`) and refreshed from the rows
+updated since the previous run, so resumes are not re-tokenized on every ingest.
+
+The same queue feeds saved-search percolation (jobs/saved_searches.py).
+"""
+import itertools
+import logging
+import math
+import threading
+import time
+from collections import Counter, defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.db import close_old_connections, transaction
+from django.utils import timezone
+
+from resumes.matching import PREPROCESS_VERSION, preprocess_text, split_tokens
+from resumes.models import Resume
+
+from .models import Job, JobApplication, JobMatch, JobVector, TermStat
+from .pipeline import batched
+from .saved_searches import percolate_jobs, saved_search_setting
+from .vector_index import NUMPY_AVAILABLE, JobVectorIndex, get_index, match_threshold, np, sparse
+
+logger = logging.getLogger(__name__)
+
+
+def _reverse_setting(name: str, default):
+    return (getattr(settings, 'JOB_REVERSE_MATCHING', None) or {}).get(name, default)
+
+
+def _pair_keys(users, jobs) -> 'np.ndarray':
+    return users.astype(np.int64) << 32 | jobs.astype(np.int64)
+
+
+class ResumeTerms:
+    """Term counts of the active resumes, kept in memory and refreshed incrementally.
+    Terms are numbered locally in order of first appearance.
+    """
+
+    def __init__(self):
+        self.terms: dict[str, int] = {}
+        # resume id -> (user id, local columns, counts)
+        self.rows: dict[int, tuple[int, 'np.ndarray', 'np.ndarray']] = {}
+        self.synced_at = None
+        # (index version, IDF per local column)
+        self._idf: tuple[int, 'np.ndarray'] | None = None
+        self.lock = threading.Lock()
+
+    def _counts(self, text: str):
+        counts = Counter(split_tokens(text))
+        columns = np.fromiter((self.terms.setdefault(t, len(self.terms)) for t in counts), dtype=np.int32,
+                              count=len(counts))
+        return columns, np.fromiter(counts.values(), dtype=np.float32, count=len(counts))
+
+    def add(self, resume_id: int, user_id: int, processed: str):
+        columns, counts = self._counts(processed)
+        if len(columns):
+            self.rows[resume_id] = (user_id, columns, counts)
+        else:
+            self.rows.pop(resume_id, None)
+
+    def sync(self) -> int:
+        """Read the resumes saved since the last sync. Returns how many were read."""
+        started = timezone.now()
+        resumes = Resume.objects.filter(is_active=True)
+        if self.synced_at is not None:
+            resumes = resumes.filter(updated_at__gte=self.synced_at)
+        read = 0
+        for resume_id, user_id, text, version, content in resumes.values_list(
+                'id', 'user_id', 'normalized_text', 'preprocess_version', 'parsed_content').iterator(chunk_size=2000):
+            if version != PREPROCESS_VERSION:
+                text = preprocess_text(content or '')
+            self.add(resume_id, user_id, text or '')
+            read += 1
+        if self.synced_at is not None:
+            # Deleted or deactivated since the last sync
+            active = set(Resume.objects.filter(is_active=True).values_list('id', flat=True).iterator(chunk_size=10000))
+            for resume_id in [r for r in self.rows if r not in active]:
+                del self.rows[resume_id]
+        self.synced_at = started
+        return read
+
+    def idf(self, index: JobVectorIndex, overrides: dict[str, float]) -> 'np.ndarray':
+        """IDF of every local term under `index` (unseen_idf for terms it does not hold),
+        with `overrides` for terms newer than the snapshot.
+        """
+        version, idf = self._idf or (None, np.zeros(0))
+        if version != index.version:
+            idf = np.zeros(0)
+        if len(idf) < len(self.terms):
+            new = list(itertools.islice(self.terms, len(idf), None))
+            idf = np.concatenate([idf, np.fromiter(
+                (index.idf[c] if (c := index.vocabulary.get(t)) is not None else index.unseen_idf for t in new),
+                dtype=np.float64, count=len(new))])
+            self._idf = (index.version, idf)
+        if overrides:
+            idf = idf.copy()
+            for term, value in overrides.items():
+                column = self.terms.get(term)
+                if column is not None:
+                    idf[column] = value
+        return idf
+
+    def chunks(self, size: int, vocabulary: dict[str, int], idf: 'np.ndarray'):
+        """Yield (resume ids, user ids, CSR rows) for `size` resumes at a time. Rows are
+        L2-normalized TF-IDF over all of a resume's terms, with only the `vocabulary`
+        columns kept.
+        """
+        columns = np.full(len(self.terms), -1, dtype=np.int64)
+        for term, column in vocabulary.items():
+            local = self.terms.get(term)
+            if local is not None:
+                columns[local] = column
+        items = iter(list(self.rows.items()))
+        while chunk := list(itertools.islice(items, size)):
+            n = len(chunk)
+            ids = np.fromiter((resume_id for resume_id, _ in chunk), dtype=np.int64, count=n)
+            users = np.fromiter((row[0] for _, row in chunk), dtype=np.int64, count=n)
+            lengths = np.fromiter((len(row[1]) for _, row in chunk), dtype=np.int64, count=n)
+            local = np.concatenate([row[1] for _, row in chunk])
+            data = np.concatenate([row[2] for _, row in chunk]).astype(np.float64) * idf[local]
+            rows = np.repeat(np.arange(n), lengths)
+            norms = np.sqrt(np.bincount(rows, weights=data * data, minlength=n))
+            norms[norms == 0] = 1.0
+            mapped = columns[local]
+            keep = mapped >= 0
+            # float32 halves the memory traffic of the product; scores need no more precision
+            matrix = sparse.csr_matrix(((data[keep] / norms[rows[keep]]).astype(np.float32), (rows[keep], mapped[keep])),
+                                       shape=(n, len(vocabulary)))
+            yield ids, users, matrix
+
+
+def load_job_vectors(job_ids, index: JobVectorIndex):
+    """([(job_id, terms)] of the active jobs among `job_ids`, IDF of their terms that are
+    newer than the snapshot, taken from the live TermStat rows).
+    """
+    vectors = []
+    for batch in batched(sorted(set(job_ids)), 1000):
+        vectors.extend(JobVector.objects.filter(job_id__in=batch, active=True).values_list('job_id', 'terms'))
+    vectors = [(job_id, terms) for job_id, terms in sorted(vectors) if terms]
+    missing = list({t for _, terms in vectors for t in terms if index.vocabulary.get(t) is None})
+    overrides = {}
+    for batch in batched(missing, 1000):
+        for term, df in TermStat.objects.filter(term__in=batch, df__gt=0).values_list('term', 'df'):
+            overrides[term] = math.log((1 + index.documents) / (1 + df)) + 1.0
+    return vectors, overrides
+
+
+def job_matrix(vectors, index: JobVectorIndex, overrides: dict[str, float] | None = None):
+    """(job ids, vocabulary, CSR rows) for (job_id, terms) rows, weighted like the
+    snapshot's rows. The vocabulary is just the terms these jobs contain, numbered by
+    descending document frequency among them.
+    """
+    overrides = overrides or {}
+    df = Counter(t for _, terms in vectors for t in terms)
+    vocabulary = {t: i for i, (t, _) in enumerate(df.most_common())}
+    idf = np.fromiter(
+        (overrides.get(t, index.unseen_idf) if (c := index.vocabulary.get(t)) is None else index.idf[c]
+         for t in vocabulary), dtype=np.float64, count=len(vocabulary))
+
+    indptr, indices, data = [0], [], []
+    for _, terms in vectors:
+        for term, n in terms.items():
+            indices.append(vocabulary[term])
+            data.append(n)
+        indptr.append(len(indices))
+    counts = sparse.csr_matrix((np.asarray(data, dtype=np.float64), np.asarray(indices, dtype=np.int64), indptr),
+                               shape=(len(vectors), len(vocabulary)))
+    matrix = counts.multiply(idf).tocsr()
+    norms = np.sqrt(np.asarray(matrix.multiply(matrix).sum(axis=1)).ravel())
+    norms[norms == 0] = 1.0
+    matrix = (sparse.diags(1.0 / norms) @ matrix).tocsr()
+    return np.asarray([job_id for job_id, _ in vectors], dtype=np.int64), vocabulary, matrix
+
+
+class JobBlock:
+    """The new jobs' rows split for thresholded scoring.
+
+    Terms in at least `common_df` of the jobs (the first `common` columns of a
+    job_matrix) are everywhere but carry little IDF weight; multiplying them sparsely
+    would make every resume/job pair a nonzero. They are kept as small dense blocks
+    instead, and only the rare columns go through the sparse product. By Cauchy-Schwarz
+    a pair scores at most its rare-term product plus |resume common| * |job common|, so
+    the common part is only computed for pairs whose bound reaches the threshold (and
+    for every job of the few resumes whose common part alone could).
+    """
+
+    def __init__(self, matrix, common_df: float):
+        matrix = matrix.astype(np.float32)
+        df = np.diff(matrix.tocsc().indptr)
+        self.common = int(np.count_nonzero(df >= max(common_df * matrix.shape[0], 2)))
+        self.dense = matrix[:, :self.common].toarray()
+        self.norms = np.sqrt((self.dense * self.dense).sum(axis=1))
+        self.max_norm = float(self.norms.max()) if len(self.norms) else 0.0
+        self.rare_t = matrix[:, self.common:].T.tocsr()
+
+
+def _row_dots(a, b, rows, columns, step: int = 65536):
+    """a[rows[i]] . b[columns[i]] for every i, gathering `step` pairs at a time."""
+    out = np.empty(len(rows))
+    for i in range(0, len(rows), step):
+        out[i:i + step] = np.einsum('ij,ij->i', a[rows[i:i + step]], b[columns[i:i + step]])
+    return out
+
+
+def top_matches(resumes, jobs: JobBlock, threshold: float, top_n: int):
+    """(row, column, match_score) of each resume row's `top_n` best jobs scoring at least
+    `threshold`, for resume rows `resumes` in the jobs' vocabulary. Exact: pruning only
+    skips pairs that provably score below the threshold.
+    """
+    # Slack for float32 rounding in the bounds; the final filter uses the computed scores
+    cut = threshold / 100.0 - 1e-5
+    dense = resumes[:, :jobs.common].toarray()
+    norms = np.sqrt((dense * dense).sum(axis=1))
+    rare = (resumes[:, jobs.common:] @ jobs.rare_t).tocsr()
+    rows = np.repeat(np.arange(rare.shape[0]), np.diff(rare.indptr))
+    columns, values = rare.indices, rare.data
+
+    # Rows whose common terms alone may reach the threshold are scored against every job
+    full = norms * jobs.max_norm >= cut
+    keep = ~full[rows] & (values + norms[rows] * jobs.norms[columns] >= cut)
+    rows, columns = rows[keep], columns[keep]
+    values = values[keep] + _row_dots(dense, jobs.dense, rows, columns)
+    if full.any():
+        full_rows = np.flatnonzero(full)
+        scores = dense[full_rows] @ jobs.dense.T + rare[full_rows].toarray()
+        r, c = np.nonzero(scores >= cut)
+        rows = np.concatenate([rows, full_rows[r]])
+        columns = np.concatenate([columns, c])
+        values = np.concatenate([values, scores[r, c]])
+
+    values = values.astype(np.float64) * 100.0
+    keep = values >= threshold
+    rows, columns, values = rows[keep], columns[keep], values[keep]
+    if top_n and len(rows):
+        order = np.lexsort((-values, rows))
+        rows, columns, values = rows[order], columns[order], values[order]
+        rank = np.arange(len(rows)) - np.searchsorted(rows, rows)
+        keep = rank < top_n
+        rows, columns, values = rows[keep], columns[keep], values[keep]
+    return rows, columns, values
+
+
+def score_resumes(resumes: ResumeTerms, vocabulary: dict[str, int], idf, block: JobBlock, threshold: float,
+                  top_n: int, chunk_size: int, threads: int = 1):
+    """top_matches() for every resume, `chunk_size` rows at a time. Returns (user ids,
+    job columns, resume ids, match scores, resumes scored). Sparse products release the
+    GIL, so with `threads` > 1 chunks are scored concurrently, at most 2 * threads at once.
+    """
+    found, scored = [], 0
+
+    def collect(resume_ids, user_ids, result):
+        rows, columns, scores = result
+        found.append((user_ids[rows], columns, resume_ids[rows], scores))
+
+    chunks = resumes.chunks(chunk_size, vocabulary, idf)
+    if threads <= 1:
+        for resume_ids, user_ids, matrix in chunks:
+            collect(resume_ids, user_ids, top_matches(matrix, block, threshold, top_n))
+            scored += len(resume_ids)
+    else:
+        with ThreadPoolExecutor(max_workers=threads, thread_name_prefix='reverse-match') as pool:
+            pending = deque()
+            for resume_ids, user_ids, matrix in chunks:
+                pending.append((resume_ids, user_ids, pool.submit(top_matches, matrix, block, threshold, top_n)))
+                scored += len(resume_ids)
+                if len(pending) >= 2 * threads:
+                    resume_ids, user_ids, future = pending.popleft()
+                    collect(resume_ids, user_ids, future.result())
+            for resume_ids, user_ids, future in pending:
+                collect(resume_ids, user_ids, future.result())
+    if not found:
+        empty = np.zeros(0, dtype=np.int64)
+        return empty, empty, empty, np.zeros(0), scored
+    users, columns, resume_ids, scores = (np.concatenate(part) for part in zip(*found))
+    return users, columns, resume_ids, scores, scored
+
+
+def best_per_user(users, jobs, resumes, scores, top_n: int):
+    """Each user's `top_n` best (job, resume, score), scoring a job by the user's best resume."""
+    order = np.lexsort((-scores, jobs, users))
+    users, jobs, resumes, scores = users[order], jobs[order], resumes[order], scores[order]
+    first = np.ones(len(users), dtype=bool)
+    first[1:] = (users[1:] != users[:-1]) | (jobs[1:] != jobs[:-1])
+    users, jobs, resumes, scores = users[first], jobs[first], resumes[first], scores[first]
+    order = np.lexsort((-scores, users))
+    users, jobs, resumes, scores = users[order], jobs[order], resumes[order], scores[order]
+    if top_n:
+        keep = np.arange(len(users)) - np.searchsorted(users, users) < top_n
+        users, jobs, resumes, scores = users[keep], jobs[keep], resumes[keep], scores[keep]
+    return users, jobs, resumes, scores
+
+
+def _known_pairs(job_ids) -> 'np.ndarray':
+    """(user, job) keys of existing matches and applications for these jobs."""
+    keys = []
+    for batch in batched(job_ids, 1000):
+        for model in (JobMatch, JobApplication):
+            pairs = np.asarray(list(model.objects.filter(job_id__in=batch).values_list('user_id', 'job_id')),
+                               dtype=np.int64).reshape(-1, 2)
+            keys.append(_pair_keys(pairs[:, 0], pairs[:, 1]))
+    return np.concatenate(keys) if keys else np.zeros(0, dtype=np.int64)
+
+
+def _notification(job_lines: list[str]) -> tuple[str, str]:
+    title = 'New job match' if len(job_lines) == 1 else f'{len(job_lines)} new job matches'
+    return title, 'New jobs matching your resume: ' + '; '.join(job_lines) + '.'
+
+
+def _store(users, jobs, resumes, scores) -> int:
+    """Write the matches and one notification per user. Returns the users notified."""
+    from accounts.models import Notification, push_notifications_ws
+
+    titles = {}
+    for batch in batched(sorted(set(jobs.tolist())), 1000):
+        titles.update((job_id, f'{title} at {company}') for job_id, title, company in Job.objects.filter(
+            id__in=batch).values_list('id', 'title', 'company__name'))
+    matches, lines = [], defaultdict(list)
+    for user_id, job_id, resume_id, score in zip(users.tolist(), jobs.tolist(), resumes.tolist(), scores.tolist()):
+        matches.append(JobMatch(user_id=user_id, job_id=job_id, resume_id=resume_id, match_score=score))
+        lines[user_id].append(f'{titles.get(job_id, "A new job")} ({score:.0f}%)')
+    notifications = {user_id: Notification(user_id=user_id, title=title, message=message)
+                     for user_id, (title, message) in ((u, _notification(l)) for u, l in lines.items())}
+    with transaction.atomic():
+        # A concurrent run in another process may have stored some pairs first
+        JobMatch.objects.bulk_create(matches, batch_size=1000, ignore_conflicts=True)
+        Notification.objects.bulk_create(list(notifications.values()), batch_size=1000)
+        transaction.on_commit(lambda: [push_notifications_ws(user_id, [n]) for user_id, n in notifications.items()])
+    return len(notifications)
+
+
+_RESUMES = ResumeTerms()
+
+
+def match_new_jobs(job_ids, threshold: float | None = None, top_n: int | None = None,
+                   chunk_size: int | None = None, store: bool = True) -> dict:
+    """Score stored jobs against every active resume; store and announce each user's best
+    new matches. Returns counts and timings of the run.
+    """
+    stats = {'jobs': 0, 'resumes': 0, 'pairs': 0, 'matches': 0, 'users': 0, 'seconds': 0.0}
+    if not NUMPY_AVAILABLE:
+        logger.warning("Reverse matching needs numpy/scipy; skipped")
+        return stats
+    started = time.perf_counter()
+    threshold = float(_reverse_setting('THRESHOLD', match_threshold()) if threshold is None else threshold)
+    top_n = int(top_n or _reverse_setting('TOP_N', 5))
+    chunk_size = int(chunk_size or _reverse_setting('CHUNK_SIZE', 2000))
+
+    index = get_index()
+    if index is None:
+        return stats
+    vectors, overrides = load_job_vectors(job_ids, index)
+    ids, vocabulary, jobs = job_matrix(vectors, index, overrides)
+    stats['jobs'] = len(ids)
+    if not len(ids):
+        return stats
+    block = JobBlock(jobs, float(_reverse_setting('COMMON_DF', 0.02)))
+
+    with _RESUMES.lock:
+        _RESUMES.sync()
+        users, columns, resumes, scores, stats['resumes'] = score_resumes(
+            _RESUMES, vocabulary, _RESUMES.idf(index, overrides), block, threshold, top_n, chunk_size,
+            int(_reverse_setting('THREADS', 1)))
+    matched = ids[columns]
+    stats['pairs'] = len(users)
+
+    fresh = ~np.isin(_pair_keys(users, matched), _known_pairs(ids.tolist()))
+    users, matched, resumes, scores = best_per_user(
+        users[fresh], matched[fresh], resumes[fresh], scores[fresh], top_n)
+    stats['matches'] = len(users)
+    if store and len(users):
+        stats['users'] = _store(users, matched, resumes, scores)
+    stats['seconds'] = time.perf_counter() - started
+    return stats
+
+
+class ReverseMatchQueue:
+    """Job ids waiting to be matched. One worker thread takes everything queued (after
+    waiting `delay` seconds for more) as a single batch, so a burst of ingests costs one
+    pass over the resumes; the batch is also percolated against the saved searches.
+    """
+
+    def __init__(self, delay: float = 0.0):
+        self.delay = delay
+        self._pending: set[int] = set()
+        self._busy = False
+        self._cond = threading.Condition()
+        self._thread: threading.Thread | None = None
+
+    def put(self, job_ids):
+        with self._cond:
+            self._pending.update(job_ids)
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name='reverse-match', daemon=True)
+                self._thread.start()
+            self._cond.notify_all()
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while not self._pending:
+                    self._cond.wait()
+            if self.delay:
+                time.sleep(self.delay)
+            with self._cond:
+                batch = sorted(self._pending)
+                self._pending.clear()
+                self._busy = True
+            try:
+                close_old_connections()
+                if _reverse_setting('ENABLED', True):
+                    try:
+                        logger.info(f"Reverse matching: {match_new_jobs(batch)}")
+                    except Exception as e:
+                        logger.error(f"Reverse matching failed for {len(batch)} jobs: {e}")
+                if saved_search_setting('ENABLED', True):
+                    try:
+                        logger.info(f"Saved searches: {percolate_jobs(batch)}")
+                    except Exception as e:
+                        logger.error(f"Saved search matching failed for {len(batch)} jobs: {e}")
+            finally:
+                close_old_connections()
+                with self._cond:
+                    self._busy = False
+                    self._cond.notify_all()
+
+    def join(self):
+        with self._cond:
+            while self._pending or self._busy:
+                self._cond.wait()
+
+
+_QUEUE = ReverseMatchQueue(_reverse_setting('DELAY', 5.0))
+
+
+def enqueue_new_jobs(job_ids):
+    """Queue stored jobs for reverse matching and saved searches once the current
+    transaction commits.
+    """
+    job_ids = [job_id for job_id in job_ids if job_id is not None]
+    if not job_ids or not (_reverse_setting('ENABLED', True) or saved_search_setting('ENABLED', True)):
+        return
+    transaction.on_commit(lambda: _QUEUE.put(job_ids))
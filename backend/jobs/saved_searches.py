@@ -0,0 +1,243 @@
+"""Saved searches: stored live-search queries percolated against newly ingested jobs.
+
+A SavedSearch keeps its query as preprocessed terms (the pipeline job text goes through)
+and matches a job when the job's title, description and requirements contain every term
+and the job is in the search's location (or remote). Instead of testing each new job
+against every saved search, searches are held in a reverse index keyed by one anchor
+term each, the query term rarest in the job corpus: a job can only match searches
+anchored at one of its own terms, so only those are checked. Anchors are chosen once
+per search; any query term would be correct, the rarest keeps the candidate lists short.
+
+The index lives in process memory (`SavedSearchIndex`) and is refreshed from the rows
+updated since the previous run. New jobs reach it through the reverse-matching ingest
+queue (`reverse_matching.enqueue_new_jobs`); matches become SavedSearchMatch rows, one
+per (search, job), and one notification per user, bulk-created and pushed with
+`push_notifications_ws`.
+"""
+import re
+import threading
+import time
+from collections import defaultdict
+
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+
+from resumes.matching import PREPROCESS_VERSION, preprocess_job_text, preprocess_text, split_tokens
+
+from .models import Job, SavedSearch, SavedSearchMatch
+from .pipeline import batched
+from .preferences import normalize_location
+from .vector_index import MAX_TERM_LENGTH, get_index
+
+# Query terms kept per search; longer queries are cut, not rejected
+MAX_QUERY_TERMS = 16
+
+_LOCATION_PARTS = re.compile(r'[,;/|]')
+
+
+def saved_search_setting(name: str, default):
+    """settings.JOB_SAVED_SEARCHES[name], or `default`."""
+    return (getattr(settings, 'JOB_SAVED_SEARCHES', None) or {}).get(name, default)
+
+
+def query_terms(query: str) -> list[str]:
+    terms = dict.fromkeys(t for t in split_tokens(preprocess_text(query or '')) if len(t) <= MAX_TERM_LENGTH)
+    return list(terms)[:MAX_QUERY_TERMS]
+
+
+def fill_search_terms(search):
+    """Set a SavedSearch's terms and location_key from its query and location."""
+    search.terms = query_terms(search.query)
+    search.location_key = normalize_location(search.location)
+
+
+def save_search(user, query: str, location: str = '') -> SavedSearch | None:
+    """Store (or reactivate) a saved search for the user. Returns None when the query has
+    no searchable terms or the user already has MAX_PER_USER active searches.
+    """
+    query, location = (query or '').strip()[:255], (location or '').strip()[:100]
+    if not query_terms(query):
+        return None
+    existing = SavedSearch.objects.filter(user=user, query=query, location=location).first()
+    if existing is None and SavedSearch.objects.filter(
+            user=user, is_active=True).count() >= saved_search_setting('MAX_PER_USER', 20):
+        return None
+    if existing is None:
+        return SavedSearch.objects.create(user=user, query=query, location=location)
+    if not existing.is_active:
+        existing.is_active = True
+        existing.save(update_fields=['is_active', 'updated_at'])
+    return existing
+
+
+def location_accepts(location_key: str, job_location: str, job_location_key: str, job_remote: bool) -> bool:
+    """Whether a job is in a search's location: same city key, any part of its location
+    naming it (so "india" admits "Pune, India") or a remote job. An empty key admits
+    every job.
+    """
+    if not location_key or job_remote or job_location_key == location_key:
+        return True
+    return any(normalize_location(part) == location_key for part in _LOCATION_PARTS.split(job_location or ''))
+
+
+class SavedSearchIndex:
+    """Active saved searches, reverse-indexed by anchor term and refreshed incrementally."""
+
+    def __init__(self):
+        # search id -> (user id, terms, location key, query)
+        self.searches: dict[int, tuple[int, frozenset, str, str]] = {}
+        self.anchors: dict[str, set[int]] = defaultdict(set)
+        self._anchor_of: dict[int, str] = {}
+        self.synced_at = None
+        self.lock = threading.Lock()
+
+    def add(self, search_id: int, user_id: int, terms, location_key: str = '', query: str = '', rarity=None):
+        """Index a search; `rarity(term)` ranks anchor candidates (higher = rarer)."""
+        self.remove(search_id)
+        terms = frozenset(terms)
+        if not terms:
+            return
+        anchor = max(sorted(terms), key=rarity or len)
+        self.searches[search_id] = (user_id, terms, location_key, query)
+        self.anchors[anchor].add(search_id)
+        self._anchor_of[search_id] = anchor
+
+    def remove(self, search_id: int):
+        anchor = self._anchor_of.pop(search_id, None)
+        if anchor is None:
+            return
+        self.searches.pop(search_id, None)
+        ids = self.anchors[anchor]
+        ids.discard(search_id)
+        if not ids:
+            del self.anchors[anchor]
+
+    def sync(self) -> int:
+        """Read the searches saved since the last sync. Returns how many were read."""
+        started = timezone.now()
+        searches = SavedSearch.objects.all()
+        if self.synced_at is not None:
+            searches = searches.filter(updated_at__gte=self.synced_at)
+        rarity = _rarity()
+        read = 0
+        for search_id, user_id, terms, location_key, query, active in searches.values_list(
+                'id', 'user_id', 'terms', 'location_key', 'query', 'is_active').iterator(chunk_size=2000):
+            if active:
+                self.add(search_id, user_id, terms or [], location_key, query, rarity)
+            else:
+                self.remove(search_id)
+            read += 1
+        if self.synced_at is not None:
+            # Deleted since the last sync
+            present = set(SavedSearch.objects.filter(is_active=True).values_list('id', flat=True).iterator(
+                chunk_size=10000))
+            for search_id in [s for s in self.searches if s not in present]:
+                self.remove(search_id)
+        self.synced_at = started
+        return read
+
+    def candidates(self, terms) -> set[int]:
+        """Searches anchored at one of a job's terms."""
+        found = set()
+        if len(terms) <= len(self.anchors):
+            for term in terms:
+                ids = self.anchors.get(term)
+                if ids:
+                    found |= ids
+        else:
+            for anchor, ids in self.anchors.items():
+                if anchor in terms:
+                    found |= ids
+        return found
+
+    def match(self, terms, location: str = '', location_key: str = '', remote: bool = False):
+        """(search ids matching a job, candidates checked)."""
+        candidates = self.candidates(terms)
+        matched = [search_id for search_id in candidates
+                   if self.searches[search_id][1] <= terms
+                   and location_accepts(self.searches[search_id][2], location, location_key, remote)]
+        return matched, len(candidates)
+
+
+def _rarity():
+    """Anchor ranking from the current index snapshot: IDF, terms it lacks rarest of all."""
+    index = get_index()
+    if index is None:
+        return None
+    vocabulary, idf, unseen = index.vocabulary, index.idf, index.unseen_idf
+
+    def rarity(term):
+        column = vocabulary.get(term)
+        return (float(idf[column]) if column is not None else unseen, len(term))
+    return rarity
+
+
+def job_search_terms(title: str, processed_text: str) -> frozenset:
+    return frozenset(split_tokens(preprocess_text(title or ''))) | frozenset(split_tokens(processed_text or ''))
+
+
+def _notification(lines: dict[str, list[str]]) -> tuple[str, str]:
+    jobs = sum(len(titles) for titles in lines.values())
+    title = 'New job for your saved search' if jobs == 1 else f'{jobs} new jobs for your saved searches'
+    return title, ' '.join(f'New jobs for "{query}": ' + '; '.join(titles) + '.' for query, titles in lines.items())
+
+
+def _store(pairs: list[tuple[int, int]], jobs: dict[int, str]) -> int:
+    """Write the (search, job) matches and one notification per user. Returns the users notified."""
+    from accounts.models import Notification, push_notifications_ws
+
+    top_n = int(saved_search_setting('TOP_N', 5))
+    lines: dict[int, dict[str, list[str]]] = defaultdict(lambda: defaultdict(list))
+    for search_id, job_id in pairs:
+        user_id, _, _, query = _SEARCHES.searches[search_id]
+        titles = lines[user_id][query]
+        if len(titles) < top_n:
+            titles.append(jobs[job_id])
+    notifications = {user_id: Notification(user_id=user_id, title=title, message=message)
+                     for user_id, (title, message) in ((u, _notification(l)) for u, l in lines.items())}
+    with transaction.atomic():
+        SavedSearchMatch.objects.bulk_create([SavedSearchMatch(search_id=s, job_id=j) for s, j in pairs],
+                                             batch_size=1000, ignore_conflicts=True)
+        Notification.objects.bulk_create(list(notifications.values()), batch_size=1000)
+        transaction.on_commit(lambda: [push_notifications_ws(user_id, [n]) for user_id, n in notifications.items()])
+    return len(notifications)
+
+
+_SEARCHES = SavedSearchIndex()
+
+
+def percolate_jobs(job_ids, store: bool = True) -> dict:
+    """Match stored jobs against the saved searches; store and announce new matches.
+    Returns counts and timings of the run.
+    """
+    stats = {'jobs': 0, 'searches': 0, 'checked': 0, 'matches': 0, 'users': 0, 'seconds': 0.0}
+    started = time.perf_counter()
+    with _SEARCHES.lock:
+        _SEARCHES.sync()
+        stats['searches'] = len(_SEARCHES.searches)
+        if not _SEARCHES.searches:
+            return stats
+        pairs, jobs = [], {}
+        for batch in batched(sorted(set(job_ids)), 1000):
+            rows = Job.objects.filter(id__in=batch, status='active').values_list(
+                'id', 'title', 'company__name', 'description', 'requirements', 'normalized_text',
+                'preprocess_version', 'location', 'location_key', 'is_remote')
+            for job_id, title, company, description, requirements, text, version, location, key, remote in rows:
+                if version != PREPROCESS_VERSION:
+                    text = preprocess_job_text(description, requirements)
+                matched, checked = _SEARCHES.match(job_search_terms(title, text), location, key, remote)
+                stats['jobs'] += 1
+                stats['checked'] += checked
+                if matched:
+                    jobs[job_id] = f'{title} at {company}'
+                    pairs.extend((search_id, job_id) for search_id in matched)
+            if pairs:
+                # Announced before (e.g. the job was re-queued after enrichment)
+                known = set(SavedSearchMatch.objects.filter(job_id__in=batch).values_list('search_id', 'job_id'))
+                pairs = [pair for pair in pairs if pair not in known]
+        stats['matches'] = len(pairs)
+        if store and pairs:
+            stats['users'] = _store(pairs, jobs)
+    stats['seconds'] = time.perf_counter() - started
+    return stats
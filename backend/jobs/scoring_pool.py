@@ -0,0 +1,111 @@
+"""Process-pool scoring for the exact pass over large job indexes.
+
+Scoring every job is one sparse matrix-vector product that holds a single core for the
+whole request. When JOB_VECTOR_INDEX['SCORE_PROCESSES'] > 0 and the snapshot is memory
+mapped from SNAPSHOT_DIR, the rows are split into one contiguous shard per worker. Each
+worker maps the same snapshot files (no job data is pickled), scores its shard against
+the query's non-zero weights and sends back only its own top k, which search() merges.
+Indexes smaller than PARALLEL_MIN_JOBS stay in-process, where the round trip to the
+pool costs more than it saves.
+"""
+import atexit
+import logging
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+
+from .parsing import _init_worker
+from .vector_index import NUMPY_AVAILABLE, JobVectorIndex, index_setting, np, sparse
+
+logger = logging.getLogger(__name__)
+
+_POOL: ProcessPoolExecutor | None = None
+_POOL_WORKERS = 0
+_POOL_LOCK = threading.Lock()
+
+# Snapshots mapped in a pool worker, by path; two cover a switch-over between versions
+_MAPPED: dict[str, JobVectorIndex] = {}
+_MAPPED_KEEP = 2
+
+
+def _mapped(path: str) -> JobVectorIndex:
+    index = _MAPPED.get(path)
+    if index is None:
+        index = JobVectorIndex.open(Path(path))
+        while len(_MAPPED) >= _MAPPED_KEEP:
+            _MAPPED.pop(next(iter(_MAPPED)))
+        _MAPPED[path] = index
+    return index
+
+
+def _score_shard(path: str, start: int, stop: int, columns, values, k: int | None, threshold: float | None):
+    """(rows, scores) of the best `k` jobs among snapshot rows [start, stop)."""
+    matrix = _mapped(path).matrix
+    indptr = matrix.indptr[start:stop + 1]
+    lo, hi = int(indptr[0]), int(indptr[-1])
+    shard = sparse.csr_matrix(
+        (matrix.data[lo:hi], matrix.indices[lo:hi], indptr - lo), shape=(stop - start, matrix.shape[1]), copy=False,
+    )
+    q = np.zeros(matrix.shape[1])
+    q[columns] = values
+    scores = shard @ q * 100.0
+    keep = np.flatnonzero(scores >= threshold) if threshold is not None else np.arange(stop - start)
+    if k is not None and len(keep) > k:
+        keep = keep[np.argpartition(-scores[keep], k - 1)[:k]]
+    return keep + start, scores[keep]
+
+
+def get_scoring_pool() -> ProcessPoolExecutor | None:
+    """Return the shared scoring pool, or None when parallel scoring is disabled."""
+    global _POOL, _POOL_WORKERS
+    workers = int(index_setting('SCORE_PROCESSES', 0) or 0)
+    if workers <= 0:
+        return None
+    with _POOL_LOCK:
+        if _POOL is not None and _POOL_WORKERS != workers:
+            _POOL.shutdown(wait=False, cancel_futures=True)
+            _POOL = None
+        if _POOL is None:
+            _POOL = ProcessPoolExecutor(max_workers=workers, initializer=_init_worker)
+            _POOL_WORKERS = workers
+        return _POOL
+
+
+def shutdown_scoring_pool():
+    global _POOL
+    with _POOL_LOCK:
+        if _POOL is not None:
+            _POOL.shutdown(wait=False, cancel_futures=True)
+            _POOL = None
+
+
+atexit.register(shutdown_scoring_pool)
+
+
+def score_in_pool(index: JobVectorIndex, q, k: int | None = None, threshold: float | None = None):
+    """Score every job of a mapped snapshot across the pool: (rows, scores), or None when
+    the index is too small, not on disk, or parallel scoring is disabled (score inline).
+    Rows are unordered; with `k`, at most k per shard are returned.
+    """
+    if not NUMPY_AVAILABLE or index.path is None:
+        return None
+    if index.documents < int(index_setting('PARALLEL_MIN_JOBS', 50000)):
+        return None
+    pool = get_scoring_pool()
+    if pool is None:
+        return None
+    columns = np.flatnonzero(q)
+    values = q[columns]
+    bounds = np.linspace(0, index.documents, _POOL_WORKERS + 1).astype(np.int64).tolist()
+    try:
+        futures = [
+            pool.submit(_score_shard, str(index.path), start, stop, columns, values, k, threshold)
+            for start, stop in zip(bounds, bounds[1:]) if stop > start
+        ]
+        shards = [f.result() for f in futures]
+    except BrokenProcessPool:
+        logger.error("Scoring pool broke; falling back to in-process scoring")
+        shutdown_scoring_pool()
+        return None
+    return np.concatenate([rows for rows, _ in shards]), np.concatenate([scores for _, scores in shards])
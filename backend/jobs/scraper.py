@@ -7,13 +7,14 @@ import time
 import threading
 from datetime import datetime
 from urllib.parse import urlparse
-from concurrent.futures import ThreadPoolExecutor, as_completed
 from .models import Company, Job
+from .records import JobRecord
+from .skills import extract_skills, is_role, role_matcher_for
 
 logger = logging.getLogger(__name__)
 
 # Simple in-process TTL cache for external searches (speeds up repeated queries during a session)
-_CACHE: dict[tuple, tuple[float, list[dict]]] = {}
+_CACHE: dict[tuple, tuple[float, list[JobRecord]]] = {}
 _CACHE_LOCK = threading.Lock()
 _CACHE_TTL_SECONDS = 300  # 5 minutes
 
@@ -29,7 +30,7 @@ def _cache_get(key: tuple):
             return None
         return value
 
-def _cache_set(key: tuple, value: list[dict]):
+def _cache_set(key: tuple, value: list[JobRecord]):
     with _CACHE_LOCK:
         _CACHE[key] = (time.time(), value)
 
@@ -44,698 +45,667 @@ class JobScraper:
     
     def extract_keywords(self, text):
         """Extract keywords from job description"""
-        # Remove HTML tags
-        clean_text = re.sub(r'<.*?>', ' ', text)
-        # Remove special characters and extra spaces
-        clean_text = re.sub(r'[^\w\s]', ' ', clean_text)
-        clean_text = re.sub(r'\s+', ' ', clean_text).strip().lower()
-        
-        # Extract common job skills and keywords
-        skills = []
-        common_skills = [
-            'python', 'java', 'javascript', 'react', 'angular', 'vue', 'node', 'django',
-            'flask', 'spring', 'sql', 'nosql', 'mongodb', 'postgresql', 'mysql', 'oracle',
-            'aws', 'azure', 'gcp', 'docker', 'kubernetes', 'ci/cd', 'git', 'agile', 'scrum',
-            'machine learning', 'data science', 'ai', 'devops', 'frontend', 'backend',
-            'fullstack', 'mobile', 'android', 'ios', 'swift', 'kotlin', 'react native',
-            'flutter', 'ui/ux', 'html', 'css', 'sass', 'less', 'bootstrap', 'tailwind',
-            'typescript', 'c#', 'c++', 'php', 'ruby', 'rails', 'go', 'rust', 'scala'
-        ]
-        
-        for skill in common_skills:
-            if skill in clean_text:
-                skills.append(skill)
-        
-        return skills
+        return extract_skills(text or '', strip_html=True)
 
     @staticmethod
     def is_cs_role(title: str) -> bool:
         """Basic filter for software/CS roles by title"""
-        t = (title or '').lower()
-        role_tokens = [
-            'software engineer', 'software developer', 'developer', 'engineer', 'sde',
-            'full stack', 'fullstack', 'backend', 'front end', 'frontend', 'web developer',
-            'android', 'ios', 'mobile developer', 'devops', 'site reliability', 'sre',
-            'data engineer', 'ml engineer', 'ai engineer', 'cloud engineer'
-        ]
-        return any(tok in t for tok in role_tokens)
+        return is_role(title)
     
-    def scrape_jobs(self):
-        """Method to be implemented by subclasses"""
-        raise NotImplementedError("Subclasses must implement scrape_jobs method")
-
+    # Listing results served per page; used to turn a page index into an offset
+    page_size = 10
+    # Portals that only expose a single listing page set this to False
+    paginated = True
+
+    def page_request(self, keywords=None, location=None, country=None, page=0):
+        """Return (url, params) for a listing page, or None when the page does not exist"""
+        raise NotImplementedError("Subclasses must implement page_request method")
+
+    def parse_listing(self, html):
+        """Parse a listing page into job dictionaries"""
+        raise NotImplementedError("Subclasses must implement parse_listing method")
+
+    def fetch_raw(self, keywords=None, location=None, country=None, page=0, timeout=15):
+        """Fetch a listing page and return its raw HTML bytes, or None on failure"""
+        req = self.page_request(keywords=keywords, location=location, country=country, page=page)
+        if req is None:
+            return None
+        url, params = req
+        resp = requests.get(url, params=params, headers=self.headers, timeout=timeout)
+        if resp.status_code != 200:
+            logger.error(f"Failed to fetch {type(self).__name__} page {page}: {resp.status_code}")
+            return None
+        return resp.content
+
+    def fetch_page(self, keywords=None, location=None, country=None, page=0, timeout=15, portal=None):
+        """Fetch and parse a single listing page (page index starts at 0).
+        When `portal` is given, parsing goes through jobs.parsing so it can run in the process pool.
+        """
+        html = self.fetch_raw(keywords=keywords, location=location, country=country, page=page, timeout=timeout)
+        if not html:
+            return []
+        if portal:
+            from .parsing import parse_html
+            return parse_html(portal, html)
+        return self.parse_listing(html)
 
-class LinkedInScraper(JobScraper):
-    """Scraper for LinkedIn job listings"""
-    
-    def scrape_jobs(self, keywords=None, location=None):
-        jobs = []
-        
+    def scrape_jobs(self, keywords=None, location=None, country: str | None = None):
+        """Scrape the first listing page"""
         try:
-            # Build search URL
-            base_url = "https://www.linkedin.com/jobs/search"
-            params = {
-                "keywords": keywords or "",
-                "location": location or "",
-                "f_C": self.company.name,
-                "trk": "jobs_jserp_search_button_execute",
-                "pageNum": 0
-            }
-            
-            response = requests.get(base_url, params=params, headers=self.headers)
-            if response.status_code != 200:
-                logger.error(f"Failed to fetch LinkedIn jobs: {response.status_code}")
-                return jobs
-            
-            soup = BeautifulSoup(response.text, 'html.parser')
-            job_cards = soup.find_all('div', class_='job-search-card')
-            
-            for card in job_cards:
-                try:
-                    title_elem = card.find('h3', class_='base-search-card__title')
-                    link_elem = card.find('a', class_='base-card__full-link')
-                    company_elem = card.find('h4', class_='base-search-card__subtitle')
-                    location_elem = card.find('span', class_='job-search-card__location')
-                    
-                    if not all([title_elem, link_elem, company_elem, location_elem]):
-                        continue
-                    
-                    job_url = link_elem['href']
-                    
-                    # Get job details
-                    job_response = requests.get(job_url, headers=self.headers)
-                    if job_response.status_code != 200:
-                        continue
-                    
-                    job_soup = BeautifulSoup(job_response.text, 'html.parser')
-                    description_elem = job_soup.find('div', class_='show-more-less-html__markup')
-                    
-                    if not description_elem:
-                        continue
-                    
-                    description = description_elem.get_text(strip=True)
-                    requirements = ""
-                    
-                    # Try to extract requirements section
-                    req_section = job_soup.find('h3', string=re.compile(r'Requirements|Qualifications', re.I))
-                    if req_section and req_section.find_next('ul'):
-                        requirements = req_section.find_next('ul').get_text(strip=True)
-                    
-                    # Extract job type
-                    job_type = 'full_time'  # Default
-                    job_type_elem = job_soup.find('span', string=re.compile(r'Employment type', re.I))
-                    if job_type_elem and job_type_elem.find_next('span'):
-                        job_type_text = job_type_elem.find_next('span').get_text(strip=True).lower()
-                        if 'part' in job_type_text:
-                            job_type = 'part_time'
-                        elif 'contract' in job_type_text:
-                            job_type = 'contract'
-                        elif 'intern' in job_type_text:
-                            job_type = 'internship'
-                        elif 'remote' in job_type_text:
-                            job_type = 'remote'
-                    
-                    # Extract salary if available
-                    salary_min = None
-                    salary_max = None
-                    salary_elem = job_soup.find('span', string=re.compile(r'Salary', re.I))
-                    if salary_elem and salary_elem.find_next('span'):
-                        salary_text = salary_elem.find_next('span').get_text(strip=True)
-                        salary_match = re.search(r'(\$[\d,]+)\s*-\s*(\$[\d,]+)', salary_text)
-                        if salary_match:
-                            salary_min = int(salary_match.group(1).replace('$', '').replace(',', ''))
-                            salary_max = int(salary_match.group(2).replace('$', '').replace(',', ''))
-                    
-                    # Extract keywords
-                    keywords = self.extract_keywords(description + " " + requirements)
-                    
-                    job = {
-                        'title': title_elem.get_text(strip=True),
-                        'company': self.company,
-                        'location': location_elem.get_text(strip=True),
-                        'job_type': job_type,
-                        'description': description,
-                        'requirements': requirements,
-                        'salary_min': salary_min,
-                        'salary_max': salary_max,
-                        'application_url': job_url,
-                        'keywords': keywords
-                    }
-                    
-                    jobs.append(job)
-                    
-                except Exception as e:
-                    logger.error(f"Error processing job card: {str(e)}")
-                    continue
-            
-            return jobs
-            
+            return self.fetch_page(keywords=keywords, location=location, country=country, page=0)
         except Exception as e:
-            logger.error(f"LinkedIn scraping error: {str(e)}")
-            return jobs
+            logger.error(f"{type(self).__name__} scraping error: {e}")
+            return []
 
 
 class IndeedScraper(JobScraper):
     """Scraper for Indeed job listings"""
-    
-    def scrape_jobs(self, keywords=None, location=None, country: str | None = None):
+
+    page_size = 10
+
+    def page_request(self, keywords=None, location=None, country=None, page=0):
+        # Use India domain when requested
+        in_india = (country or '').lower() == 'india' or (location or '').lower() in ['india', 'in']
+        base_url = "https://in.indeed.com/jobs" if in_india else "https://www.indeed.com/jobs"
+        params = {
+            "q": keywords or "",
+            "l": (location or ("India" if in_india else "")),
+            "sort": "date"
+        }
+        if page:
+            params["start"] = page * self.page_size
+        return base_url, params
+
+    def parse_listing(self, html):
         jobs = []
-        
-        try:
-            # Build search URL (use India domain when requested)
-            in_india = (country or '').lower() == 'india' or (location or '').lower() in ['india', 'in']
-            base_url = "https://in.indeed.com/jobs" if in_india else "https://www.indeed.com/jobs"
-            params = {
-                "q": keywords or "",
-                "l": (location or ("India" if in_india else "")),
-                "sort": "date"
-            }
-            
-            response = requests.get(base_url, params=params, headers=self.headers, timeout=15)
-            if response.status_code != 200:
-                logger.error(f"Failed to fetch Indeed jobs: {response.status_code}")
-                return jobs
-            
-            soup = BeautifulSoup(response.text, 'html.parser')
-            job_cards = soup.find_all('div', class_='job_seen_beacon')
-            
-            for card in job_cards:
-                try:
-                    title_elem = card.find('h2', class_='jobTitle')
-                    link_elem = card.find('a', class_='jcs-JobTitle')
-                    company_elem = card.find('span', class_='companyName')
-                    location_elem = card.find('div', class_='companyLocation')
-                    
-                    if not all([title_elem, link_elem, company_elem, location_elem]):
-                        continue
-                    
-                    job_id = link_elem.get('data-jk', '')
-                    job_url = f"https://www.indeed.com/viewjob?jk={job_id}" if job_id else link_elem.get('href')
-                    if not job_url:
-                        continue
-                    
-                    description = ''
-                    requirements = ''
-                    job_type = 'full_time'
-                    salary_min = None
-                    salary_max = None
-                    
-                    # Extract keywords
-                    kws = self.extract_keywords((title_elem.get_text(strip=True) or '') + ' ' + (company_elem.get_text(strip=True) or ''))
-                    
-                    job = {
-                        'title': title_elem.get_text(strip=True),
-                        'company_name': company_elem.get_text(strip=True),
-                        'location': location_elem.get_text(strip=True),
-                        'job_type': job_type,
-                        'description': description,
-                        'requirements': requirements,
-                        'salary_min': salary_min,
-                        'salary_max': salary_max,
-                        'application_url': job_url,
-                        'keywords': kws
-                    }
-                    
-                    jobs.append(job)
-                    
-                except Exception as e:
-                    logger.error(f"Error processing Indeed job card: {str(e)}")
+        soup = BeautifulSoup(html, 'html.parser')
+        job_cards = soup.find_all('div', class_='job_seen_beacon')
+
+        for card in job_cards:
+            try:
+                title_elem = card.find('h2', class_='jobTitle')
+                link_elem = card.find('a', class_='jcs-JobTitle')
+                company_elem = card.find('span', class_='companyName')
+                location_elem = card.find('div', class_='companyLocation')
+
+                if not all([title_elem, link_elem, company_elem, location_elem]):
+                    continue
+
+                job_id = link_elem.get('data-jk', '')
+                job_url = f"https://www.indeed.com/viewjob?jk={job_id}" if job_id else link_elem.get('href')
+                if not job_url:
                     continue
-            
-            return jobs
-            
-        except Exception as e:
-            logger.error(f"Indeed scraping error: {str(e)}")
-            return jobs
+
+                # Extract keywords
+                kws = self.extract_keywords((title_elem.get_text(strip=True) or '') + ' ' + (company_elem.get_text(strip=True) or ''))
+
+                job = JobRecord(
+                    title=title_elem.get_text(strip=True),
+                    company_name=company_elem.get_text(strip=True),
+                    location=location_elem.get_text(strip=True),
+                    job_type='full_time',
+                    description='',
+                    requirements='',
+                    salary_min=None,
+                    salary_max=None,
+                    application_url=job_url,
+                    keywords=kws
+                )
+
+                jobs.append(job)
+
+            except Exception as e:
+                logger.error(f"Error processing Indeed job card: {str(e)}")
+                continue
+
+        return jobs
 
 class NaukriScraper(JobScraper):
     """Scraper for Naukri.com listings"""
-    
-    def scrape_jobs(self, keywords=None, location=None, country: str | None = None):
+
+    page_size = 20
+
+    def page_request(self, keywords=None, location=None, country=None, page=0):
+        # Construct a simple search URL; later pages use a "-<n>" suffix
+        kw = (keywords or '').strip().replace(' ', '-')
+        loc = (location or '').strip().replace(' ', '-')
+        url = f"https://www.naukri.com/{kw}-jobs-in-{loc}" if kw and loc else f"https://www.naukri.com/{kw}-jobs" if kw else "https://www.naukri.com/jobs"
+        if page:
+            url = f"{url}-{page + 1}"
+        return url, None
+
+    def parse_listing(self, html):
         jobs = []
-        try:
-            # Construct a simple search URL
-            kw = (keywords or '').strip().replace(' ', '-')
-            loc = (location or '').strip().replace(' ', '-')
-            url = f"https://www.naukri.com/{kw}-jobs-in-{loc}" if kw and loc else f"https://www.naukri.com/{kw}-jobs" if kw else "https://www.naukri.com/jobs"
-            resp = requests.get(url, headers=self.headers, timeout=15)
-            if resp.status_code != 200:
-                logger.error(f"Failed to fetch Naukri jobs: {resp.status_code}")
-                return jobs
-            soup = BeautifulSoup(resp.text, 'html.parser')
-            # Naukri uses multiple layouts; try generic card selectors
-            cards = soup.select('article.jobTuple, div.list > div.cardWrapper')
-            if not cards:
-                cards = soup.find_all('div', class_=re.compile(r'jdwhtw|cust-job-tuple'))
-            for card in cards:
-                try:
-                    title_elem = card.find(['a','span'], attrs={'title': True}) or card.find('a', href=True)
-                    company_elem = card.find('a', attrs={'class': re.compile(r'comp|company')}) or card.find('span', string=re.compile(r'Ltd|Inc|Pvt|Company', re.I))
-                    location_elem = card.find('li', class_=re.compile(r'location', re.I)) or card.find('span', class_=re.compile(r'loc'))
-                    link = None
-                    if title_elem and title_elem.get('href'):
-                        link = title_elem.get('href')
-                    elif card.find('a', href=True):
-                        link = card.find('a', href=True)['href']
-                    if not (title_elem and company_elem and link):
-                        continue
-                    title = title_elem.get_text(strip=True)
-                    company_name = company_elem.get_text(strip=True)
-                    loc_text = location_elem.get_text(strip=True) if location_elem else ''
-                    job = {
-                        'title': title,
-                        'company_name': company_name,
-                        'location': loc_text,
-                        'job_type': 'full_time',
-                        'description': '',
-                        'requirements': '',
-                        'salary_min': None,
-                        'salary_max': None,
-                        'application_url': link,
-                        'keywords': self.extract_keywords(title)
-                    }
-                    jobs.append(job)
-                except Exception as e:
-                    logger.error(f"Error processing Naukri job card: {str(e)}")
+        soup = BeautifulSoup(html, 'html.parser')
+        # Naukri uses multiple layouts; try generic card selectors
+        cards = soup.select('article.jobTuple, div.list > div.cardWrapper')
+        if not cards:
+            cards = soup.find_all('div', class_=re.compile(r'jdwhtw|cust-job-tuple'))
+        for card in cards:
+            try:
+                title_elem = card.find(['a','span'], attrs={'title': True}) or card.find('a', href=True)
+                company_elem = card.find('a', attrs={'class': re.compile(r'comp|company')}) or card.find('span', string=re.compile(r'Ltd|Inc|Pvt|Company', re.I))
+                location_elem = card.find('li', class_=re.compile(r'location', re.I)) or card.find('span', class_=re.compile(r'loc'))
+                link = None
+                if title_elem and title_elem.get('href'):
+                    link = title_elem.get('href')
+                elif card.find('a', href=True):
+                    link = card.find('a', href=True)['href']
+                if not (title_elem and company_elem and link):
                     continue
-            return jobs
-        except Exception as e:
-            logger.error(f"Naukri scraping error: {str(e)}")
-            return jobs
+                title = title_elem.get_text(strip=True)
+                company_name = company_elem.get_text(strip=True)
+                loc_text = location_elem.get_text(strip=True) if location_elem else ''
+                job = JobRecord(
+                    title=title,
+                    company_name=company_name,
+                    location=loc_text,
+                    job_type='full_time',
+                    description='',
+                    requirements='',
+                    salary_min=None,
+                    salary_max=None,
+                    application_url=link,
+                    keywords=self.extract_keywords(title)
+                )
+                jobs.append(job)
+            except Exception as e:
+                logger.error(f"Error processing Naukri job card: {str(e)}")
+                continue
+        return jobs
 
 
 class MonsterScraper(JobScraper):
     """Scraper for Monster.com listings (best-effort static HTML parsing)"""
-    def scrape_jobs(self, keywords=None, location=None, country: str | None = None):
+
+    def page_request(self, keywords=None, location=None, country=None, page=0):
+        kw = (keywords or '').strip().replace(' ', '+')
+        loc = (location or '').strip().replace(' ', '+')
+        url = f"https://www.monster.com/jobs/search/?q={kw}&where={loc}" if kw or loc else "https://www.monster.com/jobs/search/"
+        return url, ({"page": page + 1} if page else None)
+
+    def parse_listing(self, html):
         jobs = []
-        try:
-            kw = (keywords or '').strip().replace(' ', '+')
-            loc = (location or '').strip().replace(' ', '+')
-            url = f"https://www.monster.com/jobs/search/?q={kw}&where={loc}" if kw or loc else "https://www.monster.com/jobs/search/"
-            resp = requests.get(url, headers=self.headers, timeout=15)
-            if resp.status_code != 200:
-                logger.error(f"Failed to fetch Monster jobs: {resp.status_code}")
-                return jobs
-            soup = BeautifulSoup(resp.text, 'html.parser')
-            cards = soup.select('section.card-content, div.card-content, div.results-card')
-            for c in cards:
-                try:
-                    a = c.find('a', href=True)
-                    title_elem = c.find(['h2','h3'])
-                    comp_elem = c.find('div', class_=re.compile('company|employer', re.I)) or c.find('span', class_=re.compile('company', re.I))
-                    loc_elem = c.find('div', class_=re.compile('location', re.I)) or c.find('span', class_=re.compile('location', re.I))
-                    if not a or not title_elem:
-                        continue
-                    title = title_elem.get_text(strip=True)
-                    if not JobScraper.is_cs_role(title):
-                        continue
-                    jobs.append({
-                        'title': title,
-                        'company_name': comp_elem.get_text(strip=True) if comp_elem else 'Unknown',
-                        'location': loc_elem.get_text(strip=True) if loc_elem else '',
-                        'job_type': 'full_time',
-                        'description': '',
-                        'requirements': '',
-                        'salary_min': None,
-                        'salary_max': None,
-                        'application_url': a['href'],
-                        'keywords': self.extract_keywords(title),
-                    })
-                except Exception:
+        soup = BeautifulSoup(html, 'html.parser')
+        cards = soup.select('section.card-content, div.card-content, div.results-card')
+        for c in cards:
+            try:
+                a = c.find('a', href=True)
+                title_elem = c.find(['h2','h3'])
+                comp_elem = c.find('div', class_=re.compile('company|employer', re.I)) or c.find('span', class_=re.compile('company', re.I))
+                loc_elem = c.find('div', class_=re.compile('location', re.I)) or c.find('span', class_=re.compile('location', re.I))
+                if not a or not title_elem:
                     continue
-            return jobs
-        except Exception as e:
-            logger.error(f"Monster scraping error: {e}")
-            return jobs
+                title = title_elem.get_text(strip=True)
+                if not JobScraper.is_cs_role(title):
+                    continue
+                jobs.append(JobRecord(
+                    title=title,
+                    company_name=comp_elem.get_text(strip=True) if comp_elem else 'Unknown',
+                    location=loc_elem.get_text(strip=True) if loc_elem else '',
+                    job_type='full_time',
+                    description='',
+                    requirements='',
+                    salary_min=None,
+                    salary_max=None,
+                    application_url=a['href'],
+                    keywords=self.extract_keywords(title),
+                ))
+            except Exception:
+                continue
+        return jobs
 
 
 class DiceScraper(JobScraper):
     """Scraper for Dice.com listings"""
-    def scrape_jobs(self, keywords=None, location=None, country: str | None = None):
+
+    page_size = 20
+
+    def page_request(self, keywords=None, location=None, country=None, page=0):
+        kw = (keywords or '').strip().replace(' ', '+')
+        loc = (location or '').strip().replace(' ', '+')
+        url = f"https://www.dice.com/jobs?q={kw}&location={loc}" if kw or loc else "https://www.dice.com/jobs"
+        return url, ({"page": page + 1} if page else None)
+
+    def parse_listing(self, html):
         jobs = []
-        try:
-            kw = (keywords or '').strip().replace(' ', '+')
-            loc = (location or '').strip().replace(' ', '+')
-            url = f"https://www.dice.com/jobs?q={kw}&location={loc}" if kw or loc else "https://www.dice.com/jobs"
-            resp = requests.get(url, headers=self.headers, timeout=15)
-            if resp.status_code != 200:
-                logger.error(f"Failed to fetch Dice jobs: {resp.status_code}")
-                return jobs
-            soup = BeautifulSoup(resp.text, 'html.parser')
-            cards = soup.select('div.card, dji-search-result-list dji-search-result') or soup.find_all('a', attrs={'data-cy': re.compile('card-title|job-card-title')})
-            for c in cards:
-                try:
-                    a = c if c.name == 'a' else c.find('a', href=True)
-                    title_elem = c.find('h5') or c.find('h3') or (c if c.name == 'a' else None)
-                    comp_elem = c.find(attrs={'data-cy': re.compile('company|employer')}) or c.find('span', class_=re.compile('comp', re.I))
-                    loc_elem = c.find(attrs={'data-cy': re.compile('location')}) or c.find('span', class_=re.compile('loc', re.I))
-                    if not a or not title_elem:
-                        continue
-                    title = title_elem.get_text(strip=True)
-                    if not JobScraper.is_cs_role(title):
-                        continue
-                    jobs.append({
-                        'title': title,
-                        'company_name': comp_elem.get_text(strip=True) if comp_elem else 'Unknown',
-                        'location': loc_elem.get_text(strip=True) if loc_elem else '',
-                        'job_type': 'full_time',
-                        'description': '',
-                        'requirements': '',
-                        'salary_min': None,
-                        'salary_max': None,
-                        'application_url': a['href'],
-                        'keywords': self.extract_keywords(title),
-                    })
-                except Exception:
+        soup = BeautifulSoup(html, 'html.parser')
+        cards = soup.select('div.card, dji-search-result-list dji-search-result') or soup.find_all('a', attrs={'data-cy': re.compile('card-title|job-card-title')})
+        for c in cards:
+            try:
+                a = c if c.name == 'a' else c.find('a', href=True)
+                title_elem = c.find('h5') or c.find('h3') or (c if c.name == 'a' else None)
+                comp_elem = c.find(attrs={'data-cy': re.compile('company|employer')}) or c.find('span', class_=re.compile('comp', re.I))
+                loc_elem = c.find(attrs={'data-cy': re.compile('location')}) or c.find('span', class_=re.compile('loc', re.I))
+                if not a or not title_elem:
                     continue
-            return jobs
-        except Exception as e:
-            logger.error(f"Dice scraping error: {e}")
-            return jobs
+                title = title_elem.get_text(strip=True)
+                if not JobScraper.is_cs_role(title):
+                    continue
+                jobs.append(JobRecord(
+                    title=title,
+                    company_name=comp_elem.get_text(strip=True) if comp_elem else 'Unknown',
+                    location=loc_elem.get_text(strip=True) if loc_elem else '',
+                    job_type='full_time',
+                    description='',
+                    requirements='',
+                    salary_min=None,
+                    salary_max=None,
+                    application_url=a['href'],
+                    keywords=self.extract_keywords(title),
+                ))
+            except Exception:
+                continue
+        return jobs
 
 
 class GlassdoorScraper(JobScraper):
     """Scraper for Glassdoor listings (best-effort; site is dynamic)"""
-    def scrape_jobs(self, keywords=None, location=None, country: str | None = None):
+
+    page_size = 30
+
+    def page_request(self, keywords=None, location=None, country=None, page=0):
+        kw = (keywords or '').strip().replace(' ', '%20')
+        lk = (location or '').strip().replace(' ', '%20')
+        url = f"https://www.glassdoor.com/Job/jobs.htm?sc.keyword={kw}&locKeyword={lk}" if kw or lk else "https://www.glassdoor.com/Job/index.htm"
+        return url, ({"p": page + 1} if page else None)
+
+    def parse_listing(self, html):
         jobs = []
-        try:
-            kw = (keywords or '').strip().replace(' ', '%20')
-            lk = (location or '').strip().replace(' ', '%20')
-            url = f"https://www.glassdoor.com/Job/jobs.htm?sc.keyword={kw}&locKeyword={lk}" if kw or lk else "https://www.glassdoor.com/Job/index.htm"
-            resp = requests.get(url, headers=self.headers, timeout=15)
-            if resp.status_code != 200:
-                logger.error(f"Failed to fetch Glassdoor jobs: {resp.status_code}")
-                return jobs
-            soup = BeautifulSoup(resp.text, 'html.parser')
-            items = soup.select('li.react-job-listing, article.jobCard')
-            for it in items:
-                try:
-                    a = it.find('a', class_=re.compile('jobLink'), href=True) or it.find('a', href=True)
-                    title_elem = it.find(['a','span'], class_=re.compile('job.*title|jobLink', re.I)) or it.find(['a','span'])
-                    comp_elem = it.find('div', class_=re.compile('jobInfo.*company|jobHeader.*company', re.I)) or it.find('span', class_=re.compile('company', re.I))
-                    loc_elem = it.find('span', class_=re.compile('location', re.I))
-                    if not a or not title_elem:
-                        continue
-                    title = title_elem.get_text(strip=True)
-                    if not JobScraper.is_cs_role(title):
-                        continue
-                    href = a['href']
-                    if href and href.startswith('/'):
-                        href = 'https://www.glassdoor.com' + href
-                    jobs.append({
-                        'title': title,
-                        'company_name': comp_elem.get_text(strip=True) if comp_elem else 'Unknown',
-                        'location': loc_elem.get_text(strip=True) if loc_elem else '',
-                        'job_type': 'full_time',
-                        'description': '',
-                        'requirements': '',
-                        'salary_min': None,
-                        'salary_max': None,
-                        'application_url': href,
-                        'keywords': self.extract_keywords(title),
-                    })
-                except Exception:
+        soup = BeautifulSoup(html, 'html.parser')
+        items = soup.select('li.react-job-listing, article.jobCard')
+        for it in items:
+            try:
+                a = it.find('a', class_=re.compile('jobLink'), href=True) or it.find('a', href=True)
+                title_elem = it.find(['a','span'], class_=re.compile('job.*title|jobLink', re.I)) or it.find(['a','span'])
+                comp_elem = it.find('div', class_=re.compile('jobInfo.*company|jobHeader.*company', re.I)) or it.find('span', class_=re.compile('company', re.I))
+                loc_elem = it.find('span', class_=re.compile('location', re.I))
+                if not a or not title_elem:
                     continue
-            return jobs
-        except Exception as e:
-            logger.error(f"Glassdoor scraping error: {e}")
-            return jobs
+                title = title_elem.get_text(strip=True)
+                if not JobScraper.is_cs_role(title):
+                    continue
+                href = a['href']
+                if href and href.startswith('/'):
+                    href = 'https://www.glassdoor.com' + href
+                jobs.append(JobRecord(
+                    title=title,
+                    company_name=comp_elem.get_text(strip=True) if comp_elem else 'Unknown',
+                    location=loc_elem.get_text(strip=True) if loc_elem else '',
+                    job_type='full_time',
+                    description='',
+                    requirements='',
+                    salary_min=None,
+                    salary_max=None,
+                    application_url=href,
+                    keywords=self.extract_keywords(title),
+                ))
+            except Exception:
+                continue
+        return jobs
 
-def search_jobs_across_portals(keywords: str, location: str | None = None, max_per_portal: int = 10, country: str = 'India', role_keywords: list[str] | None = None):
-    """Search jobs on supported portals and return a combined list of dictionaries.
-    - Parallelizes portal fetches to reduce total latency.
-    - Applies a short timeout per portal.
-    - Caches results in-process for a few minutes to avoid repeated scraping.
-    - If Company records exist with known portal domains, only those portals are queried.
-    """
-    # Cache lookup
-    cache_key = (keywords or '', location or '', country or '', int(max_per_portal or 0), tuple(role_keywords) if role_keywords else None)
-    cached = _cache_get(cache_key)
-    if cached is not None:
-        return cached
 
-    results: list[dict] = []
-    try:
-        # Normalize role keywords
-        role_keywords = role_keywords or [
-            'software engineer', 'software developer', 'developer', 'engineer', 'sde',
-            'full stack', 'fullstack', 'backend', 'front end', 'frontend', 'web developer',
-            'android', 'ios', 'mobile developer', 'devops', 'site reliability', 'sre',
-            'data engineer', 'ml engineer', 'ai engineer', 'cloud engineer'
-        ]
-        def role_ok(title: str) -> bool:
-            t = (title or '').lower()
-            return any(tok in t for tok in role_keywords)
-
-        UA = JobScraper(None).headers['User-Agent']
-        TIMEOUT = 4
-        def add_source(items, source):
-            for it in items:
-                it['source'] = source
-            return items
+class LinkedInSearchScraper(JobScraper):
+    """Scraper for public LinkedIn search results (listing cards only, no detail pages)"""
 
-        def fetch_indeed():
-            try:
-                indeed = IndeedScraper(Company(name='Indeed', website='https://www.indeed.com'))
-                items = indeed.scrape_jobs(keywords=keywords, location=location, country=country)[:max_per_portal]
-                return [it for it in add_source(items, 'indeed') if role_ok(it.get('title'))]
-            except Exception as e:
-                logger.error(f"Indeed search error: {e}")
-                return []
+    page_size = 25
 
-        def fetch_naukri():
+    def page_request(self, keywords=None, location=None, country=None, page=0):
+        params = {
+            "keywords": keywords or "",
+            "location": location or (country or ""),
+            "trk": "jobs_jserp_search_button_execute",
+        }
+        # LinkedIn pages through result offsets; 'start' is the only paging parameter
+        if page:
+            params["start"] = page * self.page_size
+        return "https://www.linkedin.com/jobs/search", params
+
+    def parse_listing(self, html):
+        soup = BeautifulSoup(html, 'html.parser')
+        out = []
+        for card in soup.find_all('div', class_='job-search-card'):
             try:
-                naukri = NaukriScraper(Company(name='Naukri', website='https://www.naukri.com'))
-                items = naukri.scrape_jobs(keywords=keywords, location=location or 'india', country=country)[:max_per_portal]
-                return [it for it in add_source(items, 'naukri') if role_ok(it.get('title'))]
-            except Exception as e:
-                logger.error(f"Naukri search error: {e}")
-                return []
+                title_elem = card.find('h3', class_='base-search-card__title')
+                link_elem = card.find('a', class_='base-card__full-link')
+                company_elem = card.find('h4', class_='base-search-card__subtitle')
+                location_elem = card.find('span', class_='job-search-card__location')
+                if not all([title_elem, link_elem, company_elem]):
+                    continue
+                out.append(JobRecord(
+                    title=title_elem.get_text(strip=True),
+                    company_name=company_elem.get_text(strip=True),
+                    location=location_elem.get_text(strip=True) if location_elem else '',
+                    job_type='full_time',
+                    description='',
+                    requirements='',
+                    salary_min=None,
+                    salary_max=None,
+                    application_url=link_elem['href'],
+                    keywords=[],
+                ))
+            except Exception:
+                continue
+        return out
 
-        def fetch_wwr():
-            try:
-                url = "https://weworkremotely.com/categories/remote-programming-jobs"
-                resp = requests.get(url, headers={"User-Agent": UA}, timeout=TIMEOUT)
-                if resp.status_code != 200:
-                    return []
-                soup = BeautifulSoup(resp.text, 'html.parser')
-                lis = soup.select('section.jobs li.feature, section.jobs li:not(.view-all)')
-                out = []
-                for li in lis:
-                    if len(out) >= max_per_portal:
-                        break
-                    a = li.find('a', href=True)
-                    if not a:
-                        continue
-                    title = (a.find('span', class_='title').get_text(strip=True) if a.find('span', class_='title') else a.get_text(strip=True))
-                    company = (a.find('span', class_='company').get_text(strip=True) if a.find('span', class_='company') else 'Unknown')
-                    if not role_ok(title):
-                        continue
-                    out.append({
-                        'title': title,
-                        'company_name': company,
-                        'location': 'Remote',
-                        'job_type': 'remote',
-                        'description': '',
-                        'requirements': '',
-                        'salary_min': None,
-                        'salary_max': None,
-                        'application_url': 'https://weworkremotely.com' + a['href'],
-                        'keywords': [],
-                    })
-                return add_source(out, 'weworkremotely')
-            except Exception as e:
-                logger.error(f"WWR search error: {e}")
-                return []
 
-        def fetch_remoteok():
-            try:
-                resp = requests.get('https://remoteok.com/remote-dev-jobs', headers={"User-Agent": UA}, timeout=TIMEOUT)
-                if resp.status_code != 200:
-                    return []
-                soup = BeautifulSoup(resp.text, 'html.parser')
-                rows = soup.select('table#jobsboard tr.job')[:max_per_portal]
-                out = []
-                for row in rows:
-                    title = (row.find('h2') or row.find('td', class_='company_and_position')).get_text(strip=True)
-                    if not role_ok(title):
-                        continue
-                    comp = (row.find('h3') or row.find('td', class_='company')).get_text(strip=True) if (row.find('h3') or row.find('td', class_='company')) else 'Unknown'
-                    link = row.get('data-href') or (row.find('a', href=True)['href'] if row.find('a', href=True) else '')
-                    if link and not link.startswith('http'):
-                        link = 'https://remoteok.com' + link
-                    out.append({
-                        'title': title,
-                        'company_name': comp,
-                        'location': 'Remote',
-                        'job_type': 'remote',
-                        'description': '',
-                        'requirements': '',
-                        'salary_min': None,
-                        'salary_max': None,
-                        'application_url': link,
-                        'keywords': [],
-                    })
-                return add_source(out, 'remoteok')
-            except Exception as e:
-                logger.error(f"RemoteOK search error: {e}")
-                return []
+class LinkedInScraper(LinkedInSearchScraper):
+    """Scraper for a company's LinkedIn job listings, with each posting's detail page"""
 
-        def fetch_remotive():
-            try:
-                resp = requests.get('https://remotive.com/remote-jobs/software-dev', headers={"User-Agent": UA}, timeout=TIMEOUT)
-                if resp.status_code != 200:
-                    return []
-                soup = BeautifulSoup(resp.text, 'html.parser')
-                cards = soup.select('div.job-tile')[:max_per_portal]
-                out = []
-                for c in cards:
-                    a = c.find('a', href=True)
-                    title = c.find('span', class_='font-weight-bold').get_text(strip=True) if c.find('span', class_='font-weight-bold') else (a.get_text(strip=True) if a else '')
-                    if not role_ok(title):
-                        continue
-                    comp = c.find('span', class_='company')
-                    out.append({
-                        'title': title,
-                        'company_name': comp.get_text(strip=True) if comp else 'Unknown',
-                        'location': 'Remote',
-                        'job_type': 'remote',
-                        'description': '',
-                        'requirements': '',
-                        'salary_min': None,
-                        'salary_max': None,
-                        'application_url': ('https://remotive.com' + a['href']) if a and a['href'].startswith('/') else (a['href'] if a else ''),
-                        'keywords': [],
-                    })
-                return add_source(out, 'remotive')
-            except Exception as e:
-                logger.error(f"Remotive search error: {e}")
-                return []
+    # Listing pages read per company; stops earlier at an empty or repeated page
+    max_pages = 4
+    timeout = 15
 
-        def fetch_linkedin():
-            try:
-                base_url = "https://www.linkedin.com/jobs/search"
-                params = {
-                    "keywords": keywords or "",
-                    "location": location or (country or ""),
-                    "trk": "jobs_jserp_search_button_execute",
-                    "pageNum": 0
-                }
-                resp = requests.get(base_url, params=params, headers={"User-Agent": UA}, timeout=TIMEOUT)
-                if resp.status_code != 200:
-                    return []
-                soup = BeautifulSoup(resp.text, 'html.parser')
-                cards = soup.find_all('div', class_='job-search-card')
-                out = []
-                for card in cards[:max_per_portal]:
-                    try:
-                        title_elem = card.find('h3', class_='base-search-card__title')
-                        link_elem = card.find('a', class_='base-card__full-link')
-                        company_elem = card.find('h4', class_='base-search-card__subtitle')
-                        location_elem = card.find('span', class_='job-search-card__location')
-                        if not all([title_elem, link_elem, company_elem]):
-                            continue
-                        t = title_elem.get_text(strip=True)
-                        if not role_ok(t):
-                            continue
-                        out.append({
-                            'title': t,
-                            'company_name': company_elem.get_text(strip=True),
-                            'location': location_elem.get_text(strip=True) if location_elem else '',
-                            'job_type': 'full_time',
-                            'description': '',
-                            'requirements': '',
-                            'salary_min': None,
-                            'salary_max': None,
-                            'application_url': link_elem['href'],
-                            'keywords': [],
-                        })
-                    except Exception:
-                        continue
-                return add_source(out, 'linkedin')
-            except Exception as e:
-                logger.error(f"LinkedIn search error: {e}")
-                return []
+    def page_request(self, keywords=None, location=None, country=None, page=0):
+        url, params = super().page_request(keywords=keywords, location=location, country=country, page=page)
+        params["f_C"] = self.company.name
+        return url, params
 
-        def fetch_monster():
+    def scrape_jobs(self, keywords=None, location=None):
+        jobs, seen = [], set()
+        for page in range(self.max_pages):
             try:
-                scr = MonsterScraper(Company(name='Monster', website='https://www.monster.com'))
-                items = scr.scrape_jobs(keywords=keywords, location=location, country=country)[:max_per_portal]
-                return [it for it in add_source(items, 'monster') if role_ok(it.get('title'))]
+                cards = self.fetch_page(keywords=keywords, location=location, page=page, timeout=self.timeout)
             except Exception as e:
-                logger.error(f"Monster search error: {e}")
-                return []
+                logger.error(f"LinkedIn scraping error on page {page}: {str(e)}")
+                break
+            cards = [card for card in cards if card.application_url not in seen]
+            if not cards:
+                break
+            for card in cards:
+                seen.add(card.application_url)
+                try:
+                    job = self.with_details(card)
+                except Exception as e:
+                    logger.error(f"Error processing job card: {str(e)}")
+                    continue
+                if job is not None:
+                    jobs.append(job)
+        return jobs
 
-        def fetch_dice():
+    def with_details(self, card):
+        """The listing card completed from its detail page, or None when the page is unavailable"""
+        job_response = requests.get(card.application_url, headers=self.headers, timeout=self.timeout)
+        if job_response.status_code != 200:
+            return None
+
+        job_soup = BeautifulSoup(job_response.text, 'html.parser')
+        description_elem = job_soup.find('div', class_='show-more-less-html__markup')
+        if not description_elem:
+            return None
+
+        description = description_elem.get_text(strip=True)
+        requirements = ""
+
+        # Try to extract requirements section
+        req_section = job_soup.find('h3', string=re.compile(r'Requirements|Qualifications', re.I))
+        if req_section and req_section.find_next('ul'):
+            requirements = req_section.find_next('ul').get_text(strip=True)
+
+        # Extract job type
+        job_type = 'full_time'  # Default
+        job_type_elem = job_soup.find('span', string=re.compile(r'Employment type', re.I))
+        if job_type_elem and job_type_elem.find_next('span'):
+            job_type_text = job_type_elem.find_next('span').get_text(strip=True).lower()
+            if 'part' in job_type_text:
+                job_type = 'part_time'
+            elif 'contract' in job_type_text:
+                job_type = 'contract'
+            elif 'intern' in job_type_text:
+                job_type = 'internship'
+            elif 'remote' in job_type_text:
+                job_type = 'remote'
+
+        # Extract salary if available
+        salary_min = None
+        salary_max = None
+        salary_elem = job_soup.find('span', string=re.compile(r'Salary', re.I))
+        if salary_elem and salary_elem.find_next('span'):
+            salary_text = salary_elem.find_next('span').get_text(strip=True)
+            salary_match = re.search(r'(\$[\d,]+)\s*-\s*(\$[\d,]+)', salary_text)
+            if salary_match:
+                salary_min = int(salary_match.group(1).replace('$', '').replace(',', ''))
+                salary_max = int(salary_match.group(2).replace('$', '').replace(',', ''))
+
+        return JobRecord(
+            title=card.title,
+            company_name=self.company.name if self.company else '',
+            location=card.location,
+            job_type=job_type,
+            description=description,
+            requirements=requirements,
+            salary_min=salary_min,
+            salary_max=salary_max,
+            application_url=card.application_url,
+            keywords=self.extract_keywords(description + " " + requirements),
+        )
+
+
+class WeWorkRemotelyScraper(JobScraper):
+    """Scraper for the WeWorkRemotely programming category (single page)"""
+
+    paginated = False
+
+    def page_request(self, keywords=None, location=None, country=None, page=0):
+        if page:
+            return None
+        return "https://weworkremotely.com/categories/remote-programming-jobs", None
+
+    def parse_listing(self, html):
+        soup = BeautifulSoup(html, 'html.parser')
+        out = []
+        for li in soup.select('section.jobs li.feature, section.jobs li:not(.view-all)'):
+            a = li.find('a', href=True)
+            if not a:
+                continue
+            title = (a.find('span', class_='title').get_text(strip=True) if a.find('span', class_='title') else a.get_text(strip=True))
+            company = (a.find('span', class_='company').get_text(strip=True) if a.find('span', class_='company') else 'Unknown')
+            out.append(JobRecord(
+                title=title,
+                company_name=company,
+                location='Remote',
+                job_type='remote',
+                description='',
+                requirements='',
+                salary_min=None,
+                salary_max=None,
+                application_url='https://weworkremotely.com' + a['href'],
+                keywords=[],
+            ))
+        return out
+
+
+class RemoteOKScraper(JobScraper):
+    """Scraper for the RemoteOK dev jobs board (single page)"""
+
+    paginated = False
+
+    def page_request(self, keywords=None, location=None, country=None, page=0):
+        if page:
+            return None
+        return 'https://remoteok.com/remote-dev-jobs', None
+
+    def parse_listing(self, html):
+        soup = BeautifulSoup(html, 'html.parser')
+        out = []
+        for row in soup.select('table#jobsboard tr.job'):
             try:
-                scr = DiceScraper(Company(name='Dice', website='https://www.dice.com'))
-                items = scr.scrape_jobs(keywords=keywords, location=location, country=country)[:max_per_portal]
-                return [it for it in add_source(items, 'dice') if role_ok(it.get('title'))]
-            except Exception as e:
-                logger.error(f"Dice search error: {e}")
-                return []
+                title = (row.find('h2') or row.find('td', class_='company_and_position')).get_text(strip=True)
+                comp = (row.find('h3') or row.find('td', class_='company')).get_text(strip=True) if (row.find('h3') or row.find('td', class_='company')) else 'Unknown'
+                link = row.get('data-href') or (row.find('a', href=True)['href'] if row.find('a', href=True) else '')
+                if link and not link.startswith('http'):
+                    link = 'https://remoteok.com' + link
+                out.append(JobRecord(
+                    title=title,
+                    company_name=comp,
+                    location='Remote',
+                    job_type='remote',
+                    description='',
+                    requirements='',
+                    salary_min=None,
+                    salary_max=None,
+                    application_url=link,
+                    keywords=[],
+                ))
+            except Exception:
+                continue
+        return out
 
-        def fetch_glassdoor():
+
+class RemotiveScraper(JobScraper):
+    """Scraper for the Remotive software-dev board (single page)"""
+
+    paginated = False
+
+    def page_request(self, keywords=None, location=None, country=None, page=0):
+        if page:
+            return None
+        return 'https://remotive.com/remote-jobs/software-dev', None
+
+    def parse_listing(self, html):
+        soup = BeautifulSoup(html, 'html.parser')
+        out = []
+        for c in soup.select('div.job-tile'):
+            a = c.find('a', href=True)
+            title = c.find('span', class_='font-weight-bold').get_text(strip=True) if c.find('span', class_='font-weight-bold') else (a.get_text(strip=True) if a else '')
+            comp = c.find('span', class_='company')
+            out.append(JobRecord(
+                title=title,
+                company_name=comp.get_text(strip=True) if comp else 'Unknown',
+                location='Remote',
+                job_type='remote',
+                description='',
+                requirements='',
+                salary_min=None,
+                salary_max=None,
+                application_url=('https://remotive.com' + a['href']) if a and a['href'].startswith('/') else (a['href'] if a else ''),
+                keywords=[],
+            ))
+        return out
+
+
+# Portal name -> (scraper class, portal home page). Names double as the `source` value.
+PORTAL_SCRAPERS = {
+    'indeed': (IndeedScraper, 'https://www.indeed.com'),
+    'naukri': (NaukriScraper, 'https://www.naukri.com'),
+    'monster': (MonsterScraper, 'https://www.monster.com'),
+    'dice': (DiceScraper, 'https://www.dice.com'),
+    'glassdoor': (GlassdoorScraper, 'https://www.glassdoor.com'),
+    'weworkremotely': (WeWorkRemotelyScraper, 'https://weworkremotely.com'),
+    'remoteok': (RemoteOKScraper, 'https://remoteok.com'),
+    'remotive': (RemotiveScraper, 'https://remotive.com'),
+    'linkedin': (LinkedInSearchScraper, 'https://www.linkedin.com'),
+}
+
+
+# Portals queried when no portal companies are registered in the DB
+DEFAULT_SEARCH_PORTALS = ['indeed', 'naukri', 'weworkremotely', 'remoteok', 'remotive', 'linkedin']
+
+
+def get_portal_scraper(portal: str) -> JobScraper:
+    """Instantiate the scraper registered for a portal name"""
+    cls, website = PORTAL_SCRAPERS[portal]
+    return cls(Company(name=portal.title(), website=website))
+
+
+def _with_details(items: list[JobRecord]) -> list[JobRecord]:
+    """Attach already-fetched detail text and queue the rest for background enrichment"""
+    try:
+        from .enrichment import enrich_results
+        return enrich_results(items)
+    except Exception as e:
+        logger.error(f"Enrichment lookup failed: {e}")
+        return items
+
+
+# Per-request timeout for portal fetches; the whole search gets one extra second
+SEARCH_TIMEOUT = 4
+
+_PORTAL_DOMAINS = {
+    'indeed.com': 'indeed',
+    'indeed.co.in': 'indeed',
+    'naukri.com': 'naukri',
+    'monster.com': 'monster',
+    'foundit.in': 'monster',
+    'dice.com': 'dice',
+    'glassdoor.com': 'glassdoor',
+    'weworkremotely.com': 'weworkremotely',
+    'remoteok.com': 'remoteok',
+    'remotive.com': 'remotive',
+    'linkedin.com': 'linkedin',
+}
+
+
+def _search_portals() -> list[str]:
+    """Portals registered as Company rows in the DB, else the default portal set"""
+    portals_in_db: set[str] = set()
+    try:
+        for w in Company.objects.values_list('website', flat=True):
+            if not w:
+                continue
+            host = urlparse(w).netloc.lower()
+            for dom, portal in _PORTAL_DOMAINS.items():
+                if dom in host:
+                    portals_in_db.add(portal)
+    except Exception:
+        pass
+    return sorted(portals_in_db) or DEFAULT_SEARCH_PORTALS
+
+
+def iter_jobs_across_portals(keywords: str, location: str | None = None, max_per_portal: int = 10, country: str = 'India', role_keywords: list[str] | None = None):
+    """Stream role-filtered JobRecords from all portals as each portal responds.
+    Returns a ConcurrentSource; fetching starts immediately and stops when the
+    consumer closes it or the search deadline passes. Not de-duplicated.
+    """
+    from .pipeline import ConcurrentSource
+
+    role_ok = role_matcher_for(tuple(role_keywords)).search if role_keywords else is_role
+
+    def make_fetcher(portal):
+        def fetch():
             try:
-                scr = GlassdoorScraper(Company(name='Glassdoor', website='https://www.glassdoor.com'))
-                items = scr.scrape_jobs(keywords=keywords, location=location, country=country)[:max_per_portal]
-                return [it for it in add_source(items, 'glassdoor') if role_ok(it.get('title'))]
+                scr = get_portal_scraper(portal)
+                # Naukri needs a location segment in its search URL
+                loc = (location or 'india') if portal == 'naukri' else location
+                items = scr.fetch_page(keywords=keywords, location=loc, country=country, page=0, timeout=SEARCH_TIMEOUT, portal=portal)
             except Exception as e:
-                logger.error(f"Glassdoor search error: {e}")
-                return []
-
-        fetchers = [fetch_indeed, fetch_naukri, fetch_monster, fetch_dice, fetch_glassdoor, fetch_wwr, fetch_remoteok, fetch_remotive, fetch_linkedin]
-        portal_map = {
-            'indeed.com': fetch_indeed,
-            'indeed.co.in': fetch_indeed,
-            'naukri.com': fetch_naukri,
-            'monster.com': fetch_monster,
-            'foundit.in': fetch_monster,
-            'dice.com': fetch_dice,
-            'glassdoor.com': fetch_glassdoor,
-            'weworkremotely.com': fetch_wwr,
-            'remoteok.com': fetch_remoteok,
-            'remotive.com': fetch_remotive,
-            'linkedin.com': fetch_linkedin,
-        }
-        portals_in_db: set[str] = set()
-        try:
-            for w in Company.objects.values_list('website', flat=True):
-                if not w:
-                    continue
-                host = urlparse(w).netloc.lower()
-                for dom in portal_map:
-                    if dom in host:
-                        portals_in_db.add(dom)
-        except Exception:
-            pass
-        fetchers = [portal_map[d] for d in sorted(portals_in_db)] or [
-            fetch_indeed, fetch_naukri, fetch_wwr, fetch_remoteok, fetch_remotive, fetch_linkedin
-        ]
-
-        with ThreadPoolExecutor(max_workers=len(fetchers)) as ex:
-            futs = [ex.submit(fn) for fn in fetchers]
-            # Allow overall wait with a soft deadline
-            deadline = TIMEOUT + 1
-            for f in as_completed(futs, timeout=deadline):
-                try:
-                    items = f.result()
-                    if items:
-                        results.extend(items)
-                except Exception:
-                    continue
-    finally:
-        # Dedupe by URL
-        seen = set()
-        deduped = []
-        for it in results:
-            url = it.get('application_url')
-            if not url or url in seen:
-                continue
-            seen.add(url)
-            deduped.append(it)
-        _cache_set(cache_key, deduped)
-        return deduped
+                logger.error(f"{portal} search error: {e}")
+                return
+            n = 0
+            for it in items:
+                if n >= max_per_portal:
+                    break
+                if role_ok(it.get('title')):
+                    it['source'] = portal
+                    n += 1
+                    yield it
+        return fetch
+
+    return ConcurrentSource([make_fetcher(p) for p in _search_portals()], timeout=SEARCH_TIMEOUT + 1, name='portal-search')
+
+
+def search_jobs_across_portals(keywords: str, location: str | None = None, max_per_portal: int = 10, country: str = 'India', role_keywords: list[str] | None = None):
+    """Search jobs on supported portals and return a combined list of JobRecords.
+    - Parallelizes portal fetches to reduce total latency.
+    - Applies a short timeout per portal.
+    - Caches results in-process for a few minutes to avoid repeated scraping.
+    - If Company records exist with known portal domains, only those portals are queried.
+    """
+    from .pipeline import dedupe
+
+    # Cache lookup
+    cache_key = (keywords or '', location or '', country or '', int(max_per_portal or 0), tuple(role_keywords) if role_keywords else None)
+    cached = _cache_get(cache_key)
+    if cached is not None:
+        return _with_details(cached)
+
+    results: list[JobRecord] = []
+    try:
+        results.extend(dedupe(iter_jobs_across_portals(keywords, location, max_per_portal, country, role_keywords)))
+    except Exception as e:
+        logger.error(f"Portal search failed: {e}")
+    _cache_set(cache_key, results)
+    return _with_details(results)
 
 
 def scrape_company_jobs(company_id, keywords=None, location=None):
@@ -765,29 +735,29 @@ def scrape_company_jobs(company_id, keywords=None, location=None):
         
         # Save jobs to database, ensuring company is set to the target company
         saved = 0
+        pending: list[int] = []
+        stored: list[int] = []
         for job_data in jobs_data:
             try:
-                Job.objects.update_or_create(
+                job, _ = Job.objects.update_or_create(
                     title=job_data.get('title') or '',
                     company=company,
                     application_url=job_data.get('application_url') or '',
-                    defaults={
-                        'location': job_data.get('location') or '',
-                        'job_type': job_data.get('job_type') or 'full_time',
-                        'description': job_data.get('description') or '',
-                        'requirements': job_data.get('requirements') or '',
-                        'salary_min': job_data.get('salary_min'),
-                        'salary_max': job_data.get('salary_max'),
-                        'keywords': job_data.get('keywords') or [],
-                        'source': job_data.get('source', ''),
-                        'status': 'active'
-                    }
+                    defaults=job_defaults(job_data)
                 )
+                if job.enrichment_status == 'pending':
+                    pending.append(job.id)
+                stored.append(job.id)
                 saved += 1
             except Exception as e:
                 logger.error(f"Failed to save job '{job_data.get('title')}': {e}")
                 continue
-        
+
+        if pending:
+            from .enrichment import enqueue_jobs
+            enqueue_jobs(pending)
+        from .reverse_matching import enqueue_new_jobs
+        enqueue_new_jobs(stored)
         return saved
     
     except Company.DoesNotExist:
@@ -796,3 +766,42 @@ def scrape_company_jobs(company_id, keywords=None, location=None):
     except Exception as e:
         logger.error(f"Error scraping jobs: {str(e)}")
         return 0
+
+
+def job_defaults(item) -> dict:
+    """Job.update_or_create() defaults for a scraped JobRecord (or legacy dict)"""
+    return JobRecord.coerce(item).orm_defaults()
+
+
+def save_scraped_jobs(items: list[JobRecord]) -> int:
+    """Upsert scraped job records (companies resolved by name). Returns rows saved."""
+    saved = 0
+    pending: list[int] = []
+    stored: list[int] = []
+    companies: dict[str, Company] = {}
+    for item in items:
+        try:
+            name = item.get('company_name') or 'Unknown'
+            company = companies.get(name)
+            if company is None:
+                company, _ = Company.objects.get_or_create(name=name, defaults={'website': ''})
+                companies[name] = company
+            job, _ = Job.objects.update_or_create(
+                title=item.get('title') or '',
+                company=company,
+                application_url=item.get('application_url') or '',
+                defaults=job_defaults(item)
+            )
+            if job.enrichment_status == 'pending':
+                pending.append(job.id)
+            stored.append(job.id)
+            saved += 1
+        except Exception as e:
+            logger.error(f"Failed to save job '{item.get('title')}': {e}")
+            continue
+    if pending:
+        from .enrichment import enqueue_jobs
+        enqueue_jobs(pending)
+    from .reverse_matching import enqueue_new_jobs
+    enqueue_new_jobs(stored)
+    return saved
@@ -1,5 +1,5 @@
 from rest_framework import serializers
-from .models import Company, Job, JobApplication
+from .models import Company, Job, JobApplication, JobMatch, SavedSearch, SavedSearchMatch
 
 class CompanySerializer(serializers.ModelSerializer):
     class Meta:
@@ -14,8 +14,8 @@ class JobSerializer(serializers.ModelSerializer):
         model = Job
         fields = ['id', 'title', 'company', 'company_name', 'location', 'job_type', 'description', 
                  'requirements', 'salary_min', 'salary_max', 'application_url', 'source', 'status', 
-                 'keywords', 'created_at', 'updated_at']
-        read_only_fields = ['id', 'created_at', 'updated_at']
+                 'keywords', 'enrichment_status', 'created_at', 'updated_at']
+        read_only_fields = ['id', 'enrichment_status', 'created_at', 'updated_at']
 
 class JobApplicationSerializer(serializers.ModelSerializer):
     job_title = serializers.CharField(source='job.title', read_only=True)
@@ -26,4 +26,27 @@ class JobApplicationSerializer(serializers.ModelSerializer):
         model = JobApplication
         fields = ['id', 'user', 'job', 'job_title', 'company_name', 'resume', 'resume_title', 
                  'cover_letter', 'status', 'applied_date', 'updated_at', 'match_score', 'notes']
-        read_only_fields = ['id', 'user', 'applied_date', 'updated_at']
\ No newline at end of file
+        read_only_fields = ['id', 'user', 'applied_date', 'updated_at']
+
+class JobMatchSerializer(serializers.ModelSerializer):
+    job = JobSerializer(read_only=True)
+    resume_title = serializers.CharField(source='resume.title', read_only=True)
+
+    class Meta:
+        model = JobMatch
+        fields = ['id', 'job', 'resume', 'resume_title', 'match_score', 'created_at']
+        read_only_fields = fields
+
+class SavedSearchSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = SavedSearch
+        fields = ['id', 'query', 'location', 'terms', 'is_active', 'created_at', 'updated_at']
+        read_only_fields = ['id', 'terms', 'created_at', 'updated_at']
+
+class SavedSearchMatchSerializer(serializers.ModelSerializer):
+    job = JobSerializer(read_only=True)
+
+    class Meta:
+        model = SavedSearchMatch
+        fields = ['id', 'search', 'job', 'created_at']
+        read_only_fields = fields
@@ -0,0 +1,155 @@
+"""Compiled skill and role matching shared by the scrapers and resume matching.
+
+All skills (with aliases) and all role keywords are compiled into a single alternation
+regex each, so extracting skills or checking a title is one left-to-right pass over the
+text instead of one scan per term. The vocabulary lives in `skill_taxonomy.json`
+(override with settings.SKILL_TAXONOMY_PATH); edits are picked up without a restart.
+"""
+import json
+import logging
+import os
+import re
+import threading
+import time
+from functools import lru_cache
+from pathlib import Path
+
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TAXONOMY_PATH = Path(__file__).resolve().parent / 'skill_taxonomy.json'
+# How often (seconds) the taxonomy file's mtime is checked for edits
+_RELOAD_CHECK_SECONDS = 5.0
+
+_HTML_TAG = re.compile(r'<[^>]*>')
+
+
+def _trie_pattern(variants) -> str:
+    """Factor the variants into a prefix trie regex ("react(?: native)?|ruby|...").
+
+    Python's re tries alternation branches one by one, so a flat list of ~100 terms
+    costs ~100 attempts per text position; a trie rejects most positions on the first
+    character. Longer continuations come before shorter ones, so the longest alias wins.
+    """
+    trie: dict = {}
+    for v in variants:
+        node = trie
+        for ch in v:
+            node = node.setdefault(ch, {})
+        node[''] = True
+
+    def build(node) -> str:
+        end = node.get('') is True
+        branches = []
+        for ch in sorted(k for k in node if k):
+            atom = r'\s+' if ch == ' ' else re.escape(ch)
+            branches.append(atom + build(node[ch]))
+        if not branches:
+            return ''
+        inner = branches[0] if len(branches) == 1 else '(?:' + '|'.join(branches) + ')'
+        if end:
+            return inner + '?' if len(branches) == 1 and len(branches[0]) == 1 else f'(?:{inner})?'
+        return inner
+
+    return build(trie)
+
+
+class TermMatcher:
+    """Matches a vocabulary of canonical terms and their aliases in one regex pass.
+
+    `whole_word` requires a boundary on both sides (skills: "go" must not match
+    "google"); otherwise only the left side is anchored so plurals still match roles
+    ("developers" contains "developer").
+    """
+
+    def __init__(self, terms: dict[str, list[str]], whole_word: bool = True):
+        self.canonical: list[str] = list(terms)
+        self._order = {name: i for i, name in enumerate(self.canonical)}
+        self._lookup: dict[str, str] = {}
+        for name, aliases in terms.items():
+            for variant in [name, *(aliases or [])]:
+                key = self._key(variant)
+                if key:
+                    self._lookup.setdefault(key, name)
+        body = _trie_pattern(self._lookup)
+        right = r'(?![\w+#])' if whole_word else ''
+        self._regex = re.compile(rf'(?<![\w+#])(?:{body}){right}' if body else r'(?!x)x')
+
+    @staticmethod
+    def _key(text: str) -> str:
+        return ' '.join((text or '').lower().split())
+
+    def findall(self, text: str) -> list[str]:
+        """Canonical terms present in `text`, unique, in vocabulary order."""
+        if not text:
+            return []
+        # Lowercasing up front is far cheaper than a case-insensitive regex
+        found = {self._lookup.get(self._key(m.group(0))) for m in self._regex.finditer(text.lower())}
+        found.discard(None)
+        return sorted(found, key=self._order.__getitem__)
+
+    def search(self, text: str) -> bool:
+        return bool(text) and self._regex.search(text.lower()) is not None
+
+
+_LOCK = threading.Lock()
+_STATE = {'path': None, 'mtime': None, 'checked': 0.0, 'skills': None, 'roles': None}
+
+
+def taxonomy_path() -> Path:
+    return Path(getattr(settings, 'SKILL_TAXONOMY_PATH', None) or DEFAULT_TAXONOMY_PATH)
+
+
+def _load() -> tuple[TermMatcher, TermMatcher]:
+    now = time.monotonic()
+    if _STATE['skills'] is not None and now - _STATE['checked'] < _RELOAD_CHECK_SECONDS:
+        return _STATE['skills'], _STATE['roles']
+    with _LOCK:
+        path = taxonomy_path()
+        try:
+            mtime = os.stat(path).st_mtime
+        except OSError:
+            mtime = None
+        _STATE['checked'] = now
+        if _STATE['skills'] is not None and (path, mtime) == (_STATE['path'], _STATE['mtime']):
+            return _STATE['skills'], _STATE['roles']
+        try:
+            data = json.loads(path.read_text(encoding='utf-8'))
+            skills = TermMatcher(data.get('skills') or {}, whole_word=True)
+            roles = TermMatcher({r: [] for r in data.get('roles') or []}, whole_word=False)
+        except Exception as e:
+            logger.error(f"Failed to load skill taxonomy {path}: {e}")
+            if _STATE['skills'] is not None:
+                return _STATE['skills'], _STATE['roles']
+            skills, roles = TermMatcher({}), TermMatcher({}, whole_word=False)
+        _STATE.update(path=path, mtime=mtime, skills=skills, roles=roles)
+        return skills, roles
+
+
+def skill_matcher() -> TermMatcher:
+    return _load()[0]
+
+
+def role_matcher() -> TermMatcher:
+    return _load()[1]
+
+
+@lru_cache(maxsize=32)
+def role_matcher_for(role_keywords: tuple[str, ...]) -> TermMatcher:
+    """Matcher for a caller-supplied role list (e.g. search_jobs_across_portals(role_keywords=...))."""
+    return TermMatcher({r: [] for r in role_keywords}, whole_word=False)
+
+
+def extract_skills(text: str, strip_html: bool = False) -> list[str]:
+    """Canonical skills mentioned in `text` (aliases normalized, e.g. "golang" -> "go")."""
+    if not text:
+        return []
+    if strip_html:
+        text = _HTML_TAG.sub(' ', text)
+    return skill_matcher().findall(text)
+
+
+def is_role(title: str) -> bool:
+    """True when a job title looks like a software/CS role."""
+    return role_matcher().search(title or '')
@@ -6,5 +6,9 @@ urlpatterns = [
     path('search/', views.search_live_jobs, name='search_live_jobs'),
     path('<int:job_id>/', views.get_job_by_id, name='get_job_by_id'),
     path('matching/<int:resume_id>/', views.find_matching_jobs, name='find_matching_jobs'),
+    path('matches/', views.get_job_matches, name='get_job_matches'),
+    path('saved-searches/', views.saved_searches, name='saved_searches'),
+    path('saved-searches/<int:search_id>/', views.delete_saved_search, name='delete_saved_search'),
+    path('saved-searches/<int:search_id>/matches/', views.get_saved_search_matches, name='get_saved_search_matches'),
     path('apply/<int:job_id>/', views.apply_to_job, name='apply_to_job'),
 ]
@@ -0,0 +1,777 @@
+"""Persistent TF-IDF index of job postings for resume matching.
+
+Job term counts (`JobVector`) and corpus document frequencies (`TermStat`) are kept up
+to date by Job save/delete signals, and `CorpusState.version` is bumped on every change.
+Each worker process holds a `JobVectorIndex` snapshot built from those tables: one
+L2-normalized sparse row per active job, weighted with corpus-wide IDF. Matching a
+resume is then one sparse matrix-vector product plus a top-k selection, and scores are
+comparable across requests because every job is weighted against the same corpus.
+"""
+import bisect
+import json
+import logging
+import math
+import mmap
+import os
+import shutil
+import tempfile
+import threading
+import time
+from collections import Counter
+from datetime import datetime, timezone as dt_timezone
+from pathlib import Path
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import F
+
+from resumes.matching import (
+    PREPROCESS_VERSION, RandomProjectionLSH, calculate_match_scores, job_fields, preprocess_job_text,
+    preprocess_text, processed_job_text, split_tokens,
+)
+
+from .models import CorpusState, Job, JobVector, TermStat
+from .pipeline import batched
+
+# numpy/scipy come with scikit-learn, which is optional; without them matching falls
+# back to the per-request scoring in resumes.matching
+try:
+    import numpy as np
+    from scipy import sparse
+    NUMPY_AVAILABLE = True
+except Exception:
+    NUMPY_AVAILABLE = False
+    np = None
+    sparse = None
+
+logger = logging.getLogger(__name__)
+
+# TermStat.term max_length; longer tokens (base64 blobs, URLs) are not indexed
+MAX_TERM_LENGTH = 100
+
+# BM25 parameters for candidate retrieval
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+
+def index_setting(name: str, default):
+    """settings.JOB_VECTOR_INDEX[name], or `default`."""
+    return (getattr(settings, 'JOB_VECTOR_INDEX', None) or {}).get(name, default)
+
+
+def match_threshold() -> float:
+    """Default minimum match score, on this index's scale (settings.JOB_MATCH_THRESHOLD)."""
+    return float(getattr(settings, 'JOB_MATCH_THRESHOLD', 40.0))
+
+
+def text_terms(processed: str) -> dict[str, int]:
+    """Term counts of preprocessed job text, as stored in JobVector.terms."""
+    counts = Counter(split_tokens(processed))
+    return {t: n for t, n in counts.items() if len(t) <= MAX_TERM_LENGTH}
+
+
+def job_terms(description, requirements) -> dict[str, int]:
+    return text_terms(preprocess_job_text(description, requirements))
+
+
+# ---- incremental maintenance ----
+
+def _bump_corpus(documents_delta: int = 0):
+    CorpusState.objects.get_or_create(pk=1)
+    CorpusState.objects.filter(pk=1).update(version=F('version') + 1, documents=F('documents') + documents_delta)
+
+
+def _apply_df(added, removed):
+    # Batched to stay under the database's bound-parameter limit on long descriptions
+    for terms in batched(sorted(added), 500):
+        TermStat.objects.bulk_create([TermStat(term=t, df=0) for t in terms], ignore_conflicts=True)
+        TermStat.objects.filter(term__in=terms).update(df=F('df') + 1)
+    for terms in batched(sorted(removed), 500):
+        TermStat.objects.filter(term__in=terms, df__gt=0).update(df=F('df') - 1)
+
+
+def index_job(job: Job):
+    """Update a job's stored vector and the corpus document frequencies after a save."""
+    active = job.status == 'active'
+    terms = text_terms(processed_job_text(job)[1]) if active else {}
+    try:
+        with transaction.atomic():
+            vec = JobVector.objects.select_for_update().filter(job_id=job.pk).first()
+            if not vec and not active:
+                JobVector.objects.create(job_id=job.pk, terms={}, active=False)
+                return
+            old_terms = set(vec.terms) if vec and vec.active else set()
+            if vec and vec.active == active and (vec.terms == terms or not active):
+                return
+            new_terms = set(terms)
+            _apply_df(new_terms - old_terms, old_terms - new_terms)
+            JobVector.objects.update_or_create(job_id=job.pk, defaults={'terms': terms, 'active': active})
+            was_active = bool(vec and vec.active)
+            _bump_corpus(int(active) - int(was_active))
+    except Exception as e:
+        logger.error(f"Failed to index job {job.pk}: {e}")
+
+
+def index_jobs(jobs):
+    """index_job() for many jobs written without signals (bulk_create/bulk_update): one
+    vector query, batched document-frequency updates and a single corpus version bump.
+    """
+    jobs = {job.pk: job for job in jobs}
+    if not jobs:
+        return
+    try:
+        with transaction.atomic():
+            vectors = {v.job_id: v for v in JobVector.objects.select_for_update().filter(job_id__in=list(jobs))}
+            df_delta: Counter = Counter()
+            created, changed, documents_delta = [], [], 0
+            for job_id, job in jobs.items():
+                active = job.status == 'active'
+                terms = text_terms(processed_job_text(job)[1]) if active else {}
+                vec = vectors.get(job_id)
+                if vec is None:
+                    created.append(JobVector(job_id=job_id, terms=terms, active=active))
+                    old_terms, was_active = set(), False
+                elif vec.active == active and (vec.terms == terms or not active):
+                    continue
+                else:
+                    old_terms, was_active = (set(vec.terms) if vec.active else set()), vec.active
+                    vec.terms, vec.active = terms, active
+                    vec.updated_at = datetime.now(dt_timezone.utc)
+                    changed.append(vec)
+                df_delta.update(set(terms) - old_terms)
+                df_delta.subtract(old_terms - set(terms))
+                documents_delta += int(active) - int(was_active)
+            if not created and not changed:
+                return
+            by_delta: dict[int, list[str]] = {}
+            for term, delta in df_delta.items():
+                if delta:
+                    by_delta.setdefault(delta, []).append(term)
+            for terms in batched(sorted(t for t, d in df_delta.items() if d > 0), 500):
+                TermStat.objects.bulk_create([TermStat(term=t, df=0) for t in terms], ignore_conflicts=True)
+            for delta, group in by_delta.items():
+                for terms in batched(sorted(group), 500):
+                    if delta > 0:
+                        TermStat.objects.filter(term__in=terms).update(df=F('df') + delta)
+                    else:
+                        TermStat.objects.filter(term__in=terms, df__gte=-delta).update(df=F('df') + delta)
+            JobVector.objects.bulk_create(created)
+            JobVector.objects.bulk_update(changed, ['terms', 'active', 'updated_at'])
+            _bump_corpus(documents_delta)
+    except Exception as e:
+        logger.error(f"Failed to index {len(jobs)} jobs: {e}")
+
+
+def unindex_job(job_id: int):
+    """Remove a job from the corpus statistics before it is deleted."""
+    try:
+        with transaction.atomic():
+            vec = JobVector.objects.select_for_update().filter(job_id=job_id).first()
+            if not vec:
+                return
+            if vec.active:
+                _apply_df(set(), set(vec.terms))
+            vec.delete()
+            _bump_corpus(-1 if vec.active else 0)
+    except Exception as e:
+        logger.error(f"Failed to unindex job {job_id}: {e}")
+
+
+def rebuild_index(job_model=Job, vector_model=JobVector, term_model=TermStat, state_model=CorpusState,
+                  batch_size: int = 1000) -> int:
+    """Recompute every job vector and all document frequencies from scratch.
+    Model classes are parameters so the data migration can pass historical models.
+    Returns the number of active jobs indexed.
+    """
+    df: Counter = Counter()
+    documents = 0
+    # Historical models from before the normalized_text column have no cache to read
+    cached = any(f.name == 'normalized_text' for f in job_model._meta.get_fields())
+    columns = ('preprocess_version', 'normalized_text') if cached else ()
+    with transaction.atomic():
+        vector_model.objects.all().delete()
+        term_model.objects.all().delete()
+        batch = []
+        rows = job_model.objects.values_list('id', 'description', 'requirements', 'status', *columns)
+        for job_id, description, requirements, status, *cache in rows.iterator(chunk_size=batch_size):
+            active = status == 'active'
+            if not active:
+                terms = {}
+            elif cache and cache[0] == PREPROCESS_VERSION:
+                terms = text_terms(cache[1] or '')
+            else:
+                terms = job_terms(description, requirements)
+            if active:
+                documents += 1
+                df.update(terms.keys())
+            batch.append(vector_model(job_id=job_id, terms=terms, active=active))
+            if len(batch) >= batch_size:
+                vector_model.objects.bulk_create(batch)
+                batch = []
+        vector_model.objects.bulk_create(batch)
+        term_model.objects.bulk_create([term_model(term=t, df=n) for t, n in df.items()], batch_size=batch_size)
+        state_model.objects.get_or_create(pk=1)
+        state_model.objects.filter(pk=1).update(version=F('version') + 1, documents=documents)
+    return documents
+
+
+# ---- snapshot ----
+
+class MappedVocabulary:
+    """Read-only term -> column lookup over a sorted UTF-8 term table on disk.
+    Supports the subset of the dict interface JobVectorIndex uses (get, len, iteration).
+    """
+
+    def __init__(self, path: Path, offsets):
+        self._offsets = offsets
+        self._blob = b''
+        if path.stat().st_size:
+            with open(path, 'rb') as f:
+                self._blob = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def __len__(self):
+        return len(self._offsets) - 1
+
+    def __getitem__(self, i: int) -> bytes:
+        return self._blob[self._offsets[i]:self._offsets[i + 1]]
+
+    def get(self, term: str, default=None):
+        key = term.encode('utf-8')
+        i = bisect.bisect_left(self, key)
+        return i if i < len(self) and self[i] == key else default
+
+    def __iter__(self):
+        return (self[i].decode('utf-8') for i in range(len(self)))
+
+
+class JobVectorIndex:
+    """Immutable in-memory snapshot of the job vectors at one corpus version.
+
+    Holds the L2-normalized TF-IDF rows used for scoring and, for candidate retrieval,
+    an inverted index: per-term postings (CSC columns) of BM25 weights.
+    """
+
+    def __init__(self, version: int, job_ids, vocabulary: dict[str, int], idf, matrix, postings, documents: int,
+                 path: Path | None = None, built_at: float | None = None):
+        self.version = version
+        # When the vectors were read (epoch seconds); later JobVector changes are not in it
+        self.built_at = built_at if built_at is not None else time.time()
+        # Snapshot directory the arrays are mapped from; None when built in memory
+        self.path = path
+        self.job_ids = job_ids
+        self.vocabulary = vocabulary
+        self.idf = idf
+        self.matrix = matrix
+        self.postings = postings
+        self.documents = documents
+        # IDF of a term no indexed job contains
+        self.unseen_idf = math.log(1 + documents) + 1.0
+
+    @classmethod
+    def load(cls) -> 'JobVectorIndex':
+        built_at = time.time()
+        state = CorpusState.objects.filter(pk=1).first()
+        df = dict(TermStat.objects.filter(df__gt=0).values_list('term', 'df').iterator(chunk_size=5000))
+        rows = JobVector.objects.filter(active=True).order_by('job_id').values_list('job_id', 'terms').iterator(chunk_size=2000)
+        return cls.from_vectors(rows, df, version=state.version if state else 0, built_at=built_at)
+
+    @classmethod
+    def from_vectors(cls, rows, df: dict[str, int] | None = None, version: int = 0,
+                     built_at: float | None = None) -> 'JobVectorIndex':
+        """Build a snapshot from (job_id, {term: count}) rows in ascending job_id order.
+        Without `df`, document frequencies are counted from the rows themselves.
+        """
+        if df is None:
+            rows = list(rows)
+            df = Counter(t for _, terms in rows for t in terms)
+        # Columns in sorted term order, so an exported snapshot can look terms up by binary search
+        terms_sorted = sorted(df)
+        vocabulary = {t: i for i, t in enumerate(terms_sorted)}
+        job_ids, indptr, indices, data = [], [0], [], []
+        for job_id, terms in rows:
+            job_ids.append(job_id)
+            for term, n in (terms or {}).items():
+                idx = vocabulary.get(term)
+                if idx is not None:
+                    indices.append(idx)
+                    data.append(n)
+            indptr.append(len(indices))
+        documents = len(job_ids)
+        if any(a >= b for a, b in zip(job_ids, job_ids[1:])):
+            raise ValueError("JobVectorIndex rows must be in ascending job_id order")
+        counts = sparse.csr_matrix(
+            (np.asarray(data, dtype=np.float64), np.asarray(indices, dtype=np.int32), np.asarray(indptr, dtype=np.int64)),
+            shape=(documents, len(vocabulary)),
+        )
+        df_arr = np.fromiter((df[t] for t in terms_sorted), dtype=np.float64, count=len(terms_sorted))
+
+        # Smoothed IDF, as TfidfVectorizer computes it
+        idf = np.log((1 + documents) / (1 + df_arr)) + 1.0
+        matrix = counts.multiply(idf).tocsr()
+        norms = np.sqrt(np.asarray(matrix.multiply(matrix).sum(axis=1)).ravel())
+        norms[norms == 0] = 1.0
+        matrix = (sparse.diags(1.0 / norms) @ matrix).tocsr()
+
+        # BM25 term weights per (job, term), stored term-major for posting-list lookups
+        lengths = np.asarray(counts.sum(axis=1)).ravel()
+        avgdl = lengths.mean() if documents and lengths.mean() > 0 else 1.0
+        # Lucene's variant: stays positive for terms that occur in most jobs
+        bm25_idf = np.log1p((np.maximum(documents - df_arr, 0.0) + 0.5) / (df_arr + 0.5))
+        tf = counts.data
+        row_len = np.repeat(lengths, np.diff(counts.indptr))
+        weights = bm25_idf[counts.indices] * tf * (BM25_K1 + 1) / (
+            tf + BM25_K1 * (1 - BM25_B + BM25_B * row_len / avgdl))
+        postings = sparse.csr_matrix((weights, counts.indices, counts.indptr), shape=counts.shape).tocsc()
+
+        return cls(version, np.asarray(job_ids, dtype=np.int64), vocabulary, idf, matrix, postings, documents,
+                   built_at=built_at)
+
+    @classmethod
+    def open(cls, path: Path) -> 'JobVectorIndex':
+        """Map an exported snapshot read-only. Arrays are not copied: every process that
+        opens the same snapshot shares one set of pages in the OS page cache.
+        """
+        meta = json.loads((path / 'meta.json').read_text(encoding='utf-8'))
+        documents, n_terms = meta['documents'], meta['terms']
+
+        def array(name):
+            return np.load(path / f'{name}.npy', mmap_mode='r')
+
+        matrix = sparse.csr_matrix(
+            (array('matrix_data'), array('matrix_indices'), array('matrix_indptr')),
+            shape=(documents, n_terms), copy=False,
+        )
+        postings = sparse.csc_matrix(
+            (array('postings_data'), array('postings_indices'), array('postings_indptr')),
+            shape=(documents, n_terms), copy=False,
+        )
+        vocabulary = MappedVocabulary(path / 'terms.bin', array('term_offsets'))
+        return cls(meta['version'], array('job_ids'), vocabulary, array('idf'), matrix, postings, documents,
+                   path=path, built_at=meta.get('built_at'))
+
+    def export(self, directory: Path) -> Path:
+        """Write this snapshot under `directory` and atomically make it the current one."""
+        directory.mkdir(parents=True, exist_ok=True)
+        tmp = Path(tempfile.mkdtemp(prefix='.tmp-', dir=directory))
+        try:
+            arrays = {
+                'job_ids': self.job_ids,
+                'idf': self.idf,
+                'matrix_data': self.matrix.data,
+                'matrix_indices': self.matrix.indices,
+                'matrix_indptr': self.matrix.indptr,
+                'postings_data': self.postings.data,
+                'postings_indices': self.postings.indices,
+                'postings_indptr': self.postings.indptr,
+            }
+            encoded = [t.encode('utf-8') for t in self.vocabulary]
+            arrays['term_offsets'] = np.concatenate(([0], np.cumsum([len(b) for b in encoded]))).astype(np.int64)
+            for name, arr in arrays.items():
+                np.save(tmp / f'{name}.npy', np.ascontiguousarray(arr))
+            (tmp / 'terms.bin').write_bytes(b''.join(encoded))
+            (tmp / 'meta.json').write_text(json.dumps({
+                'version': self.version,
+                'documents': self.documents,
+                'terms': len(encoded),
+                'built_at': self.built_at,
+                'created': time.time(),
+            }), encoding='utf-8')
+            final = directory / f'v{self.version}-{time.time_ns()}'
+            os.replace(tmp, final)
+        except Exception:
+            shutil.rmtree(tmp, ignore_errors=True)
+            raise
+
+        # Swap the pointer last; readers see either the old or the new snapshot, never a partial one
+        pointer = directory / f'.CURRENT-{os.getpid()}'
+        pointer.write_text(final.name, encoding='utf-8')
+        os.replace(pointer, directory / 'CURRENT')
+
+        # Keep the previous snapshot for workers that are switching over right now
+        snapshots = sorted((p for p in directory.glob('v*-*') if p.is_dir()), key=lambda p: p.stat().st_mtime)
+        for old in snapshots[:-2]:
+            shutil.rmtree(old, ignore_errors=True)
+        return final
+
+    def term(self, column: int) -> str:
+        if isinstance(self.vocabulary, MappedVocabulary):
+            return self.vocabulary[column].decode('utf-8')
+        if not hasattr(self, '_terms'):
+            self._terms = list(self.vocabulary)
+        return self._terms[column]
+
+    def rows_for(self, job_ids) -> 'np.ndarray':
+        """Row indices of the given job ids that are in this snapshot (job_ids is sorted)."""
+        ids = np.fromiter(job_ids, dtype=np.int64)
+        rows = np.searchsorted(self.job_ids, ids)
+        found = rows < self.documents
+        found[found] = self.job_ids[rows[found]] == ids[found]
+        return rows[found]
+
+    def _weights(self, counts: Counter) -> dict[str, float]:
+        """L2-normalized TF-IDF weights; terms outside the corpus still count toward the norm."""
+        weights = {}
+        for term, n in counts.items():
+            idx = self.vocabulary.get(term)
+            weights[term] = n * (self.idf[idx] if idx is not None else self.unseen_idf)
+        norm = math.sqrt(sum(w * w for w in weights.values()))
+        return {t: w / norm for t, w in weights.items()} if norm else {}
+
+    def query_vector(self, counts: Counter):
+        q = np.zeros(len(self.vocabulary))
+        for term, w in self._weights(counts).items():
+            idx = self.vocabulary.get(term)
+            if idx is not None:
+                q[idx] = w
+        return q
+
+    def candidates(self, counts: Counter, n: int, query_terms: int = 32):
+        """Row indices of the `n` best BM25 matches for the query's most salient terms.
+        Only the posting lists of those terms are read, so the cost follows their
+        lengths rather than the number of indexed jobs.
+        """
+        salient = sorted(
+            ((n_t * self.idf[idx], idx) for t, n_t in counts.items() if (idx := self.vocabulary.get(t)) is not None),
+            reverse=True,
+        )[:query_terms]
+        if not salient:
+            return np.zeros(0, dtype=np.int64)
+        indptr, indices, data = self.postings.indptr, self.postings.indices, self.postings.data
+        rows = np.concatenate([indices[indptr[c]:indptr[c + 1]] for _, c in salient])
+        weights = np.concatenate([data[indptr[c]:indptr[c + 1]] for _, c in salient])
+        if not rows.size:
+            return rows
+        # Accumulating into a dense per-job array is cheaper than sorting the postings
+        bm25 = np.bincount(rows, weights=weights, minlength=self.documents)
+        hits = np.flatnonzero(bm25)
+        if len(hits) > n:
+            hits = hits[np.argpartition(-bm25[hits], n - 1)[:n]]
+        return hits
+
+    def search(self, resume_text: str, k: int | None = None, threshold: float | None = None,
+               where=None, mode: str | None = None, candidates: int | None = None,
+               ann: RandomProjectionLSH | None = None, processed_resume: str | None = None,
+               job_ids=None, stats: dict | None = None) -> list[tuple[float, int]]:
+        """Best (match_score, job_id) pairs for a resume, best first.
+
+        `mode` (default JOB_VECTOR_INDEX['MODE']) picks the jobs that get the full TF-IDF score:
+          'exact' - every job (sharded across the scoring pool for large mapped snapshots);
+          'bm25'  - `candidates` jobs (default CANDIDATES; 0 means exact) retrieved by BM25
+                    over the inverted index;
+          'ann'   - jobs sharing a random-projection LSH bucket with the resume (`ann`,
+                    default this process's ann_index()).
+        `where(job_ids) -> allowed ids` filters results (role filter, queryset restriction);
+        it is called on ranked batches until `k` jobs are kept.
+        `processed_resume` (Resume.normalized_text) skips preprocessing resume_text.
+        `job_ids` (a DB prefilter's candidates) are scored instead, whatever the mode.
+        `stats['scored']` is set to the number of jobs that got the full score.
+        """
+        if not self.documents:
+            if stats is not None:
+                stats['scored'] = 0
+            return []
+        mode = mode or index_setting('MODE', 'bm25')
+        if candidates is None:
+            candidates = index_setting('CANDIDATES', 300)
+        if mode == 'bm25' and not candidates:
+            mode = 'exact'
+        if processed_resume is None:
+            processed_resume = preprocess_text(resume_text or '')
+        counts = Counter(split_tokens(processed_resume))
+        q = self.query_vector(counts)
+        if job_ids is not None:
+            rows = self.rows_for(sorted(job_ids))
+            scores = self.matrix[rows] @ q * 100.0
+        elif mode == 'ann':
+            weights = {t: w for t, w in self._weights(counts).items() if self.vocabulary.get(t) is not None}
+            ann = ann or ann_index(self)
+            rows = self.rows_for(ann.query(weights, probes=index_setting('ANN_PROBES', 2)))
+            scores = self.matrix[rows] @ q * 100.0
+        elif mode == 'bm25':
+            rows = self.candidates(counts, candidates, index_setting('QUERY_TERMS', 32))
+            scores = self.matrix[rows] @ q * 100.0
+        else:
+            from .scoring_pool import score_in_pool
+            parallel = score_in_pool(self, q, k=k if where is None else None, threshold=threshold)
+            if parallel is not None:
+                rows, scores = parallel
+            else:
+                rows = np.arange(self.documents)
+                scores = self.matrix @ q * 100.0
+        if stats is not None:
+            stats['scored'] = len(rows) if job_ids is not None or mode != 'exact' else self.documents
+        if threshold is not None:
+            keep = scores >= threshold
+            rows, scores = rows[keep], scores[keep]
+        if where is None and k is not None and len(rows) > k:
+            top = np.argpartition(-scores, k - 1)[:k]
+            rows, scores = rows[top], scores[top]
+        order = np.argsort(-scores, kind='stable')
+        ranked = [(float(scores[i]), int(self.job_ids[rows[i]])) for i in order]
+        if where is None:
+            return ranked
+        results = []
+        step = max(2 * (k or 0), 500)
+        for start in range(0, len(ranked), step):
+            batch = ranked[start:start + step]
+            allowed = where([job_id for _, job_id in batch])
+            for hit in batch:
+                if hit[1] in allowed:
+                    results.append(hit)
+                    if k is not None and len(results) >= k:
+                        return results
+        return results
+
+    def score_ids(self, processed_resume: str, job_ids) -> list[tuple[float, int]]:
+        """(match_score, job_id) for the given jobs that are in this snapshot, unordered."""
+        if not self.documents:
+            return []
+        rows = self.rows_for(sorted(job_ids))
+        if not len(rows):
+            return []
+        scores = self.matrix[rows] @ self.query_vector(Counter(split_tokens(processed_resume))) * 100.0
+        return [(float(score), int(job_id)) for score, job_id in zip(scores, self.job_ids[rows])]
+
+    def score_texts(self, resume_text: str, jobs, processed_resume: str | None = None):
+        """Yield (match_score, key) for jobs that are not (or not yet) in the snapshot,
+        weighted with the snapshot's IDF so scores are comparable with search().
+        Accepts the same inputs as resumes.matching.calculate_match_scores.
+        """
+        if processed_resume is None:
+            processed_resume = preprocess_text(resume_text or '')
+        q = self._weights(Counter(split_tokens(processed_resume)))
+        for job in jobs:
+            if not q:
+                yield 0.0, job[0] if isinstance(job, tuple) else job_fields(job)[0]
+                continue
+            key, text = processed_job_text(job)
+            w = self._weights(Counter(text_terms(text)))
+            yield sum(v * w.get(t, 0.0) for t, v in q.items()) * 100.0, key
+
+
+_SNAPSHOT: JobVectorIndex | None = None
+_SNAPSHOT_CHECKED = 0.0
+_SNAPSHOT_LOCK = threading.Lock()
+# Set while an in-memory index is rebuilt on a background thread
+_LOADING = threading.Event()
+
+# An export lock older than this is assumed to belong to a crashed exporter
+_EXPORT_LOCK_STALE_SECONDS = 600
+
+
+def snapshot_dir() -> Path | None:
+    """Directory of the shared memory-mapped snapshots, or None to build one per process."""
+    value = index_setting('SNAPSHOT_DIR', '')
+    return Path(value) if value else None
+
+
+def current_snapshot_path(directory: Path) -> Path | None:
+    try:
+        name = (directory / 'CURRENT').read_text(encoding='utf-8').strip()
+    except OSError:
+        return None
+    path = directory / name
+    return path if name and path.is_dir() else None
+
+
+def export_snapshot(directory: Path | None = None) -> Path:
+    """Build the index from the database and publish it as the current shared snapshot."""
+    directory = directory or snapshot_dir()
+    if directory is None:
+        raise ValueError("JOB_VECTOR_INDEX['SNAPSHOT_DIR'] is not set")
+    return JobVectorIndex.load().export(directory)
+
+
+def _acquire_export_lock(directory: Path) -> Path | None:
+    lock = directory / '.export.lock'
+    directory.mkdir(parents=True, exist_ok=True)
+    try:
+        if time.time() - lock.stat().st_mtime > _EXPORT_LOCK_STALE_SECONDS:
+            lock.unlink(missing_ok=True)
+    except OSError:
+        pass
+    try:
+        os.close(os.open(lock, os.O_CREAT | os.O_EXCL | os.O_WRONLY))
+    except FileExistsError:
+        return None
+    return lock
+
+
+def _export_in_background(directory: Path):
+    """Refresh the shared snapshot on a daemon thread; only one process exports at a time."""
+    lock = _acquire_export_lock(directory)
+    if lock is None:
+        return
+
+    def run():
+        from django.db import close_old_connections
+        try:
+            path = export_snapshot(directory)
+            logger.info(f"Exported job vector index snapshot {path.name}")
+        except Exception as e:
+            logger.error(f"Job vector index export failed: {e}")
+        finally:
+            lock.unlink(missing_ok=True)
+            close_old_connections()
+
+    threading.Thread(target=run, name='job-index-export', daemon=True).start()
+
+
+def _load_index() -> JobVectorIndex:
+    started = time.perf_counter()
+    index = JobVectorIndex.load()
+    logger.info(f"Loaded job vector index v{index.version}: {index.documents} jobs, "
+                f"{len(index.vocabulary)} terms in {time.perf_counter() - started:.2f}s")
+    return index
+
+
+def _load_in_background():
+    """Rebuild the in-memory index on a daemon thread; requests keep the current one meanwhile."""
+    if _LOADING.is_set():
+        return
+    _LOADING.set()
+
+    def run():
+        global _SNAPSHOT
+        from django.db import close_old_connections
+        try:
+            index = _load_index()
+            with _SNAPSHOT_LOCK:
+                # A newer snapshot (mapped meanwhile) is kept
+                if _SNAPSHOT is None or index.version > _SNAPSHOT.version:
+                    _SNAPSHOT = index
+        except Exception as e:
+            logger.error(f"Job vector index reload failed: {e}")
+        finally:
+            _LOADING.clear()
+            close_old_connections()
+
+    threading.Thread(target=run, name='job-index-load', daemon=True).start()
+
+
+def _map_current(directory: Path) -> JobVectorIndex | None:
+    path = current_snapshot_path(directory)
+    if path is None:
+        return None
+    if _SNAPSHOT is not None and _SNAPSHOT.path == path:
+        return _SNAPSHOT
+    try:
+        return JobVectorIndex.open(path)
+    except Exception as e:
+        # Removed or half-written by a concurrent refresh; retried on the next check
+        logger.error(f"Failed to map job vector index snapshot {path}: {e}")
+        return None
+
+
+def get_index() -> JobVectorIndex | None:
+    """This process's snapshot, refreshed when CorpusState.version has moved on.
+
+    With JOB_VECTOR_INDEX['SNAPSHOT_DIR'] set, the current exported snapshot is mapped
+    (shared by all workers); when it is behind the database, one worker re-exports it in
+    the background and everyone switches over on a later check. Without it, or until a
+    first export exists, the index is built in process memory: synchronously the first
+    time, then rebuilt on a background thread while requests keep the current one. The
+    version is checked at most every JOB_VECTOR_INDEX['RELOAD_SECONDS']. Returns None
+    without numpy/scipy.
+    """
+    global _SNAPSHOT, _SNAPSHOT_CHECKED
+    if not NUMPY_AVAILABLE:
+        return None
+    reload_seconds = index_setting('RELOAD_SECONDS', 30)
+    now = time.monotonic()
+    if _SNAPSHOT is not None and now - _SNAPSHOT_CHECKED < reload_seconds:
+        return _SNAPSHOT
+    with _SNAPSHOT_LOCK:
+        if _SNAPSHOT is not None and now - _SNAPSHOT_CHECKED < reload_seconds:
+            return _SNAPSHOT
+        version = CorpusState.objects.filter(pk=1).values_list('version', flat=True).first() or 0
+        directory = snapshot_dir()
+        mapped = _map_current(directory) if directory else None
+        if mapped is not None:
+            if mapped is not _SNAPSHOT:
+                logger.info(f"Mapped job vector index v{mapped.version} from {mapped.path}")
+            _SNAPSHOT = mapped
+        if directory and (mapped is None or mapped.version != version):
+            _export_in_background(directory)
+        if _SNAPSHOT is None:
+            _SNAPSHOT = _load_index()
+        elif mapped is None and _SNAPSHOT.version != version:
+            _load_in_background()
+        _SNAPSHOT_CHECKED = now
+        return _SNAPSHOT
+
+
+# ---- approximate nearest neighbours ----
+
+_ANN: RandomProjectionLSH | None = None
+_ANN_STATE: dict = {'version': None, 'synced_at': None, 'params': None}
+_ANN_LOCK = threading.Lock()
+
+# Rows projected per sparse x dense product while building the LSH tables
+_ANN_BUILD_CHUNK = 20000
+
+
+def build_ann(index: JobVectorIndex, bits: int | None = None, tables: int | None = None) -> RandomProjectionLSH:
+    """A fresh LSH over every job in `index` (its L2-normalized TF-IDF rows)."""
+    ann = RandomProjectionLSH(bits or index_setting('ANN_BITS', 8), tables or index_setting('ANN_TABLES', 16))
+    if not index.documents:
+        return ann
+    projection = ann.projection_matrix([index.term(i) for i in range(len(index.vocabulary))])
+    for start in range(0, index.documents, _ANN_BUILD_CHUNK):
+        stop = min(start + _ANN_BUILD_CHUNK, index.documents)
+        ann.add_projections(index.job_ids[start:stop].tolist(), index.matrix[start:stop] @ projection)
+    return ann
+
+
+def _ann_insert(ann: RandomProjectionLSH, index: JobVectorIndex, job_ids):
+    rows = index.rows_for(job_ids)
+    if not len(rows):
+        return
+    sub = index.matrix[rows].tocsc()
+    columns = np.flatnonzero(np.diff(sub.indptr))
+    projection = np.vstack([ann.term_projection(index.term(c)) for c in columns]) if len(columns) else \
+        np.zeros((0, ann.bits * ann.tables), dtype=np.float32)
+    ann.add_projections(index.job_ids[rows].tolist(), sub[:, columns] @ projection)
+
+
+def ann_index(index: JobVectorIndex) -> RandomProjectionLSH:
+    """This process's LSH tables, kept in step with the index snapshot incrementally.
+
+    Built once; afterwards each new snapshot version only removes jobs that left the
+    corpus and (re)inserts jobs that joined it or whose vector changed since the last
+    sync (JobVector.updated_at), so status changes cost O(changed jobs) hashing.
+    """
+    global _ANN
+    params = (index_setting('ANN_BITS', 8), index_setting('ANN_TABLES', 16))
+    with _ANN_LOCK:
+        if _ANN is not None and _ANN_STATE['version'] == index.version and _ANN_STATE['params'] == params:
+            return _ANN
+        synced_at = datetime.fromtimestamp(index.built_at, tz=dt_timezone.utc)
+        if _ANN is None or _ANN_STATE['params'] != params:
+            started = time.perf_counter()
+            _ANN = build_ann(index, *params)
+            logger.info(f"Built job LSH index ({params[1]} tables x {params[0]} bits) over "
+                        f"{len(_ANN)} jobs in {time.perf_counter() - started:.2f}s")
+        else:
+            current = set(index.job_ids.tolist())
+            for job_id in [j for j in _ANN.keys() if j not in current]:
+                _ANN.remove(job_id)
+            changed = set(JobVector.objects.filter(updated_at__gte=_ANN_STATE['synced_at'])
+                          .values_list('job_id', flat=True))
+            stale = sorted((current - set(_ANN.keys())) | (changed & current))
+            _ann_insert(_ANN, index, stale)
+        _ANN_STATE.update(version=index.version, synced_at=synced_at, params=params)
+        return _ANN
+
+
+def score_jobs(resume_text: str, jobs, processed_resume: str | None = None):
+    """Yield (match_score, key) for arbitrary jobs on the index's scale."""
+    index = get_index()
+    if index is None:
+        return calculate_match_scores(resume_text, jobs, processed_resume=processed_resume)
+    return index.score_texts(resume_text, jobs, processed_resume=processed_resume)
+
+
+def score_job(resume_text: str, job, processed_resume: str | None = None) -> float:
+    """Match score of one job (Job, JobRecord or dict) on the index's scale."""
+    return next(iter(score_jobs(resume_text, [job], processed_resume=processed_resume)))[0]
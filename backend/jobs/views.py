@@ -2,24 +2,39 @@ from rest_framework import viewsets, permissions, status
 from rest_framework.decorators import action, api_view, permission_classes
 from rest_framework.permissions import IsAuthenticated, AllowAny
 from rest_framework.response import Response
-from django.db.models import Q
 from django.shortcuts import get_object_or_404
-from .models import Company, Job, JobApplication
-from .serializers import CompanySerializer, JobSerializer, JobApplicationSerializer
-from .scraper import scrape_company_jobs, search_jobs_across_portals
+from .models import Company, Job, JobApplication, JobMatch, SavedSearch, SavedSearchMatch
+from .serializers import (CompanySerializer, JobSerializer, JobApplicationSerializer, JobMatchSerializer,
+                          SavedSearchSerializer, SavedSearchMatchSerializer)
+from .scraper import scrape_company_jobs, search_jobs_across_portals, iter_jobs_across_portals
+from .pipeline import ConcurrentSource, dedupe, filter_roles, top_k
+from .skills import is_role
+from .fast_read import JOB_READER
+from .fulltext import search_jobs
+from .match_cache import cached_search, queryset_scope
+from .preferences import PreferenceFilter, preference_for
+from .saved_searches import save_search
+from .vector_index import get_index, index_setting, match_threshold, score_job, score_jobs
+from jobportal.pagination import AppliedKeysetPagination, KeysetPagination, SearchPagination
 from resumes.models import Resume
-from resumes.matching import calculate_match_score, extract_skills_from_resume, preprocess_text
+from resumes.matching import calculate_match_scores, processed_job_rows, processed_resume_text, resume_skills
 import logging
+import time
+from itertools import chain
 
 logger = logging.getLogger(__name__)
 
 @api_view(['GET'])
 @permission_classes([AllowAny])
 def get_jobs(request):
-    """Get all active jobs"""
+    """Active jobs, newest first, one keyset page at a time ({next, previous, results});
+    with 'search', the ones matching it, best first (limit/offset pages with a count).
+    """
     jobs = Job.objects.filter(status='active')
-    serializer = JobSerializer(jobs, many=True)
-    return Response(serializer.data)
+    search = request.query_params.get('search')
+    if search:
+        return JOB_READER.paginate(request, search_jobs(jobs, search), SearchPagination())
+    return JOB_READER.paginate(request, jobs)
 
 @api_view(['GET'])
 @permission_classes([AllowAny])
@@ -29,6 +44,15 @@ def get_job_by_id(request, job_id):
     serializer = JobSerializer(job)
     return Response(serializer.data)
 
+def _load_catalog() -> list[dict]:
+    """Company careers catalog shipped with the app (JSON + TXT), or [] if missing"""
+    from pathlib import Path
+    from .ats import load_company_catalog
+    base = Path(__file__).resolve().parent
+    json_path = base / 'company_catalog.json'
+    txt_path = base / 'company_catalog_urls.txt'
+    return load_company_catalog([str(json_path), str(txt_path)])
+
 @api_view(['GET'])
 @permission_classes([AllowAny])
 def search_live_jobs(request):
@@ -52,32 +76,21 @@ def search_live_jobs(request):
             max_per_portal = 10
         include_ats = str(request.query_params.get('include_ats', '1')).lower() in ['1', 'true', 'yes', 'on']
 
-        results = search_jobs_across_portals(keywords=q, location=location, max_per_portal=max_per_portal, country=country)
-
+        # Catalog pages stream in while the portal search runs
+        sources = []
         if include_ats:
             try:
-                from pathlib import Path
-                from .ats import load_company_catalog, scrape_companies_from_catalog
-                base = Path(__file__).resolve().parent
-                json_path = base / 'company_catalog.json'
-                txt_path = base / 'company_catalog_urls.txt'
-                catalog = load_company_catalog([str(json_path), str(txt_path)])
+                from .ats import iter_companies_from_catalog
+                catalog = _load_catalog()
                 if catalog:
-                    ats_items = scrape_companies_from_catalog(catalog, max_per_company=10)
-                    results.extend(ats_items)
+                    sources.append(ConcurrentSource([lambda: iter_companies_from_catalog(catalog, max_per_company=10)], name='catalog-search'))
             except Exception:
                 pass
 
-        # Dedupe by URL
-        seen = set()
-        deduped = []
-        for it in results:
-            url = it.get('application_url') if isinstance(it, dict) else None
-            if not url or url in seen:
-                continue
-            seen.add(url)
-            deduped.append(it)
+        results = search_jobs_across_portals(keywords=q, location=location, max_per_portal=max_per_portal, country=country)
 
+        # Dedupe by URL
+        deduped = [it.to_api() for it in dedupe(chain(results, *sources))]
         return Response(deduped)
     except Exception as e:
         logger.error(f"Error in live job search: {e}")
@@ -91,9 +104,9 @@ def _keywords_from_resume(resume) -> str:
         text = (getattr(resume, 'parsed_content', '') or '').strip()
         keywords: list[str] = []
         if text:
-            # Prefer explicit skills extracted from the full resume text
+            # Prefer explicit skills extracted from the full resume text (cached on save)
             try:
-                skills = extract_skills_from_resume(text)
+                skills = resume_skills(resume)
                 keywords.extend(skills or [])
             except Exception:
                 pass
@@ -101,7 +114,7 @@ def _keywords_from_resume(resume) -> str:
             if len(keywords) < 5:
                 try:
                     from collections import Counter
-                    tokens = (preprocess_text(text) or '').split()
+                    tokens = processed_resume_text(resume).split()
                     common = [tok for tok, _ in Counter(tokens).most_common(12)]
                     keywords.extend([k for k in common if k not in keywords])
                 except Exception:
@@ -124,117 +137,149 @@ def _keywords_from_resume(resume) -> str:
     except Exception:
         return 'software developer engineer python django react'
 
+# Upper bound on matches returned by find_matching_jobs (keeps the ranking heap bounded)
+MATCH_RESULTS_LIMIT = 200
+
+def _best_effort(scored):
+    """Yield external matches until the stream fails; the ones already yielded are kept"""
+    try:
+        yield from scored
+    except Exception as e:
+        logger.error(f"External job matching stopped early: {e}")
+
 @api_view(['GET'])
 def find_matching_jobs(request, resume_id):
     """Find jobs matching a resume.
-    Accepts optional query param 'threshold' in range [0,1] (default: 0.3 if resume has content, else 0.0).
+    Accepts optional query param 'threshold' in range [0,1] (default: settings.JOB_MATCH_THRESHOLD / 100)
+    and 'limit' (max matches returned, default 200). 'mode' (exact|bm25|ann) overrides
+    settings.JOB_VECTOR_INDEX['MODE'] for candidate selection. The resume's JobPreference
+    (remote, locations, min_salary, skills) narrows the jobs before scoring unless
+    'preferences=0'.
     Returns a list of { job, match_score } sorted descending.
     """
+    started = time.perf_counter()
     try:
         resume = Resume.objects.get(id=resume_id)
         jobs = Job.objects.filter(status='active')
 
-        # Determine threshold (default 60%)
+        prefilter, job_ids = None, None
+        if str(request.query_params.get('preferences', '1')).lower() not in ['0', 'false', 'no', 'off']:
+            preference = preference_for(resume)
+            if preference is not None:
+                prefilter = PreferenceFilter(preference)
+                if prefilter.applied:
+                    jobs = jobs.filter(prefilter.q())
+                else:
+                    prefilter = None
+
+        # Determine threshold (default settings.JOB_MATCH_THRESHOLD)
         try:
             th_param = request.query_params.get('threshold')
             th = float(th_param) if th_param is not None else None
         except Exception:
             th = None
-        threshold_percent = (th * 100.0) if th is not None else 60.0
-
-        # Role filter: only software/CS engineering roles
-        role_keywords = [
-            'software engineer', 'software developer', 'developer', 'engineer', 'sde',
-            'full stack', 'fullstack', 'backend', 'front end', 'frontend', 'web developer',
-            'android', 'ios', 'mobile developer', 'devops', 'site reliability', 'sre',
-            'data engineer', 'ml engineer', 'ai engineer', 'cloud engineer'
-        ]
-        def role_ok(title: str) -> bool:
-            t = (title or '').lower()
-            return any(tok in t for tok in role_keywords)
-        
-        # Calculate match scores for each job in DB first
-        job_matches = []
-        for job in jobs:
-            if not role_ok(job.title):
-                continue
-            try:
-                match_score = calculate_match_score(
-                    resume.parsed_content or "",
-                    job.description or "",
-                    job.requirements or "",
-                )
-            except Exception:
-                match_score = 0.0
-            if match_score >= threshold_percent:
-                job_matches.append({
-                    'job': JobSerializer(job).data,
-                    'match_score': round(match_score, 2)
-                })
-
-        # Also aggregate from external portals and ATS catalogs (no DB writes), and include
+        threshold_percent = (th * 100.0) if th is not None else match_threshold()
         try:
-            from .ats import scrape_companies_from_catalog
-            import json
-            from pathlib import Path
-
-            # Allow disabling external fetch for speed via ?external=0
-            external_enabled = str(request.query_params.get('external', '0')).lower() in ['1','true','yes','on']
-            external = []
-            if external_enabled:
-                external = search_jobs_across_portals(
-                    keywords=_keywords_from_resume(resume),
-                    location=request.query_params.get('location') or 'India',
-                    country=request.query_params.get('country') or 'India',
-                    max_per_portal=int(request.query_params.get('max') or 5),
-                )
-            # ATS catalog
-            try:
-                base = Path(__file__).resolve().parent
-                json_path = base / 'company_catalog.json'
-                txt_path = base / 'company_catalog_urls.txt'
-                from .ats import load_company_catalog
-                catalog = load_company_catalog([str(json_path), str(txt_path)])
-                ats_items = scrape_companies_from_catalog(catalog, max_per_company=10)
-                external.extend(ats_items)
-            except Exception:
-                pass
+            limit = max(1, int(request.query_params.get('limit') or MATCH_RESULTS_LIMIT))
+        except Exception:
+            limit = MATCH_RESULTS_LIMIT
+        mode = request.query_params.get('mode')
+        if mode not in ('exact', 'bm25', 'ann'):
+            mode = None
 
-            for item in external:
-                try:
-                    title = item.get('title') or ''
-                    if not role_ok(title):
-                        continue
-                    ms = calculate_match_score(
-                        resume.parsed_content or '',
-                        item.get('description') or '',
-                        item.get('requirements') or ''
-                    )
-                    if ms >= threshold_percent:
-                        job_matches.append({
-                            'job': {
-                                'title': title,
-                                'company': {'name': item.get('company_name') or 'Unknown'},
-                                'location': item.get('location') or '',
-                                'job_type': item.get('job_type') or 'full_time',
-                                'description': item.get('description') or '',
-                                'requirements': item.get('requirements') or '',
-                                'salary_min': item.get('salary_min'),
-                                'salary_max': item.get('salary_max'),
-                                'application_url': item.get('application_url'),
-                                'source': item.get('source') or '',
-                            },
-                            'match_score': round(ms, 2)
-                        })
-                except Exception:
+        resume_text = resume.parsed_content or ''
+        processed_resume = processed_resume_text(resume)
+
+        # Start external portal/ATS fetches first (no DB writes) so they run while DB jobs are scored
+        producers = []
+        # Allow disabling external fetch for speed via ?external=0
+        external_enabled = str(request.query_params.get('external', '0')).lower() in ['1','true','yes','on']
+        if external_enabled:
+            search_args = dict(
+                keywords=_keywords_from_resume(resume),
+                location=request.query_params.get('location') or 'India',
+                country=request.query_params.get('country') or 'India',
+                max_per_portal=int(request.query_params.get('max') or 5),
+            )
+            producers.append(lambda: iter_jobs_across_portals(**search_args))
+        from .ats import iter_companies_from_catalog
+        producers.append(lambda: iter_companies_from_catalog(_load_catalog(), max_per_company=10))
+        # External records arriving after the deadline are dropped; DB matches never wait longer
+        external = ConcurrentSource(producers, timeout=index_setting('EXTERNAL_TIMEOUT', 8.0), name='match-external')
+
+        index = get_index()
+        match_cache, stats = 'off', {}
+        if index is not None and prefilter is not None:
+            # Small candidate sets skip candidate selection and are scored outright
+            prefilter_max = index_setting('PREFILTER_MAX', 20000)
+            candidates = list(jobs.values_list('id', flat=True)[:prefilter_max + 1])
+            if len(candidates) <= prefilter_max:
+                job_ids = candidates
+        if index is not None:
+            # Candidates come from the inverted index; only the ranked ones have their titles checked
+            def role_jobs(job_ids):
+                return {job_id for job_id, title in jobs.filter(id__in=job_ids).values_list('id', 'title')
+                        if is_role(title)}
+            db_scored, match_cache = cached_search(index, resume, processed_resume, 'roles:' + queryset_scope(jobs),
+                                                   k=limit, threshold=threshold_percent, where=role_jobs, mode=mode,
+                                                   job_ids=job_ids, stats=stats)
+        else:
+            # No numpy/scipy: score the rows per request; winners are loaded as full Job rows below
+            rows = [(job_id, text) for job_id, text, title in processed_job_rows(jobs, 'title') if is_role(title)]
+            stats['scored'] = len(rows)
+            db_scored = calculate_match_scores(resume_text, rows, processed_resume=processed_resume)
+        external_records = filter(prefilter.accepts, external) if prefilter is not None else external
+
+        # External records are scored against the index's IDF as they arrive; only the best `limit` are kept.
+        # The DB ranking is taken first so a failing external source only costs its own records.
+        try:
+            best = top_k(db_scored, limit, threshold=threshold_percent)
+            best = top_k(chain(best, _best_effort(
+                score_jobs(resume_text, dedupe(filter_roles(external_records, is_role)),
+                           processed_resume=processed_resume),
+            )), limit, threshold=threshold_percent)
+        finally:
+            external.close()
+
+        db_jobs = JOB_READER.by_id(jobs.filter(id__in=[item for _, item in best if isinstance(item, int)]))
+
+        job_matches = []
+        for match_score, item in best:
+            if isinstance(item, int):
+                job_data = db_jobs.get(item)
+                if job_data is None:
                     continue
-        except Exception:
-            pass
-        
-        # Sort by match score (highest first)
-        job_matches.sort(key=lambda x: x['match_score'], reverse=True)
-        
-        return Response(job_matches)
+            else:
+                job_data = {
+                    'title': item.title,
+                    'company': {'name': item.company_name or 'Unknown'},
+                    'location': item.location,
+                    'job_type': item.job_type or 'full_time',
+                    'description': item.description,
+                    'requirements': item.requirements,
+                    'salary_min': item.salary_min,
+                    'salary_max': item.salary_max,
+                    'application_url': item.application_url,
+                    'source': item.source,
+                }
+            job_matches.append({'job': job_data, 'match_score': round(match_score, 2)})
+
+        elapsed_ms = (time.perf_counter() - started) * 1000.0
+        applied = ','.join(prefilter.applied) if prefilter is not None else 'none'
+        logger.info(f"Matched resume {resume.pk}: prefilter={applied} candidates="
+                    f"{len(job_ids) if job_ids is not None else 'all'} scored={stats.get('scored', 0)} "
+                    f"cache={match_cache} in {elapsed_ms:.1f}ms")
+
+        response = Response(job_matches)
+        # hit | incremental | miss | off: how the stored-job ranking was obtained
+        response['X-Match-Cache'] = match_cache
+        # Preference predicates applied in SQL, the jobs they left (when scored directly)
+        # and how many stored jobs got a full score
+        response['X-Match-Prefilter'] = applied
+        response['X-Match-Candidates'] = str(len(job_ids)) if job_ids is not None else 'all'
+        response['X-Match-Scored'] = str(stats.get('scored', 0))
+        response['Server-Timing'] = f'match;dur={elapsed_ms:.1f}'
+        return response
     except Resume.DoesNotExist:
         return Response(
             {"error": "Resume not found"}, 
@@ -247,6 +292,58 @@ def find_matching_jobs(request, resume_id):
             status=status.HTTP_500_INTERNAL_SERVER_ERROR
         )
 
+@api_view(['GET'])
+@permission_classes([IsAuthenticated])
+def get_job_matches(request):
+    """Newly ingested jobs matched to the user's resumes by reverse matching, newest first.
+    Accepts optional query param 'limit' (default 50).
+    """
+    try:
+        limit = max(1, min(int(request.query_params.get('limit') or 50), 500))
+    except Exception:
+        limit = 50
+    matches = JobMatch.objects.filter(user=request.user).select_related('job__company', 'resume')[:limit]
+    serializer = JobMatchSerializer(matches, many=True)
+    return Response(serializer.data)
+
+@api_view(['GET', 'POST'])
+@permission_classes([IsAuthenticated])
+def saved_searches(request):
+    """List the user's saved searches, or save one ({query, location}). New jobs matching a
+    saved search are announced as notifications.
+    """
+    if request.method == 'GET':
+        searches = SavedSearch.objects.filter(user=request.user, is_active=True)
+        return Response(SavedSearchSerializer(searches, many=True).data)
+    saved = save_search(request.user, request.data.get('query', ''), request.data.get('location', ''))
+    if saved is None:
+        return Response(
+            {"error": "Query has no searchable terms or the saved search limit was reached"},
+            status=status.HTTP_400_BAD_REQUEST
+        )
+    return Response(SavedSearchSerializer(saved).data, status=status.HTTP_201_CREATED)
+
+@api_view(['DELETE'])
+@permission_classes([IsAuthenticated])
+def delete_saved_search(request, search_id):
+    search = get_object_or_404(SavedSearch, id=search_id, user=request.user)
+    search.delete()
+    return Response(status=status.HTTP_204_NO_CONTENT)
+
+@api_view(['GET'])
+@permission_classes([IsAuthenticated])
+def get_saved_search_matches(request, search_id):
+    """Jobs that matched a saved search after they were ingested, newest first.
+    Accepts optional query param 'limit' (default 50).
+    """
+    search = get_object_or_404(SavedSearch, id=search_id, user=request.user)
+    try:
+        limit = max(1, min(int(request.query_params.get('limit') or 50), 500))
+    except Exception:
+        limit = 50
+    matches = SavedSearchMatch.objects.filter(search=search).select_related('job__company')[:limit]
+    return Response(SavedSearchMatchSerializer(matches, many=True).data)
+
 @api_view(['POST'])
 @permission_classes([IsAuthenticated])
 def apply_to_job(request, job_id):
@@ -340,18 +437,23 @@ class JobViewSet(viewsets.ModelViewSet):
     queryset = Job.objects.all()
     serializer_class = JobSerializer
     permission_classes = [permissions.IsAuthenticated]
+    pagination_class = KeysetPagination
+
+    @property
+    def paginator(self):
+        # Ranked search results are paged by offset; everything else by (created_at, id)
+        if not hasattr(self, '_paginator'):
+            searching = bool(self.request.query_params.get('search'))
+            self._paginator = SearchPagination() if searching else self.pagination_class()
+        return self._paginator
     
     def get_queryset(self):
-        queryset = Job.objects.filter(status='active')
+        queryset = Job.objects.filter(status='active').select_related('company')
         
-        # Filter by search query
+        # Filter by search query (full-text index, best matches first)
         search = self.request.query_params.get('search', None)
         if search:
-            queryset = queryset.filter(
-                Q(title__icontains=search) | 
-                Q(description__icontains=search) |
-                Q(company__name__icontains=search)
-            )
+            queryset = search_jobs(queryset, search)
         
         # Filter by location
         location = self.request.query_params.get('location', None)
@@ -399,11 +501,7 @@ class JobViewSet(viewsets.ModelViewSet):
             }, status=status.HTTP_400_BAD_REQUEST)
         
         # Calculate match score
-        match_score = calculate_match_score(
-            resume.parsed_content,
-            job.description,
-            job.requirements
-        )
+        match_score = score_job(resume.parsed_content, job, processed_resume=processed_resume_text(resume))
         
         # Create job application
         cover_letter = request.data.get('cover_letter', '')
@@ -422,9 +520,10 @@ class JobApplicationViewSet(viewsets.ModelViewSet):
     queryset = JobApplication.objects.all()
     serializer_class = JobApplicationSerializer
     permission_classes = [permissions.IsAuthenticated]
+    pagination_class = AppliedKeysetPagination
     
     def get_queryset(self):
-        return JobApplication.objects.filter(user=self.request.user)
+        return JobApplication.objects.filter(user=self.request.user).select_related('job__company', 'resume')
     
     def perform_create(self, serializer):
         # Get job and resume
@@ -436,11 +535,7 @@ class JobApplicationViewSet(viewsets.ModelViewSet):
             resume = Resume.objects.get(id=resume_id, user=self.request.user)
             
             # Calculate match score
-            match_score = calculate_match_score(
-                resume.parsed_content,
-                job.description,
-                job.requirements
-            )
+            match_score = score_job(resume.parsed_content, job, processed_resume=processed_resume_text(resume))
             
             serializer.save(user=self.request.user, match_score=match_score)
             
@@ -1,5 +1,5 @@
 from django.contrib import admin
-from .models import Resume
+from .models import ParsedFile, Resume, UploadPipeline
 
 
 @admin.register(Resume)
@@ -30,3 +30,21 @@ class ResumeAdmin(admin.ModelAdmin):
             return len(obj.skills)
         return 0
     get_skills_count.short_description = 'Skills Count'
+
+
+
+@admin.register(UploadPipeline)
+class UploadPipelineAdmin(admin.ModelAdmin):
+    list_display = ('id', 'user', 'resume', 'status', 'stage', 'progress', 'created_at', 'finished_at')
+    search_fields = ('user__username', 'resume__title')
+    list_filter = ('status', 'stage', 'created_at')
+    readonly_fields = ('created_at', 'updated_at', 'finished_at', 'summary', 'error')
+
+
+
+@admin.register(ParsedFile)
+class ParsedFileAdmin(admin.ModelAdmin):
+    list_display = ('sha256', 'file_format', 'size', 'parser_version', 'error', 'created_at')
+    search_fields = ('sha256',)
+    list_filter = ('file_format', 'parser_version')
+    readonly_fields = ('created_at', 'updated_at')
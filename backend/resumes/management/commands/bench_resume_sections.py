@@ -0,0 +1,137 @@
+import random
+import re
+import time
+
+from django.core.management.base import BaseCommand
+
+from resumes.matching import extract_resume_sections
+from resumes.sections import HEADINGS, parse_education, parse_experience, segment_sections
+
+
+def _legacy_experience(resume_text):
+    """The DOTALL/backtracking extractor the segmenter replaced, kept as the baseline."""
+    experience_text = ""
+    for pattern in [r'(?:work|professional)\s+experience(.*?)(?:education|skills|projects|references)',
+                    r'experience(.*?)(?:education|skills|projects|references)']:
+        match = re.search(pattern, resume_text, re.IGNORECASE | re.DOTALL)
+        if match:
+            experience_text = match.group(1).strip()
+            break
+    if not experience_text:
+        return []
+    positions = []
+    for pattern in [r'(.*?)(?:at|@)\s+(.*?)(?:\n|$)', r'(.*?)\s+-\s+(.*?)(?:\n|$)']:
+        for match in re.findall(pattern, experience_text):
+            positions.append({'position': match[0].strip(), 'company': match[1].strip()})
+    return positions
+
+
+_REALISTIC = '''Work Experience
+Senior Software Engineer at Acme Corp, Jan 2020 - Present
+- Built Python and Django services handling 10k requests per second
+- Led the migration to Kubernetes @ scale
+Software Developer - Globex (2016 - 2019)
+Education
+B.Tech in Computer Science, IIT Delhi, 2016
+Skills: Python, Django, PostgreSQL, Docker
+'''
+
+
+def _pathological(kind: str, n: int) -> str:
+    """Inputs that make lazy DOTALL scans and `(.*?)` captures restart at every position."""
+    if kind == 'wall':
+        # One pasted line with no separator and no closing heading
+        return 'Experience\n' + ' '.join('lorem' for _ in range(n // 6)) + 'x'
+    if kind == 'headings':
+        # The section keyword over and over, never terminated
+        return 'experience ' * (n // 11)
+    if kind == 'whitespace':
+        return 'Experience\nengineer' + ' ' * n + 'acme'
+    if kind == 'separators':
+        return 'Experience\n' + 'at @ - ' * (n // 7)
+    if kind == 'realistic':
+        return _REALISTIC * max(1, n // len(_REALISTIC))
+    raise ValueError(kind)
+
+
+_KINDS = ('realistic', 'wall', 'headings', 'whitespace', 'separators')
+
+
+def _fuzz_document(rnd: random.Random) -> str:
+    headings = list(HEADINGS)
+    atoms = ['at', '@', '-', '–', '|', ',', ':', '\n', '\n\n', ' ' * rnd.randint(1, 200), '\t', '•', '2019',
+             'B.Tech', 'University', 'Engineer', 'experience', 'education', '(', ')', '.*?', 'é', '中文', '\r\n']
+    parts = []
+    for _ in range(rnd.randint(1, 400)):
+        r = rnd.random()
+        if r < 0.1:
+            parts.append('\n' + rnd.choice(headings).upper() + rnd.choice(['', ':', ':\n']) + '\n')
+        elif r < 0.6:
+            parts.append(rnd.choice(atoms))
+        elif r < 0.95:
+            parts.append(''.join(rnd.choice('abcdefghij XYZ.,') for _ in range(rnd.randint(1, 30))))
+        else:
+            parts.append(rnd.choice('xa ') * rnd.randint(100, 5000))
+    return ' '.join(parts)
+
+
+class Command(BaseCommand):
+    help = ('Benchmark and fuzz the resume section segmenter: pathological inputs by size (with the legacy '
+            'regex extractor as baseline) and random documents checked for errors and linear cost.')
+
+    def add_arguments(self, parser):
+        parser.add_argument('--sizes', default='2000,20000,200000', help='Comma-separated input sizes (chars)')
+        parser.add_argument('--legacy-budget', type=float, default=1.0,
+                            help='Skip the legacy extractor on larger inputs once even linear growth would exceed this (s)')
+        parser.add_argument('--fuzz', type=int, default=500, help='Random documents to parse')
+        parser.add_argument('--seed', type=int, default=7)
+
+    def handle(self, *args, **opts):
+        sizes = [int(x) for x in opts['sizes'].split(',') if x.strip()]
+        self.stdout.write(f"{'input':<12} {'chars':>8} {'legacy ms':>10} {'segmenter ms':>13} {'ns/char':>8}")
+        for kind in _KINDS:
+            legacy_ok = True
+            per_char = []
+            for i, n in enumerate(sizes):
+                text = _pathological(kind, n)
+                t_new = self._time(extract_resume_sections, text)
+                per_char.append(t_new * 1e9 / len(text))
+                legacy = '-'
+                if legacy_ok:
+                    t_old = self._time(_legacy_experience, text)
+                    legacy = f'{t_old * 1000:.1f}'
+                    growth = sizes[i + 1] / n if i + 1 < len(sizes) else 1
+                    legacy_ok = t_old * growth < opts['legacy_budget']
+                self.stdout.write(f'{kind:<12} {len(text):>8} {legacy:>10} {t_new * 1000:>13.2f} {per_char[-1]:>8.0f}')
+            if len(per_char) > 1 and per_char[-1] > 4 * min(per_char):
+                self.stderr.write(f'{kind}: cost per char grew x{per_char[-1] / min(per_char):.1f} (not linear?)')
+
+        rnd = random.Random(opts['seed'])
+        failures, worst, total_chars, total_time = 0, 0.0, 0, 0.0
+        for _ in range(opts['fuzz']):
+            text = _fuzz_document(rnd)
+            started = time.perf_counter()
+            try:
+                # The parsers directly: extract_resume_sections logs and swallows errors
+                sections = segment_sections(text)
+                assert all(set(e) == {'position', 'company'} for e in parse_experience(sections.get('experience', [])))
+                assert all(set(e) == {'degree', 'institution', 'year'}
+                           for e in parse_education(sections.get('education', [])))
+            except Exception as e:
+                failures += 1
+                self.stderr.write(f'fuzz failure ({type(e).__name__}: {e}) on {text[:80]!r}...')
+            elapsed = time.perf_counter() - started
+            total_chars += len(text)
+            total_time += elapsed
+            if len(text) >= 10000:  # timer overhead dominates tiny documents
+                worst = max(worst, elapsed * 1e9 / len(text))
+        self.stdout.write(
+            f"fuzz: {opts['fuzz']} documents, {total_chars / 1e6:.1f}M chars, {failures} failures, "
+            f'{total_time * 1e9 / max(1, total_chars):.0f} ns/char mean, {worst:.0f} ns/char worst (>=10k chars)'
+        )
+
+    @staticmethod
+    def _time(fn, text) -> float:
+        started = time.perf_counter()
+        fn(text)
+        return time.perf_counter() - started
@@ -0,0 +1,47 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from resumes.matching import extract_resume_sections, normalize_resume
+from resumes.models import ParsedFile, Resume
+from resumes.parsing import PARSER_VERSION, parse_resume_file
+
+
+class Command(BaseCommand):
+    help = ('Extract text from stored resume files into parsed_content (and skills, experience, '
+            'education) for resumes never parsed server-side. Identical files are parsed once.')
+
+    def add_arguments(self, parser):
+        parser.add_argument('--all', action='store_true',
+                            help='Re-parse every resume, not only those without a file hash')
+
+    def handle(self, *args, **opts):
+        resumes = Resume.objects.exclude(file='').order_by('pk')
+        if not opts['all']:
+            resumes = resumes.filter(file_sha256='')
+        cached_before = ParsedFile.objects.filter(parser_version=PARSER_VERSION).count()
+        updated = empty = 0
+        started = time.perf_counter()
+        for resume in resumes.iterator():
+            try:
+                text = parse_resume_file(resume)
+            except FileNotFoundError:
+                self.stderr.write(f'resume {resume.pk}: file {resume.file.name} is missing')
+                continue
+            if not text:
+                empty += 1
+                resume.save(update_fields=['file_sha256', 'updated_at'])
+                continue
+            resume.parsed_content = text
+            normalize_resume(resume)
+            details = extract_resume_sections(text)
+            resume.skills = list(resume.parsed_skills)
+            resume.experience = details['experience']
+            resume.education = details['education']
+            resume.save()
+            updated += 1
+        parsed = ParsedFile.objects.filter(parser_version=PARSER_VERSION).count() - cached_before
+        self.stdout.write(
+            f'{updated} resumes updated, {empty} without extractable text; {parsed} distinct files parsed '
+            f'in {time.perf_counter() - started:.2f}s, the rest served from the content-hash cache'
+        )
@@ -0,0 +1,30 @@
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from resumes.models import UploadPipeline
+from resumes.pipeline import run_pipeline
+
+
+class Command(BaseCommand):
+    help = ('Run resume upload pipelines left queued by a restarted web process, oldest first. '
+            'Pipelines stuck in "running" longer than --stale-minutes are re-queued first.')
+
+    def add_arguments(self, parser):
+        parser.add_argument('--stale-minutes', type=int, default=30,
+                            help='Re-queue running pipelines not updated for this long (0 = never)')
+        parser.add_argument('--limit', type=int, default=None, help='Run at most this many pipelines')
+
+    def handle(self, *args, **opts):
+        if opts['stale_minutes']:
+            cutoff = timezone.now() - timedelta(minutes=opts['stale_minutes'])
+            requeued = UploadPipeline.objects.filter(status='running', updated_at__lt=cutoff).update(
+                status='queued', stage='queued', progress=0)
+            if requeued:
+                self.stdout.write(f'{requeued} stale pipelines re-queued')
+        ids = list(UploadPipeline.objects.filter(status='queued').order_by('created_at')
+                   .values_list('id', flat=True)[:opts['limit']])
+        ran = [pipeline_id for pipeline_id in ids if run_pipeline(pipeline_id)]
+        failed = UploadPipeline.objects.filter(id__in=ran, status='failed').count()
+        self.stdout.write(f'{len(ran)} pipelines run, {failed} failed')
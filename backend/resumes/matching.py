@@ -1,35 +1,72 @@
+import importlib.util
+import math
 import re
 import logging
+import zlib
+from collections import Counter
+from functools import lru_cache
+from itertools import islice
+
+from django.conf import settings
+
+from jobs.pipeline import batched
+from jobs.skills import extract_skills
+
+from .sections import parse_education, parse_experience, segment_sections
 
 logger = logging.getLogger(__name__)
 
-# Optional dependencies
+# Optional dependencies. numpy (installed with scikit-learn) is cheap and needed by the
+# batched scorer; scikit-learn (~1s) and NLTK are imported on first use instead, since
+# every URLconf import pulls in this module.
 try:
-    import nltk
-    from nltk.tokenize import word_tokenize
-    from nltk.corpus import stopwords
-    NLTK_AVAILABLE = True
+    import numpy as np
 except Exception:
-    NLTK_AVAILABLE = False
-    word_tokenize = None
-    stopwords = None
+    np = None
 
-try:
-    from sklearn.feature_extraction.text import TfidfVectorizer
-    from sklearn.metrics.pairwise import cosine_similarity
-    SKLEARN_AVAILABLE = True
-except Exception:
-    SKLEARN_AVAILABLE = False
-    TfidfVectorizer = None
-    cosine_similarity = None
+NLTK_AVAILABLE = importlib.util.find_spec('nltk') is not None
+SKLEARN_AVAILABLE = np is not None and importlib.util.find_spec('sklearn') is not None
+
+
+@lru_cache(maxsize=None)
+def _sklearn():
+    """(CountVectorizer, TfidfVectorizer, cosine_similarity), or None without scikit-learn."""
+    if not SKLEARN_AVAILABLE:
+        return None
+    try:
+        from sklearn.feature_extraction.text import CountVectorizer, TfidfVectorizer
+        from sklearn.metrics.pairwise import cosine_similarity
+    except Exception as e:
+        logger.error(f"scikit-learn failed to import, using fallback scoring: {e}")
+        return None
+    return CountVectorizer, TfidfVectorizer, cosine_similarity
 
-# Download NLTK resources if available
-if NLTK_AVAILABLE:
+
+@lru_cache(maxsize=None)
+def _nltk():
+    """(word_tokenize, English stopword set), or None when NLTK or its punkt/stopwords
+    data is missing. Data is never downloaded here: it is looked up on NLTK's own paths
+    plus settings.NLTK_DATA_DIR (provision it with `manage.py download_nltk_data`).
+    """
+    if not NLTK_AVAILABLE:
+        return None
     try:
-        nltk.download('punkt', quiet=True)
-        nltk.download('stopwords', quiet=True)
+        import nltk
+        from nltk.corpus import stopwords
+        from nltk.tokenize import word_tokenize
+        data_dir = str(getattr(settings, 'NLTK_DATA_DIR', '') or '')
+        if data_dir and data_dir not in nltk.data.path:
+            nltk.data.path.insert(0, data_dir)
+        stop_words = frozenset(stopwords.words('english'))
+        word_tokenize('warm up')  # raises LookupError when the punkt models are missing
+    except LookupError as e:
+        logger.warning(f"NLTK data not installed, using the regex tokenizer: {str(e).strip().splitlines()[0]}")
+        return None
     except Exception as e:
-        logger.error(f"Error downloading NLTK resources: {str(e)}")
+        logger.error(f"NLTK failed to load, using the regex tokenizer: {e}")
+        return None
+    return word_tokenize, stop_words
+
 
 # Basic fallback stopwords if NLTK is unavailable
 FALLBACK_STOPWORDS = {
@@ -46,10 +83,11 @@ def preprocess_text(text):
     text = re.sub(r'[^\w\s]', ' ', text)
     text = re.sub(r'\d+', ' ', text)
 
-    if NLTK_AVAILABLE and word_tokenize and stopwords:
+    nlp = _nltk()
+    if nlp:
+        word_tokenize, stop_words = nlp
         try:
             tokens = word_tokenize(text)
-            stop_words = set(stopwords.words('english'))
             tokens = [token for token in tokens if token not in stop_words]
         except Exception:
             tokens = re.findall(r'\b\w+\b', text)
@@ -68,7 +106,9 @@ def calculate_match_score(resume_text, job_description, job_requirements=None):
         if job_requirements:
             processed_job += " " + preprocess_text(job_requirements)
 
-        if SKLEARN_AVAILABLE and TfidfVectorizer and cosine_similarity:
+        sk = _sklearn()
+        if sk:
+            _, TfidfVectorizer, cosine_similarity = sk
             vectorizer = TfidfVectorizer()
             tfidf_matrix = vectorizer.fit_transform([processed_resume, processed_job])
             similarity = cosine_similarity(tfidf_matrix[0:1], tfidf_matrix[1:2])[0][0]
@@ -87,74 +127,351 @@ def calculate_match_score(resume_text, job_description, job_requirements=None):
         logger.error(f"Error calculating match score: {str(e)}")
         return 0.0
 
+# Jobs vectorized together by calculate_match_scores; bounds memory on large querysets
+SCORE_CHUNK_SIZE = 2000
+
+# Smoothed IDF TfidfVectorizer assigns, in a two-document fit, to a term that occurs in
+# only one of the documents (a term in both gets 1.0)
+_PAIR_UNIQUE_IDF = 1.0 + math.log(3 / 2)
+
+
+def job_fields(job):
+    """(key, description, requirements) for a Job, JobRecord, dict or
+    values_list('id', 'description', 'requirements') row; key is what gets yielded back.
+    """
+    if isinstance(job, tuple):
+        return job[0], job[1], job[2]
+    if isinstance(job, dict):
+        return job, job.get('description'), job.get('requirements')
+    return job, getattr(job, 'description', ''), getattr(job, 'requirements', '')
+
+
+def preprocess_job_text(description, requirements):
+    text = preprocess_text(description or '')
+    if requirements:
+        text += " " + preprocess_text(requirements)
+    return text
+
+
+def split_tokens(text):
+    # preprocess_text output is already lowercase word tokens; this matches the
+    # vectorizers' default token_pattern (2+ word chars) without another regex pass
+    return [t for t in text.split() if len(t) > 1]
+
+
+# Version of preprocess_text + skill extraction whose output is cached on Resume and Job
+# rows (normalized_text, parsed_skills). Bump it whenever either changes; rows with an
+# older version are recomputed on read until `manage.py normalize_texts` refreshes them.
+PREPROCESS_VERSION = 1
+
+
+def normalize_resume(resume):
+    """Fill a Resume's cached preprocessing columns from its parsed_content."""
+    text = resume.parsed_content or ''
+    resume.normalized_text = preprocess_text(text)
+    resume.parsed_skills = extract_skills_from_resume(text)
+    resume.preprocess_version = PREPROCESS_VERSION
+    resume._normalized_from = text
+
+
+def normalize_job(job):
+    """Fill a Job's cached preprocessing columns from its description and requirements."""
+    job.normalized_text = preprocess_job_text(job.description, job.requirements)
+    job.preprocess_version = PREPROCESS_VERSION
+    job._normalized_from = (job.description, job.requirements)
+
+
+def refresh_normalized(model, normalize, fields, batch_size=500, all_rows=False) -> int:
+    """Recompute the cached preprocessing columns of rows cached by another
+    PREPROCESS_VERSION (or of every row with `all_rows`, e.g. after a skill taxonomy
+    edit). Model classes are parameters so migrations can pass historical models.
+    Returns the number of rows updated.
+    """
+    rows = model.objects.all() if all_rows else model.objects.exclude(preprocess_version=PREPROCESS_VERSION)
+    updated = 0
+    for batch in batched(rows.order_by('pk').iterator(chunk_size=batch_size), batch_size):
+        for obj in batch:
+            normalize(obj)
+        model.objects.bulk_update(batch, fields)
+        updated += len(batch)
+    return updated
+
+
+def processed_resume_text(resume) -> str:
+    """preprocess_text(resume.parsed_content), from the cached column when it is current."""
+    if getattr(resume, 'preprocess_version', None) == PREPROCESS_VERSION:
+        return resume.normalized_text or ''
+    return preprocess_text(getattr(resume, 'parsed_content', '') or '')
+
+
+def resume_skills(resume) -> list[str]:
+    """Skills extracted from resume.parsed_content, from the cached column when it is current."""
+    if getattr(resume, 'preprocess_version', None) == PREPROCESS_VERSION:
+        return list(resume.parsed_skills or [])
+    return extract_skills_from_resume(getattr(resume, 'parsed_content', '') or '')
+
+
+def processed_job_text(job):
+    """(key, preprocessed description + requirements) for any job_fields() input.
+    Job rows read their cached normalized_text when it is current; (key, text) pairs are
+    taken as already preprocessed.
+    """
+    if isinstance(job, tuple) and len(job) == 2:
+        return job
+    if getattr(job, 'preprocess_version', None) == PREPROCESS_VERSION:
+        return job, job.normalized_text or ''
+    key, description, requirements = job_fields(job)
+    return key, preprocess_job_text(description, requirements)
+
+
+def processed_job_rows(queryset, *fields):
+    """(id, preprocessed text, *fields) for each job of a queryset, read from the cached
+    column; rows cached by an older PREPROCESS_VERSION are preprocessed here.
+    """
+    rows = queryset.values_list('id', 'preprocess_version', 'normalized_text', 'description', 'requirements', *fields)
+    for job_id, version, text, description, requirements, *extra in rows.iterator(chunk_size=SCORE_CHUNK_SIZE):
+        if version != PREPROCESS_VERSION:
+            text = preprocess_job_text(description, requirements)
+        yield (job_id, text, *extra)
+
+
+def _score_chunk(resume_counts: Counter, job_texts: list[str]) -> list[float]:
+    """Scores for one chunk, identical to calculate_match_score on each pair.
+
+    The per-pair TF-IDF only depends on raw term counts and on whether a term is shared,
+    so the dot product and both vector norms fall out of one count matrix:
+      dot    = J @ r
+      |j|^2  = u^2 * sum(J^2) - (u^2 - 1) * (J^2 @ [r > 0])
+      |r|^2  = u^2 * sum(r^2) - (u^2 - 1) * ([J > 0] @ r^2)
+    where u is the IDF of a term present in only one of the two documents.
+    """
+    vectorizer = _sklearn()[0](analyzer=split_tokens)
+    try:
+        counts = vectorizer.fit_transform(job_texts).tocsr()
+    except ValueError:
+        # Every job text in the chunk is empty
+        return [0.0] * len(job_texts)
+    r = np.zeros(counts.shape[1])
+    vocab = vectorizer.vocabulary_
+    for term, n in resume_counts.items():
+        idx = vocab.get(term)
+        if idx is not None:
+            r[idx] = n
+    u2 = _PAIR_UNIQUE_IDF ** 2
+    squared = counts.multiply(counts).tocsr()
+    present = counts.copy()
+    present.data[:] = 1.0
+    dot = counts @ r
+    job_norm2 = u2 * np.asarray(squared.sum(axis=1)).ravel() - (u2 - 1) * (squared @ (r > 0).astype(float))
+    resume_norm2 = u2 * sum(n * n for n in resume_counts.values()) - (u2 - 1) * (present @ (r * r))
+    denom = np.sqrt(np.clip(job_norm2, 0, None) * np.clip(resume_norm2, 0, None))
+    scores = np.divide(dot, denom, out=np.zeros_like(dot), where=denom > 0) * 100.0
+    return scores.tolist()
+
+
+def calculate_match_scores(resume_text, jobs, chunk_size=SCORE_CHUNK_SIZE, processed_resume=None):
+    """Score one resume against many jobs; yields (match_score, key) in input order.
+
+    Same scores as calling calculate_match_score per job, but the resume is preprocessed
+    once and each chunk of jobs is vectorized in one fit and scored with sparse
+    matrix-vector products. `jobs` may be a queryset (read with .iterator() in chunks;
+    pass .only()/.values_list() to limit the columns loaded), Job instances, JobRecords,
+    dicts, (key, description, requirements) tuples or (key, preprocessed text) pairs.
+    `processed_resume` (e.g. Resume.normalized_text) skips preprocessing the resume.
+    """
+    if hasattr(jobs, 'iterator'):
+        jobs = jobs.iterator(chunk_size=chunk_size)
+    jobs = iter(jobs)
+    if processed_resume is None:
+        processed_resume = preprocess_text(resume_text or '')
+    vectorized = _sklearn() is not None
+    if vectorized:
+        resume_counts = Counter(split_tokens(processed_resume))
+    else:
+        resume_set = set(processed_resume.split())
+
+    while chunk := list(islice(jobs, chunk_size)):
+        keys, texts = zip(*(processed_job_text(job) for job in chunk))
+        try:
+            if vectorized:
+                scores = _score_chunk(resume_counts, list(texts))
+            else:
+                # Fallback: Jaccard similarity on token sets
+                scores = []
+                for text in texts:
+                    job_set = set(text.split())
+                    union = len(resume_set | job_set)
+                    scores.append(len(resume_set & job_set) / union * 100.0 if resume_set and job_set else 0.0)
+        except Exception as e:
+            logger.error(f"Error calculating match scores: {str(e)}")
+            scores = [0.0] * len(keys)
+        for key, s in zip(keys, scores):
+            yield s, key
+
+class RandomProjectionLSH:
+    """Approximate nearest-neighbour index for cosine similarity over sparse term-weight
+    vectors (signed random projections).
+
+    Each of `tables` hash tables keys a vector by the signs of `bits` random projections;
+    jobs that share a bucket with the query in any table are the candidates. More bits
+    make buckets smaller (faster, lower recall); more tables or `probes` (extra buckets
+    per table, reached by flipping the query's least certain bits) raise recall.
+    Projections are derived from a hash of each term, so vectors built over different
+    vocabularies hash consistently and jobs can be added or removed one at a time.
+    """
+
+    # Per-term projections kept for queries and incremental inserts
+    _CACHE_TERMS = 20000
+
+    def __init__(self, bits: int = 8, tables: int = 16, seed: int = 0):
+        if np is None:
+            raise RuntimeError("RandomProjectionLSH requires numpy")
+        self.bits = int(bits)
+        self.tables = int(tables)
+        self.seed = int(seed)
+        self._powers = (1 << np.arange(self.bits, dtype=np.int64))
+        self._buckets: list[dict[int, set]] = [{} for _ in range(self.tables)]
+        self._codes: dict = {}
+        self._cache: dict[str, np.ndarray] = {}
+
+    def __len__(self):
+        return len(self._codes)
+
+    def __contains__(self, key):
+        return key in self._codes
+
+    def keys(self):
+        return self._codes.keys()
+
+    def _draw(self, term: str) -> 'np.ndarray':
+        rng = np.random.default_rng((zlib.crc32(term.encode('utf-8')), self.seed))
+        return rng.standard_normal(self.bits * self.tables).astype(np.float32)
+
+    def term_projection(self, term: str) -> 'np.ndarray':
+        vec = self._cache.get(term)
+        if vec is None:
+            vec = self._draw(term)
+            if len(self._cache) >= self._CACHE_TERMS:
+                self._cache.clear()
+            self._cache[term] = vec
+        return vec
+
+    def projection_matrix(self, terms) -> 'np.ndarray':
+        """(len(terms), bits * tables) projections; multiply a term-weight matrix by it."""
+        out = np.empty((len(terms), self.bits * self.tables), dtype=np.float32)
+        for i, term in enumerate(terms):
+            out[i] = self._draw(term)
+        return out
+
+    def project(self, weights: dict[str, float]) -> 'np.ndarray':
+        out = np.zeros(self.bits * self.tables, dtype=np.float32)
+        for term, w in weights.items():
+            out += w * self.term_projection(term)
+        return out
+
+    def _codes_for(self, projections: 'np.ndarray') -> 'np.ndarray':
+        """Bucket code per table for each row of projections: (n, tables) int64."""
+        signs = (projections.reshape(len(projections), self.tables, self.bits) > 0)
+        return signs @ self._powers
+
+    def add_projections(self, keys, projections: 'np.ndarray'):
+        for key, codes in zip(keys, self._codes_for(np.atleast_2d(projections)).tolist()):
+            self.remove(key)
+            self._codes[key] = codes
+            for table, code in zip(self._buckets, codes):
+                table.setdefault(code, set()).add(key)
+
+    def add(self, key, weights: dict[str, float]):
+        self.add_projections([key], self.project(weights))
+
+    def remove(self, key) -> bool:
+        codes = self._codes.pop(key, None)
+        if codes is None:
+            return False
+        for table, code in zip(self._buckets, codes):
+            bucket = table.get(code)
+            if bucket is not None:
+                bucket.discard(key)
+                if not bucket:
+                    del table[code]
+        return True
+
+    def query(self, weights: dict[str, float], probes: int = 0) -> set:
+        """Keys in the query's buckets, plus `probes` neighbouring buckets per table."""
+        projection = self.project(weights).reshape(self.tables, self.bits)
+        codes = (projection > 0) @ self._powers
+        found = set()
+        for t, (table, code) in enumerate(zip(self._buckets, codes.tolist())):
+            found.update(table.get(code, ()))
+            if probes:
+                for bit in np.argsort(np.abs(projection[t]))[:probes].tolist():
+                    found.update(table.get(code ^ (1 << bit), ()))
+        return found
+
+
 def extract_skills_from_resume(resume_text):
     """Extract skills from resume text"""
     try:
-        common_skills = [
-            'python', 'java', 'javascript', 'react', 'angular', 'vue', 'node', 'django',
-            'flask', 'spring', 'sql', 'nosql', 'mongodb', 'postgresql', 'mysql', 'oracle',
-            'aws', 'azure', 'gcp', 'docker', 'kubernetes', 'ci/cd', 'git', 'agile', 'scrum',
-            'machine learning', 'data science', 'ai', 'devops', 'frontend', 'backend',
-            'fullstack', 'mobile', 'android', 'ios', 'swift', 'kotlin', 'react native',
-            'flutter', 'ui/ux', 'html', 'css', 'sass', 'less', 'bootstrap', 'tailwind',
-            'typescript', 'c#', 'c++', 'php', 'ruby', 'rails', 'go', 'rust', 'scala'
-        ]
-        processed_text = preprocess_text(resume_text).lower()
-        found_skills = []
-        for skill in common_skills:
-            if re.search(r'\b' + re.escape(skill) + r'\b', processed_text):
-                found_skills.append(skill)
-        return found_skills
+        # One pass over the raw text: preprocessing would strip the '#', '+' and '/' in c#, c++, ci/cd
+        return extract_skills(resume_text or '')
     except Exception as e:
         logger.error(f"Error extracting skills: {str(e)}")
         return []
 
-def extract_experience_from_resume(resume_text):
-    """Extract work experience from resume text"""
+def extract_resume_sections(resume_text):
+    """{'experience': [...], 'education': [...]} from one segmentation pass over the text"""
     try:
-        experience_patterns = [
-            r'(?:work|professional)\s+experience(.*?)(?:education|skills|projects|references)',
-            r'experience(.*?)(?:education|skills|projects|references)'
-        ]
-        experience_text = ""
-        for pattern in experience_patterns:
-            match = re.search(pattern, resume_text, re.IGNORECASE | re.DOTALL)
-            if match:
-                experience_text = match.group(1).strip()
-                break
-        if not experience_text:
-            return []
-        positions = []
-        position_patterns = [
-            r'(.*?)(?:at|@)\s+(.*?)(?:\n|$)',
-            r'(.*?)\s+-\s+(.*?)(?:\n|$)'
-        ]
-        for pattern in position_patterns:
-            matches = re.findall(pattern, experience_text)
-            for match in matches:
-                if len(match) >= 2:
-                    position = match[0].strip()
-                    company = match[1].strip()
-                    positions.append({'position': position,'company': company})
-        return positions
+        sections = segment_sections(resume_text or '')
+        return {
+            'experience': parse_experience(sections.get('experience', [])),
+            'education': parse_education(sections.get('education', [])),
+        }
     except Exception as e:
-        logger.error(f"Error extracting experience: {str(e)}")
-        return []
+        logger.error(f"Error extracting resume sections: {str(e)}")
+        return {'experience': [], 'education': []}
+
+def extract_experience_from_resume(resume_text):
+    """Extract work experience from resume text"""
+    return extract_resume_sections(resume_text)['experience']
+
+def extract_education_from_resume(resume_text):
+    """Extract education entries from resume text"""
+    return extract_resume_sections(resume_text)['education']
 
-def find_matching_jobs(resume, jobs, threshold=60.0):
-    """Find matching jobs for a resume"""
+def find_matching_jobs(resume, jobs, threshold=None, limit=None, mode=None):
+    """Find matching jobs for a resume.
+    Querysets are answered from the job vector index (jobs.vector_index), through the
+    match-result cache (jobs.match_cache), and only the jobs that make the cut are loaded;
+    other iterables are scored on the index's scale. `threshold` defaults to
+    settings.JOB_MATCH_THRESHOLD.
+    With `limit`, only the best `limit` matches are kept in memory. `mode` picks the
+    index's candidate selection (see JobVectorIndex.search).
+    """
     try:
-        matching_jobs = []
-        for job in jobs:
-            match_score = calculate_match_score(
-                resume.parsed_content,
-                job.description,
-                job.requirements
-            )
-            if match_score >= threshold:
-                matching_jobs.append({'job': job,'match_score': match_score})
-        matching_jobs.sort(key=lambda x: x['match_score'], reverse=True)
-        return matching_jobs
+        from jobs.match_cache import cached_search, queryset_scope
+        from jobs.pipeline import top_k
+        from jobs.vector_index import get_index, match_threshold, score_jobs
+        if threshold is None:
+            threshold = match_threshold()
+        queryset = jobs if hasattr(jobs, 'values_list') else None
+        processed_resume = processed_resume_text(resume)
+        index = get_index()
+        if queryset is not None and index is not None:
+            best, _ = cached_search(index, resume, processed_resume, queryset_scope(queryset), k=limit,
+                                    threshold=threshold, mode=mode,
+                                    where=lambda ids: set(queryset.filter(id__in=ids).values_list('id', flat=True)))
+        else:
+            if queryset is not None:
+                jobs = processed_job_rows(queryset)
+            scored = score_jobs(resume.parsed_content, jobs, processed_resume=processed_resume)
+            if limit:
+                best = top_k(scored, limit, threshold=threshold)
+            else:
+                best = sorted(((s, key) for s, key in scored if s >= threshold), key=lambda x: x[0], reverse=True)
+        if queryset is not None:
+            by_id = queryset.in_bulk([key for _, key in best])
+            best = [(s, by_id[key]) for s, key in best if key in by_id]
+        return [{'job': job, 'match_score': s} for s, job in best]
     except Exception as e:
         logger.error(f"Error finding matching jobs: {str(e)}")
-        return []
\ No newline at end of file
+        return []
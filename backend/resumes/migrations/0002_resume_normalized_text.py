@@ -0,0 +1,35 @@
+# Generated by Django 4.2.7 on 2026-10-19 05:50
+
+from django.db import migrations, models
+
+
+def normalize_resumes(apps, schema_editor):
+    from resumes.matching import normalize_resume, refresh_normalized
+    refresh_normalized(apps.get_model('resumes', 'Resume'), normalize_resume,
+                       ['normalized_text', 'parsed_skills', 'preprocess_version'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('resumes', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='resume',
+            name='normalized_text',
+            field=models.TextField(blank=True, default=''),
+        ),
+        migrations.AddField(
+            model_name='resume',
+            name='parsed_skills',
+            field=models.JSONField(default=list),
+        ),
+        migrations.AddField(
+            model_name='resume',
+            name='preprocess_version',
+            field=models.PositiveSmallIntegerField(default=0),
+        ),
+        migrations.RunPython(normalize_resumes, migrations.RunPython.noop),
+    ]
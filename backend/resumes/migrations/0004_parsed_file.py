@@ -0,0 +1,37 @@
+# Generated by Django 4.2.7 on 2026-10-19 06:06
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('resumes', '0003_upload_pipeline'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ParsedFile',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('sha256', models.CharField(max_length=64, unique=True)),
+                ('file_format', models.CharField(max_length=10)),
+                ('size', models.PositiveBigIntegerField(default=0)),
+                ('text', models.TextField(blank=True, default='')),
+                ('error', models.CharField(blank=True, default='', max_length=200)),
+                ('parser_version', models.PositiveSmallIntegerField(default=0)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+        ),
+        migrations.AddField(
+            model_name='resume',
+            name='file_sha256',
+            field=models.CharField(blank=True, db_index=True, default='', max_length=64),
+        ),
+        migrations.AddField(
+            model_name='uploadpipeline',
+            name='auto_apply',
+            field=models.BooleanField(default=True),
+        ),
+    ]
@@ -1,5 +1,7 @@
 from django.db import models
 from django.contrib.auth.models import User
+from django.db.models.signals import pre_save
+from django.dispatch import receiver
 
 class Resume(models.Model):
     user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='resumes')
@@ -9,6 +11,13 @@ class Resume(models.Model):
     skills = models.JSONField(default=list)
     experience = models.JSONField(default=list)
     education = models.JSONField(default=list)
+    # preprocess_text(parsed_content) and the skills extracted from it, kept current on save
+    # for matching; ignored unless preprocess_version equals matching.PREPROCESS_VERSION
+    normalized_text = models.TextField(blank=True, default='')
+    parsed_skills = models.JSONField(default=list)
+    preprocess_version = models.PositiveSmallIntegerField(default=0)
+    # SHA-256 of the uploaded file; its extracted text is cached in ParsedFile
+    file_sha256 = models.CharField(max_length=64, blank=True, default='', db_index=True)
     is_active = models.BooleanField(default=True)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
@@ -16,6 +25,83 @@ class Resume(models.Model):
     def __str__(self):
         return f"{self.title} - {self.user.username}"
 
+# Columns normalize_resume() fills
+_NORMALIZED_FIELDS = frozenset(('normalized_text', 'parsed_skills', 'preprocess_version'))
+
+@receiver(pre_save, sender=Resume)
+def normalize_resume_text(sender, instance: 'Resume', update_fields=None, raw=False, **kwargs):
+    """Cache the preprocessed resume text and its skills so matching never re-tokenizes."""
+    if raw or (update_fields is not None and 'parsed_content' not in update_fields):
+        return
+    from .matching import PREPROCESS_VERSION, normalize_resume
+    source = instance.parsed_content or ''
+    if instance.preprocess_version == PREPROCESS_VERSION and getattr(instance, '_normalized_from', None) == source:
+        return
+    normalize_resume(instance)
+    if update_fields is not None and not _NORMALIZED_FIELDS <= set(update_fields):
+        # save(update_fields=...) only writes the listed columns
+        sender.objects.filter(pk=instance.pk).update(
+            normalized_text=instance.normalized_text, parsed_skills=instance.parsed_skills,
+            preprocess_version=instance.preprocess_version)
+
+class ParsedFile(models.Model):
+    """Text extracted from an uploaded resume file, shared by every upload of the same bytes.
+    Ignored unless parser_version equals parsing.PARSER_VERSION.
+    """
+    sha256 = models.CharField(max_length=64, unique=True)
+    file_format = models.CharField(max_length=10)
+    size = models.PositiveBigIntegerField(default=0)
+    text = models.TextField(blank=True, default='')
+    # Set when the file could not be parsed (corrupt, unsupported format)
+    error = models.CharField(max_length=200, blank=True, default='')
+    parser_version = models.PositiveSmallIntegerField(default=0)
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"{self.file_format} {self.sha256[:12]} ({len(self.text)} chars)"
+
+class UploadPipeline(models.Model):
+    """Background processing of one uploaded resume: parse, search portals, store, score, auto-apply."""
+    STATUS_CHOICES = (
+        ('queued', 'Queued'),
+        ('running', 'Running'),
+        ('done', 'Done'),
+        ('failed', 'Failed'),
+    )
+    STAGE_CHOICES = (
+        ('queued', 'Queued'),
+        ('parsing', 'Parsing'),
+        ('searching', 'Searching'),
+        ('storing', 'Storing'),
+        ('scoring', 'Scoring'),
+        ('applying', 'Applying'),
+        ('done', 'Done'),
+    )
+
+    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='upload_pipelines')
+    resume = models.ForeignKey(Resume, on_delete=models.CASCADE, related_name='pipelines')
+    # Request inputs the worker needs; the resume row is only written by the worker
+    content = models.TextField(blank=True, default='')
+    location = models.CharField(max_length=200, blank=True, default='')
+    # False: only parse the file (resumes created through the REST viewset)
+    auto_apply = models.BooleanField(default=True)
+    status = models.CharField(max_length=10, choices=STATUS_CHOICES, default='queued')
+    stage = models.CharField(max_length=10, choices=STAGE_CHOICES, default='queued')
+    progress = models.PositiveSmallIntegerField(default=0)
+    # {'total_found', 'applied', 'errors'}, filled in as the stages run
+    summary = models.JSONField(default=dict)
+    error = models.TextField(blank=True, default='')
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        indexes = [models.Index(fields=['status', 'created_at'])]
+
+    def __str__(self):
+        return f"Pipeline {self.id} ({self.stage}) - {self.resume.title}"
+
 class JobPreference(models.Model):
     user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='job_preferences')
     resume = models.ForeignKey(Resume, on_delete=models.CASCADE, related_name='job_preferences')
@@ -0,0 +1,263 @@
+"""Text extraction from uploaded resume files (PDF, DOCX, TXT).
+
+Files are identified by the SHA-256 of their bytes, hashed in 64 KiB chunks, and the
+extracted text is cached in ParsedFile: re-uploading the same file skips parsing
+entirely. Cache misses are parsed in a bounded process pool (RESUME_PARSING['PROCESSES'],
+0 = in the calling thread) so PDF decoding never holds the web process's GIL. Workers
+get a file path, not the bytes, and read from disk as they go: TXT and DOCX are decoded
+incrementally (document.xml is walked with iterparse) and PDFs page by page. Output is
+capped at MAX_PAGES pages / MAX_CHARS characters.
+
+PDF support needs the optional `pypdf` package, imported on first use.
+"""
+import atexit
+import hashlib
+import io
+import logging
+import os
+import shutil
+import tempfile
+import threading
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from concurrent.futures.process import BrokenProcessPool
+from importlib.util import find_spec
+from xml.etree.ElementTree import iterparse
+
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+# Bump when extraction changes; cached texts from other versions are re-parsed
+PARSER_VERSION = 1
+
+PYPDF_AVAILABLE = find_spec('pypdf') is not None
+
+_W = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}'
+_READ_CHUNK = 64 * 1024
+
+
+class UnsupportedFile(ValueError):
+    """The file is not a PDF, DOCX or text file, or is too damaged to read."""
+
+
+def _parsing_setting(name: str, default):
+    return (getattr(settings, 'RESUME_PARSING', None) or {}).get(name, default)
+
+
+# ---- extraction (runs in pool workers) ----
+
+def detect_format(path: str) -> str:
+    with open(path, 'rb') as f:
+        head = f.read(1024)
+    if b'%PDF-' in head:
+        return 'pdf'
+    if head.startswith(b'PK\x03\x04'):
+        try:
+            with zipfile.ZipFile(path) as z:
+                if 'word/document.xml' in z.namelist():
+                    return 'docx'
+        except zipfile.BadZipFile:
+            pass
+        raise UnsupportedFile('zip archive that is not a DOCX document')
+    if head.startswith(b'\xd0\xcf\x11\xe0'):
+        raise UnsupportedFile('legacy .doc files are not supported; upload PDF or DOCX')
+    if b'\x00' in head and not head.startswith((b'\xff\xfe', b'\xfe\xff')):
+        raise UnsupportedFile('binary file')
+    return 'txt'
+
+
+def _extract_txt(path: str, max_chars: int, max_pages: int) -> str:
+    with open(path, 'rb') as raw:
+        head = raw.read(2)
+        raw.seek(0)
+        encoding = 'utf-16' if head in (b'\xff\xfe', b'\xfe\xff') else 'utf-8-sig'
+        with io.TextIOWrapper(raw, encoding=encoding, errors='replace') as f:
+            return f.read(max_chars)
+
+
+def _extract_docx(path: str, max_chars: int, max_pages: int) -> str:
+    parts, size, paragraph = [], 0, []
+    with zipfile.ZipFile(path) as z, z.open('word/document.xml') as xml:
+        for _, elem in iterparse(xml, events=('end',)):
+            tag = elem.tag
+            if tag == _W + 't':
+                paragraph.append(elem.text or '')
+            elif tag == _W + 'tab':
+                paragraph.append('\t')
+            elif tag in (_W + 'br', _W + 'cr'):
+                paragraph.append('\n')
+            elif tag == _W + 'p':
+                line = ''.join(paragraph)
+                paragraph = []
+                parts.append(line)
+                size += len(line) + 1
+                # Paragraphs are done with; keep memory flat on long documents
+                elem.clear()
+                if size >= max_chars:
+                    break
+    return '\n'.join(parts)[:max_chars]
+
+
+def _extract_pdf(path: str, max_chars: int, max_pages: int) -> str:
+    if not PYPDF_AVAILABLE:
+        raise UnsupportedFile('PDF parsing needs the pypdf package')
+    from pypdf import PdfReader
+    parts, size = [], 0
+    try:
+        with open(path, 'rb') as f:
+            reader = PdfReader(f)
+            for page in reader.pages[:max_pages]:
+                text = page.extract_text() or ''
+                parts.append(text)
+                size += len(text) + 1
+                if size >= max_chars:
+                    break
+    except Exception as e:
+        # pypdf raises a variety of errors on damaged files
+        raise UnsupportedFile(f'unreadable PDF: {e}') from e
+    return '\n'.join(parts)[:max_chars]
+
+
+_EXTRACTORS = {'pdf': _extract_pdf, 'docx': _extract_docx, 'txt': _extract_txt}
+
+
+def extract_text(path: str, max_chars: int, max_pages: int) -> tuple[str, str]:
+    """(format, text) of the file at `path`. Raises UnsupportedFile."""
+    file_format = detect_format(path)
+    try:
+        return file_format, _EXTRACTORS[file_format](path, max_chars, max_pages)
+    except UnsupportedFile:
+        raise
+    except (zipfile.BadZipFile, KeyError, SyntaxError) as e:
+        # Broken zip containers and malformed XML (ParseError is a SyntaxError)
+        raise UnsupportedFile(f'unreadable {file_format.upper()}: {e}') from e
+
+
+# ---- pool ----
+
+_POOL: ProcessPoolExecutor | None = None
+_POOL_LOCK = threading.Lock()
+
+
+def get_parse_pool() -> ProcessPoolExecutor | None:
+    """Return the shared resume parse pool, or None when files are parsed inline."""
+    global _POOL
+    workers = int(_parsing_setting('PROCESSES', 0) or 0)
+    if workers <= 0:
+        return None
+    with _POOL_LOCK:
+        if _POOL is None:
+            from jobs.parsing import _init_worker
+            _POOL = ProcessPoolExecutor(max_workers=workers, initializer=_init_worker)
+        return _POOL
+
+
+def shutdown_parse_pool(pool: ProcessPoolExecutor | None = None, terminate: bool = False):
+    """Shut the parse pool down; the next get_parse_pool() builds a fresh one. With `pool`,
+    only while it is still the shared pool. `terminate` also kills its workers, which
+    shutdown() alone leaves running the files they hold.
+    """
+    global _POOL
+    with _POOL_LOCK:
+        if _POOL is None or (pool is not None and _POOL is not pool):
+            return
+        workers = list((_POOL._processes or {}).values()) if terminate else []
+        _POOL.shutdown(wait=False, cancel_futures=True)
+        _POOL = None
+    for process in workers:
+        process.terminate()
+
+
+atexit.register(shutdown_parse_pool)
+
+
+def _run_extract(path: str) -> tuple[str, str]:
+    max_chars = int(_parsing_setting('MAX_CHARS', 200000))
+    max_pages = int(_parsing_setting('MAX_PAGES', 30))
+    # A pool also breaks when another file's timeout retired it; the file is retried on a fresh one
+    for _ in range(2):
+        pool = get_parse_pool()
+        if pool is None:
+            return extract_text(path, max_chars, max_pages)
+        try:
+            return pool.submit(extract_text, path, max_chars, max_pages).result(
+                timeout=int(_parsing_setting('TIMEOUT', 60)))
+        except FutureTimeoutError:
+            # The worker keeps parsing past the timeout; retired with its pool so it frees the slot
+            shutdown_parse_pool(pool, terminate=True)
+            raise
+        except BrokenProcessPool:
+            shutdown_parse_pool(pool)
+    logger.error("Resume parse pool broke; parsing in-process")
+    return extract_text(path, max_chars, max_pages)
+
+
+# ---- cache ----
+
+def file_sha256(field_file) -> tuple[str, int]:
+    """(hex digest, size) of a stored file, read in chunks."""
+    digest, size = hashlib.sha256(), 0
+    field_file.open('rb')
+    try:
+        for chunk in field_file.chunks(_READ_CHUNK):
+            digest.update(chunk)
+            size += len(chunk)
+    finally:
+        field_file.close()
+    return digest.hexdigest(), size
+
+
+def _local_path(field_file):
+    """(path, temporary) for a stored file; storages without local paths are copied out."""
+    try:
+        return field_file.path, False
+    except (NotImplementedError, AttributeError):
+        pass
+    suffix = os.path.splitext(field_file.name)[1]
+    with tempfile.NamedTemporaryFile(suffix=suffix, delete=False) as tmp:
+        field_file.open('rb')
+        try:
+            shutil.copyfileobj(field_file, tmp, _READ_CHUNK)
+        finally:
+            field_file.close()
+    return tmp.name, True
+
+
+def parse_resume_file(resume) -> str:
+    """Text of the resume's uploaded file ('' when it cannot be parsed). Sets
+    resume.file_sha256; the text comes from the ParsedFile cache when these bytes were
+    parsed before.
+    """
+    from .models import ParsedFile
+
+    if not resume.file:
+        return ''
+    sha256, size = file_sha256(resume.file)
+    resume.file_sha256 = sha256
+    cached = ParsedFile.objects.filter(sha256=sha256, parser_version=PARSER_VERSION).first()
+    if cached is not None:
+        return cached.text
+
+    path, temporary = _local_path(resume.file)
+    try:
+        file_format, text, error = '', '', ''
+        try:
+            file_format, text = _run_extract(path)
+        except UnsupportedFile as e:
+            error = str(e)
+        except FutureTimeoutError:
+            # Not cached: a busy pool may parse it next time
+            logger.error(f"Parsing resume {resume.pk} timed out")
+            return ''
+    finally:
+        if temporary:
+            os.unlink(path)
+    if error:
+        logger.warning(f"Cannot parse resume {resume.pk} file: {error}")
+    ParsedFile.objects.update_or_create(sha256=sha256, defaults={
+        'file_format': file_format or 'unknown', 'size': size, 'text': text, 'error': error[:200],
+        'parser_version': PARSER_VERSION,
+    })
+    return text
@@ -0,0 +1,187 @@
+"""Background processing of resume uploads.
+
+The upload request only stores the resume and an UploadPipeline row, then queues the
+pipeline id; a fixed number of worker threads run the stages (parsing, searching,
+storing, scoring, applying). Every stage change is saved on the row, which backs the
+polling endpoint, and pushed as a 'pipeline_progress' event to the user's
+`notifications_<user_id>` channel group that NotificationConsumer already joins.
+
+The queue lives in the web process: pipelines still 'queued' (or stuck 'running')
+after a restart are picked up by `python manage.py run_upload_pipelines`.
+"""
+import logging
+import queue
+import threading
+
+from asgiref.sync import async_to_sync
+from channels.layers import get_channel_layer
+from django.conf import settings
+from django.db import close_old_connections
+from django.utils import timezone
+
+from .models import UploadPipeline
+
+logger = logging.getLogger(__name__)
+
+# Progress reported when each stage starts
+STAGE_PROGRESS = {
+    'queued': 0,
+    'parsing': 5,
+    'searching': 15,
+    'storing': 50,
+    'scoring': 70,
+    'applying': 85,
+    'done': 100,
+}
+
+DEFAULT_KEYWORDS = 'software engineer developer sde'
+DEFAULT_LOCATION = 'India'
+
+
+def pipeline_payload(pipeline: UploadPipeline) -> dict:
+    return {
+        'id': pipeline.id,
+        'resume': pipeline.resume_id,
+        'status': pipeline.status,
+        'stage': pipeline.stage,
+        'progress': pipeline.progress,
+        'summary': pipeline.summary,
+        'error': pipeline.error,
+        'updated_at': pipeline.updated_at.isoformat() if pipeline.updated_at else None,
+    }
+
+
+def _publish(pipeline: UploadPipeline):
+    try:
+        channel_layer = get_channel_layer()
+        if not channel_layer:
+            return
+        async_to_sync(channel_layer.group_send)(
+            f"notifications_{pipeline.user_id}",
+            {'type': 'pipeline_progress', 'pipeline': pipeline_payload(pipeline)},
+        )
+    except Exception:
+        # Progress is still available from the polling endpoint
+        pass
+
+
+def _advance(pipeline: UploadPipeline, stage: str, **fields):
+    pipeline.stage = stage
+    pipeline.progress = STAGE_PROGRESS[stage]
+    for name, value in fields.items():
+        setattr(pipeline, name, value)
+    pipeline.save(update_fields=['stage', 'progress', 'updated_at', *fields])
+    _publish(pipeline)
+
+
+def _process(pipeline: UploadPipeline):
+    from jobs.auto_apply import apply_to_jobs, score_candidates, upsert_jobs
+    from jobs.reverse_matching import enqueue_new_jobs
+    from jobs.scraper import search_jobs_across_portals
+
+    from .matching import extract_resume_sections, normalize_resume
+    from .parsing import parse_resume_file
+
+    resume, user = pipeline.resume, pipeline.user
+    summary = {'total_found': 0, 'applied': 0, 'errors': 0}
+
+    _advance(pipeline, 'parsing', summary=summary)
+    # The uploaded file is the source; client-supplied content only when it has no text
+    resume.parsed_content = parse_resume_file(resume) or pipeline.content
+    # Normalized text and skills are computed once here and cached on the row
+    normalize_resume(resume)
+    details = extract_resume_sections(resume.parsed_content)
+    resume.skills = list(resume.parsed_skills)
+    resume.experience = details['experience']
+    resume.education = details['education']
+    resume.save()
+    if not pipeline.auto_apply:
+        _advance(pipeline, 'done', status='done', finished_at=timezone.now())
+        return
+
+    _advance(pipeline, 'searching')
+    search_results = search_jobs_across_portals(
+        keywords=' '.join(resume.skills) or DEFAULT_KEYWORDS,
+        location=pipeline.location or DEFAULT_LOCATION,
+        country='India',
+        max_per_portal=5,
+    )
+    summary['total_found'] = len(search_results)
+
+    _advance(pipeline, 'storing', summary=summary)
+    stored, summary['errors'] = upsert_jobs(search_results)
+
+    _advance(pipeline, 'scoring', summary=summary)
+    matches = score_candidates(resume, stored)
+
+    _advance(pipeline, 'applying')
+    summary['applied'] = len(apply_to_jobs(user, resume, matches))
+    # Other users' resumes may match what this search stored
+    enqueue_new_jobs(job.pk for job in stored)
+
+    _advance(pipeline, 'done', status='done', summary=summary, finished_at=timezone.now())
+
+
+def run_pipeline(pipeline_id: int) -> bool:
+    """Run a queued pipeline to completion in the calling thread. Returns False when it was
+    not queued (already claimed by another worker or finished).
+    """
+    # Claiming with a conditional update keeps two workers from running the same pipeline
+    if not UploadPipeline.objects.filter(id=pipeline_id, status='queued').update(status='running'):
+        return False
+    pipeline = UploadPipeline.objects.select_related('resume', 'user').get(id=pipeline_id)
+    try:
+        _process(pipeline)
+    except Exception as e:
+        logger.error(f"Upload pipeline {pipeline_id} failed at {pipeline.stage}: {e}")
+        pipeline.status = 'failed'
+        pipeline.error = str(e)
+        pipeline.finished_at = timezone.now()
+        pipeline.save(update_fields=['status', 'error', 'finished_at', 'updated_at'])
+        _publish(pipeline)
+    return True
+
+
+class PipelineQueue:
+    """Upload pipelines waiting for one of a fixed number of worker threads."""
+
+    def __init__(self, workers: int):
+        self.workers = max(1, int(workers))
+        self._queue: queue.Queue = queue.Queue()
+        self._lock = threading.Lock()
+        self._threads: list[threading.Thread] = []
+
+    def _ensure_started(self):
+        with self._lock:
+            if self._threads:
+                return
+            for i in range(self.workers):
+                t = threading.Thread(target=self._run, name=f'upload-pipeline-{i}', daemon=True)
+                t.start()
+                self._threads.append(t)
+
+    def put(self, pipeline_id: int):
+        self._queue.put(pipeline_id)
+        self._ensure_started()
+
+    def _run(self):
+        while True:
+            pipeline_id = self._queue.get()
+            try:
+                close_old_connections()
+                run_pipeline(pipeline_id)
+            except Exception as e:
+                logger.error(f"Upload pipeline worker error: {e}")
+            finally:
+                close_old_connections()
+                self._queue.task_done()
+
+    def join(self):
+        self._queue.join()
+
+
+_QUEUE = PipelineQueue(getattr(settings, 'RESUME_PIPELINE_WORKERS', 2))
+
+
+def enqueue_pipeline(pipeline_id: int):
+    _QUEUE.put(pipeline_id)
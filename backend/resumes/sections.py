@@ -0,0 +1,178 @@
+"""Single-pass resume segmentation into sections, plus experience/education line parsing.
+
+The text is walked line by line once: a short line whose normalized form is a known
+heading ("Work Experience", "EDUCATION:", "Academic Background") starts a section, every
+other line is appended to the current one. Section lines are then parsed one at a time
+with str methods and regexes that only use bounded quantifiers, so the work per line is
+proportional to its length and the whole parse is linear in the document size; there is
+no `(.*?)` scan that can restart at every position of a pasted wall of text.
+"""
+import re
+
+# Normalized heading text -> canonical section name
+HEADINGS = {
+    'experience': 'experience',
+    'work experience': 'experience',
+    'professional experience': 'experience',
+    'employment': 'experience',
+    'employment history': 'experience',
+    'work history': 'experience',
+    'career history': 'experience',
+    'relevant experience': 'experience',
+    'internships': 'experience',
+    'internship experience': 'experience',
+    'education': 'education',
+    'education and training': 'education',
+    'academic background': 'education',
+    'academic qualifications': 'education',
+    'educational qualifications': 'education',
+    'qualifications': 'education',
+    'academics': 'education',
+    'skills': 'skills',
+    'technical skills': 'skills',
+    'core competencies': 'skills',
+    'key skills': 'skills',
+    'projects': 'projects',
+    'personal projects': 'projects',
+    'academic projects': 'projects',
+    'summary': 'summary',
+    'professional summary': 'summary',
+    'profile': 'summary',
+    'objective': 'summary',
+    'career objective': 'summary',
+    'about me': 'summary',
+    'certifications': 'certifications',
+    'certificates': 'certifications',
+    'licenses and certifications': 'certifications',
+    'achievements': 'achievements',
+    'awards': 'achievements',
+    'honors and awards': 'achievements',
+    'publications': 'publications',
+    'languages': 'languages',
+    'interests': 'interests',
+    'hobbies': 'interests',
+    'references': 'references',
+    'contact': 'contact',
+    'contact information': 'contact',
+}
+
+# Headings are short; longer lines are never looked up
+MAX_HEADING_LENGTH = 48
+# "Role at Company" lines are short; longer experience lines are descriptions
+MAX_ROLE_LINE_LENGTH = 150
+
+_BULLETS = '-*•·▪►◦‣–—> \t'
+_NON_LETTERS = re.compile(r'[^a-z]+')
+
+# Separators between a role and its employer, as whole tokens
+_AT_TOKENS = frozenset(('at', '@'))
+_DASH_TOKENS = frozenset(('-', '–', '—', '|', ','))
+
+_YEAR = re.compile(r'(?<!\d)(?:19|20)\d{2}(?!\d)')
+_DEGREE = re.compile(
+    r'(?<![a-z])(?:b\.? ?tech|m\.? ?tech|b\.? ?e|m\.? ?e|b\.? ?sc?|m\.? ?sc?|b\.? ?a|m\.? ?a|b\.? ?com|m\.? ?com'
+    r'|bca|mca|mba|ph\.? ?d|bachelor|master|doctor|diploma|associate|high school|secondary|hsc|ssc'
+    r'|class (?:x|xii|10|12)(?:th)?)(?![a-z])',
+    re.IGNORECASE,
+)
+_INSTITUTION_WORDS = frozenset((
+    'university', 'college', 'institute', 'institution', 'school', 'academy', 'polytechnic', 'iit', 'nit',
+    'iiit', 'bits', 'vidyalaya', 'universität', 'université', 'universidad',
+))
+_FIELD_SEPARATORS = re.compile(r'[,|;]| [-–—] | (?:at|from) (?=[A-Z])')
+
+
+def _heading(line: str) -> tuple[str | None, str]:
+    """(section, trailing text) when `line` is a heading, else (None, line).
+    "Experience: 5 years at Acme" is the experience heading followed by a first line.
+    """
+    head, sep, rest = line.partition(':')
+    if sep and len(head) <= MAX_HEADING_LENGTH:
+        section = HEADINGS.get(_NON_LETTERS.sub(' ', head.lower()).strip())
+        if section:
+            return section, rest.strip()
+    if len(line) <= MAX_HEADING_LENGTH:
+        section = HEADINGS.get(_NON_LETTERS.sub(' ', line.lower()).strip())
+        if section:
+            return section, ''
+    return None, line
+
+
+def segment_sections(text: str) -> dict[str, list[str]]:
+    """Canonical section name -> its non-empty lines (bullets stripped), in one pass.
+    Lines before the first heading go to 'header'; a repeated heading appends.
+    """
+    sections: dict[str, list[str]] = {}
+    current = sections.setdefault('header', [])
+    for raw in (text or '').splitlines():
+        line = raw.strip().lstrip(_BULLETS).strip()
+        if not line:
+            continue
+        section, line = _heading(line)
+        if section:
+            current = sections.setdefault(section, [])
+        if line:
+            current.append(line)
+    return sections
+
+
+def parse_experience_line(line: str) -> dict | None:
+    """{'position', 'company'} for "Role at Company" / "Role @ Company" / "Role - Company" /
+    "Role, Company" lines (dates stay with the company text), else None.
+    """
+    if len(line) > MAX_ROLE_LINE_LENGTH:
+        return None
+    tokens = line.split()
+    for separators in (_AT_TOKENS, _DASH_TOKENS):
+        for i in range(len(tokens) - 1):
+            token = tokens[i].lower()
+            if i and token in separators:
+                return {'position': ' '.join(tokens[:i]), 'company': ' '.join(tokens[i + 1:])}
+            if separators is _DASH_TOKENS and token[-1:] in (',', '|') and token not in _DASH_TOKENS:
+                # Separator glued to the role: "Engineer, Acme Corp"
+                return {'position': ' '.join(tokens[:i] + [tokens[i][:-1]]), 'company': ' '.join(tokens[i + 1:])}
+    return None
+
+
+def parse_experience(lines: list[str]) -> list[dict]:
+    return [entry for entry in map(parse_experience_line, lines) if entry]
+
+
+def _education_fields(line: str) -> dict:
+    fields = {}
+    years = _YEAR.findall(line)
+    if years:
+        fields['year'] = years[-1]
+    for part in _FIELD_SEPARATORS.split(line):
+        part = _YEAR.sub('', part).strip(' ()-–—')
+        if not part:
+            continue
+        words = {w.strip('.,()').lower() for w in part.split()}
+        if 'institution' not in fields and words & _INSTITUTION_WORDS:
+            fields['institution'] = part
+        elif 'degree' not in fields and _DEGREE.search(part):
+            fields['degree'] = part
+    return fields
+
+
+def parse_education(lines: list[str]) -> list[dict]:
+    """[{'degree', 'institution', 'year'}] from education lines. A degree or institution
+    on the next line completes the current entry ("B.Tech, CS" / "IIT Delhi, 2019").
+    """
+    entries, current = [], {}
+    for line in lines:
+        fields = _education_fields(line)
+        if not fields:
+            continue
+        if any(key in current for key in fields if key != 'year') or (
+                'year' in fields and 'year' in current and len(fields) == 1):
+            entries.append(current)
+            current = {}
+        for key, value in fields.items():
+            current.setdefault(key, value)
+    if current:
+        entries.append(current)
+    return [
+        {'degree': e.get('degree', ''), 'institution': e.get('institution', ''), 'year': e.get('year', '')}
+        for e in entries if 'degree' in e or 'institution' in e
+    ]
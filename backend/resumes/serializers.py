@@ -1,5 +1,5 @@
 from rest_framework import serializers
-from .models import Resume, JobPreference
+from .models import Resume, JobPreference, UploadPipeline
 
 class ResumeSerializer(serializers.ModelSerializer):
     class Meta:
@@ -11,4 +11,10 @@ class JobPreferenceSerializer(serializers.ModelSerializer):
     class Meta:
         model = JobPreference
         fields = ['id', 'user', 'resume', 'job_titles', 'skills', 'locations', 'min_salary', 'remote_only', 'created_at', 'updated_at']
-        read_only_fields = ['id', 'user', 'created_at', 'updated_at']
\ No newline at end of file
+        read_only_fields = ['id', 'user', 'created_at', 'updated_at']
+
+class UploadPipelineSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = UploadPipeline
+        fields = ['id', 'resume', 'status', 'stage', 'progress', 'summary', 'error', 'created_at', 'updated_at', 'finished_at']
+        read_only_fields = fields
@@ -1,6 +1,6 @@
 import React, { useState, useEffect } from 'react';
 import { Toast, ToastContainer, Badge } from 'react-bootstrap';
-import { getNotifications, markNotificationAsRead } from '../services/api';
+import { getNotifications, markNotificationAsRead, pageResults } from '../services/api';
 import { useNavigate } from 'react-router-dom';
 
 const Notifications = () => {
@@ -20,11 +20,12 @@ const Notifications = () => {
   const fetchNotifications = async () => {
     try {
       const response = await getNotifications();
-      setNotifications(response.data);
+      const latest = pageResults(response);
+      setNotifications(latest);
       
       // Initialize toast visibility state
       const initialShowState = {};
-      response.data.forEach(notification => {
+      latest.forEach(notification => {
         initialShowState[notification.id] = !notification.read;
       });
       setShowToasts(initialShowState);
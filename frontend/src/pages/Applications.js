@@ -1,11 +1,13 @@
 import React, { useState, useEffect } from 'react';
 import { Container, Row, Col, Card, Badge, Button, Form, Spinner } from 'react-bootstrap';
 import { useLocation } from 'react-router-dom';
-import { getApplications, updateApplicationStatus } from '../services/api';
+import { getApplications, getPage, pageResults, updateApplicationStatus } from '../services/api';
 
 const Applications = () => {
   const location = useLocation();
   const [applications, setApplications] = useState([]);
+  const [nextPage, setNextPage] = useState(null);
+  const [loadingMore, setLoadingMore] = useState(false);
   const [loading, setLoading] = useState(true);
   const [error, setError] = useState('');
   const [message, setMessage] = useState(location.state?.message || '');
@@ -18,7 +20,8 @@ const Applications = () => {
     try {
       setLoading(true);
       const response = await getApplications();
-      setApplications(response.data);
+      setApplications(pageResults(response));
+      setNextPage(response.data.next || null);
     } catch (err) {
       setError('Failed to load applications. Please try again later.');
       console.error(err);
@@ -27,6 +30,20 @@ const Applications = () => {
     }
   };
 
+  const loadMore = async () => {
+    try {
+      setLoadingMore(true);
+      const response = await getPage(nextPage);
+      setApplications(prev => [...prev, ...pageResults(response)]);
+      setNextPage(response.data.next || null);
+    } catch (err) {
+      setError('Failed to load more applications. Please try again later.');
+      console.error(err);
+    } finally {
+      setLoadingMore(false);
+    }
+  };
+
   const handleStatusChange = async (applicationId, newStatus) => {
     try {
       await updateApplicationStatus(applicationId, newStatus);
@@ -155,6 +172,14 @@ const Applications = () => {
           ))}
         </Row>
       )}
+
+      {nextPage && (
+        <div className="text-center">
+          <Button variant="outline-secondary" onClick={loadMore} disabled={loadingMore}>
+            {loadingMore ? <Spinner animation="border" size="sm" /> : 'Load more'}
+          </Button>
+        </div>
+      )}
     </Container>
   );
 };
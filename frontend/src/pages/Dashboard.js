@@ -1,12 +1,13 @@
 import React, { useState, useEffect } from 'react';
 import { Container, Row, Col, Card, Button, Alert } from 'react-bootstrap';
 import { Link } from 'react-router-dom';
-import { getResumes, findMatchingJobs, getApplications } from '../services/api';
+import { getResumes, findMatchingJobs, getApplications, pageResults } from '../services/api';
 
 const Dashboard = () => {
   const [resumes, setResumes] = useState([]);
   const [matchingJobs, setMatchingJobs] = useState([]);
   const [applications, setApplications] = useState([]);
+  const [moreApplications, setMoreApplications] = useState(false);
   const [loading, setLoading] = useState(true);
   const [error, setError] = useState('');
   const user = JSON.parse(localStorage.getItem('user') || '{}');
@@ -29,7 +30,8 @@ const Dashboard = () => {
         
         // Fetch applications
         const applicationsResponse = await getApplications();
-        setApplications(applicationsResponse.data);
+        setApplications(pageResults(applicationsResponse));
+        setMoreApplications(Boolean(applicationsResponse.data.next));
         
       } catch (err) {
         setError('Failed to load dashboard data. Please try again later.');
@@ -127,7 +129,7 @@ const Dashboard = () => {
                 </Alert>
               ) : (
                 <>
-                  <p>You've applied to {applications.length} job(s).</p>
+                  <p>You've applied to {applications.length}{moreApplications ? '+' : ''} job(s).</p>
                   <Link to="/applications">
                     <Button variant="outline-primary">View Applications</Button>
                   </Link>
@@ -9,7 +9,7 @@ const JobSearch = () => {
   const [resumes, setResumes] = useState([]);
   const [useProfile, setUseProfile] = useState(true);
   const [selectedResume, setSelectedResume] = useState('');
-  const [minMatch, setMinMatch] = useState(0.6); // 60%
+  const [minMatch, setMinMatch] = useState(0.4); // 40%
   const [sortBy, setSortBy] = useState('match'); // match | newest | salary
   const [page, setPage] = useState(1);
   const [pageSize, setPageSize] = useState(12);
@@ -1,7 +1,9 @@
 import React, { useState, useEffect } from 'react';
 import { Container, Row, Col, Card, Button, Form, Alert, Spinner, Badge } from 'react-bootstrap';
 import { Link } from 'react-router-dom';
-import { getResumes, uploadResume, findMatchingJobs } from '../services/api';
+import { getResumes, uploadResume, getUploadPipeline, findMatchingJobs } from '../services/api';
+
+const PIPELINE_POLL_MS = 2000;
 
 const ResumeManager = () => {
   const [resumes, setResumes] = useState([]);
@@ -63,14 +65,19 @@ const ResumeManager = () => {
       formData.append('file', selectedFile);
       formData.append('title', resumeTitle);
       
-      await uploadResume(formData);
+      const response = await uploadResume(formData);
       
-      setSuccess('Resume uploaded successfully!');
+      setSuccess('Resume uploaded successfully! Processing...');
       setSelectedFile(null);
       setResumeTitle('');
       
       // Refresh resume list
       fetchResumes();
+
+      // Parsing and auto-apply run in the background; follow the pipeline until it finishes
+      if (response.data?.pipeline) {
+        pollPipeline(response.data.pipeline.id);
+      }
       
     } catch (err) {
       setError(
@@ -83,6 +90,25 @@ const ResumeManager = () => {
     }
   };
 
+  const pollPipeline = async (pipelineId) => {
+    try {
+      const { data: pipeline } = await getUploadPipeline(pipelineId);
+      if (pipeline.status === 'done') {
+        const { total_found = 0, applied = 0 } = pipeline.summary || {};
+        setSuccess(`Resume processed: ${total_found} jobs found, auto-applied to ${applied}.`);
+        fetchResumes();
+      } else if (pipeline.status === 'failed') {
+        setSuccess('');
+        setError('Resume uploaded, but processing failed. Please try again later.');
+      } else {
+        setSuccess(`Resume uploaded successfully! Processing (${pipeline.stage}, ${pipeline.progress}%)...`);
+        setTimeout(() => pollPipeline(pipelineId), PIPELINE_POLL_MS);
+      }
+    } catch (err) {
+      console.error('Error fetching upload progress:', err);
+    }
+  };
+
   const handleViewMatches = async (resume) => {
     try {
       setSelectedResume(resume);
@@ -137,12 +163,12 @@ const ResumeManager = () => {
                   <Form.Label>Resume File (PDF)</Form.Label>
                   <Form.Control
                     type="file"
-                    accept=".pdf,.doc,.docx"
+                    accept=".pdf,.docx,.txt"
                     onChange={handleFileChange}
                     required
                   />
                   <Form.Text className="text-muted">
-                    Supported formats: PDF, DOC, DOCX
+                    Supported formats: PDF, DOCX, TXT
                   </Form.Text>
                 </Form.Group>
                 
@@ -54,7 +54,7 @@ export const getJobById = (id) => {
 };
 
 // Resume matching via backend jobs endpoint
-export const findMatchingJobs = (resumeId, threshold = 0.6) => {
+export const findMatchingJobs = (resumeId, threshold = 0.4) => {
   return api.get(`/jobs/matching/${resumeId}/`, {
     params: { threshold }
   });
@@ -77,13 +77,26 @@ export const uploadResume = (formData) => {
   });
 };
 
+export const getUploadPipeline = (pipelineId) => {
+  return api.get(`/resumes/pipelines/${pipelineId}/`);
+};
+
 export const parseResume = (resumeId) => {
   return api.post(`${API_CONFIG.ENDPOINTS.RESUME_PARSE}${resumeId}/`);
 };
 
+// List endpoints return {next, previous, results}; next/previous are full URLs
+export const getPage = (url) => {
+  return api.get(url);
+};
+
+export const pageResults = (response) => {
+  return Array.isArray(response.data) ? response.data : response.data.results;
+};
+
 // Application services
-export const getApplications = () => {
-  return api.get('/resumes/applications/');
+export const getApplications = (params) => {
+  return api.get('/resumes/applications/', { params });
 };
 
 export const applyToJob = (jobId, resumeId, coverLetter = '') => {